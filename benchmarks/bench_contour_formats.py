@@ -0,0 +1,81 @@
+"""
+Benchmark: memory and serialization cost of the analyze_contours() output formats.
+
+Analyzes a binary 4K image with thousands of small shapes and compares the
+output formats: analysis time, the time of a consumer that only reads the
+bounding boxes (where the lazy ContourRecords skip the polygon
+approximation), pickled size, and pickle + unpickle time (the cost of
+sending results between processes).
+
+Run from the repository root:
+    python -m benchmarks.bench_contour_formats
+"""
+
+import pickle
+import time
+
+import cv2
+import numpy as np
+
+from package.contour_analysis import OUTPUT_FORMATS, ContourTable, analyze_contours
+
+REPEATS: int = 15
+
+
+def shapes_mask(
+    num_shapes: int = 5000, shape=(2160, 3840), seed: int = 0
+) -> np.ndarray:
+    """Returns a binary mask with many small filled circles and rectangles."""
+    rng = np.random.default_rng(seed)
+    mask = np.zeros(shape, dtype=np.uint8)
+    for _ in range(num_shapes):
+        x, y = int(rng.integers(0, shape[1])), int(rng.integers(0, shape[0]))
+        size = int(rng.integers(6, 20))
+        if rng.random() < 0.5:
+            cv2.circle(mask, (x, y), size, 255, -1)
+        else:
+            cv2.rectangle(mask, (x, y), (x + size, y + 2 * size), 255, -1)
+    return mask
+
+
+def best_time(function) -> float:
+    """Returns the best wall-clock time (ms) of REPEATS calls."""
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return 1000 * min(timings)
+
+
+def bounding_boxes(result) -> list:
+    """A bbox-only consumer of any output format."""
+    if isinstance(result, ContourTable):
+        return result.bboxes.tolist()
+    return [record["bbox"] for record in result]
+
+
+def main():
+    mask = shapes_mask()
+    print(
+        f"{'format':>9} {'contours':>9} {'analyze ms':>11} {'bbox-only ms':>13} "
+        f"{'pickle KiB':>11} {'round trip ms':>14}"
+    )
+    for output_format in OUTPUT_FORMATS:
+        result = analyze_contours(mask, output_format=output_format)
+        analyze = best_time(lambda: analyze_contours(mask, output_format=output_format))
+        bbox_only = best_time(
+            lambda: bounding_boxes(analyze_contours(mask, output_format=output_format))
+        )
+        size = len(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        round_trip = best_time(
+            lambda: pickle.loads(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        )
+        print(
+            f"{output_format:>9} {len(result):>9} {analyze:>11.1f} {bbox_only:>13.1f} "
+            f"{size / 1024:>11.1f} {round_trip:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
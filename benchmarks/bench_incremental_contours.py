@@ -0,0 +1,71 @@
+"""
+Benchmark: incremental vs. full contour analysis on a mostly static scene.
+
+Simulates a 1080p binary video of an industrial scene: hundreds of static
+parts, plus a few objects moving across the frame. Times analyze_contours()
+on every frame against IncrementalContourAnalyzer and checks that both return
+the same contours.
+
+Run from the repository root:
+    python -m benchmarks.bench_incremental_contours
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+from package.contour_analysis import analyze_contours
+from package.incremental_contours import IncrementalContourAnalyzer
+
+MOVING_OBJECTS = (1, 4, 16)
+NUM_FRAMES: int = 50
+
+
+def scene_frames(num_moving: int, shape=(1080, 1920), seed: int = 0):
+    """Yields binary frames of static parts with num_moving moving discs."""
+    rng = np.random.default_rng(seed)
+    static = np.zeros(shape, dtype=np.uint8)
+    for _ in range(600):
+        x, y = int(rng.integers(0, shape[1])), int(rng.integers(0, shape[0]))
+        w, h = (int(v) for v in rng.integers(10, 40, 2))
+        cv2.rectangle(static, (x, y), (x + w, y + h), 255, -1)
+    starts = rng.uniform(0, 1, size=(num_moving, 2)) * (shape[1], shape[0])
+    velocity = rng.uniform(-8, 8, size=(num_moving, 2))
+    for frame in range(NUM_FRAMES):
+        mask = static.copy()
+        for x, y in (starts + frame * velocity).tolist():
+            cv2.circle(mask, (int(x) % shape[1], int(y) % shape[0]), 25, 255, -1)
+        yield mask
+
+
+def summarize(contours_info) -> list:
+    return sorted((c["bbox"], c["area"], c["corners"]) for c in contours_info)
+
+
+def main():
+    print(f"{'moving':>6} {'full ms':>8} {'incr. ms':>9} {'speedup':>8} {'match':>6}")
+    for num_moving in MOVING_OBJECTS:
+        frames = list(scene_frames(num_moving))
+        analyzer = IncrementalContourAnalyzer()
+        full_time, incremental_time, match = 0.0, 0.0, True
+        for frame in frames:
+            start = time.perf_counter()
+            expected = analyze_contours(frame)
+            full_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            actual = analyzer.analyze(frame)
+            incremental_time += time.perf_counter() - start
+            match &= summarize(actual) == summarize(expected)
+
+        full_ms = 1000 * full_time / len(frames)
+        incremental_ms = 1000 * incremental_time / len(frames)
+        print(
+            f"{num_moving:>6} {full_ms:>8.2f} {incremental_ms:>9.2f} "
+            f"{full_ms / incremental_ms:>7.1f}x {str(match):>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: per-frame cost and false positives of MotionDetector background models.
+
+Runs every background model on a synthetic 640x480 sequence with slowly moving
+squares, sensor noise and global lighting flicker. After a warm-up period it
+reports the per-frame time, the fraction of moving squares that overlap a
+detected region (recall) and the fraction of detected regions that overlap no
+square (false-positive rate).
+
+Run from the repository root:
+    python -m benchmarks.bench_motion_backgrounds
+"""
+
+import time
+
+from benchmarks.synthetic import moving_objects_sequence, recall
+from package.motion_detector import BACKGROUND_MODELS, MotionDetector
+
+WARMUP_FRAMES: int = 30
+
+
+def main():
+    sequence = list(
+        moving_objects_sequence(
+            shape=(480, 640),
+            num_frames=200,
+            num_objects=6,
+            size_range=(20, 60),
+            speed=1.5,
+            flicker=12,
+        )
+    )
+
+    print(f"{'background':>16} {'ms/frame':>9} {'recall':>7} {'false pos.':>11}")
+    for model in BACKGROUND_MODELS:
+        detector = MotionDetector(background=model)
+        elapsed, found, total, regions_total, false_positives = 0.0, 0, 0, 0, 0
+
+        for index, (frame, boxes) in enumerate(sequence):
+            start = time.perf_counter()
+            regions = detector.update(frame)
+            if index < WARMUP_FRAMES:
+                continue
+            elapsed += time.perf_counter() - start
+
+            hits, count = recall(regions, boxes)
+            found, total = found + hits, total + count
+            matched, _ = recall(boxes.tolist(), regions)
+            regions_total += len(regions)
+            false_positives += len(regions) - matched
+
+        per_frame = 1000 * elapsed / (len(sequence) - WARMUP_FRAMES)
+        fp_rate = false_positives / regions_total if regions_total else 0.0
+        print(f"{model:>16} {per_frame:>9.2f} {found / total:>7.1%} {fp_rate:>11.1%}")
+
+
+if __name__ == "__main__":
+    main()
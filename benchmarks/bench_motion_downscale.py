@@ -0,0 +1,46 @@
+"""
+Benchmark: speed/recall trade-off of downscaled motion detection.
+
+Runs MotionDetector at several downscale factors on a synthetic 4K sequence of
+moving squares (side lengths 12-160 px) and reports the per-frame detection
+time and the fraction of moving squares that overlap a detected box.
+
+Run from the repository root:
+    python -m benchmarks.bench_motion_downscale
+"""
+
+import time
+
+from benchmarks.synthetic import moving_objects_sequence, recall
+from package.motion_detector import MotionDetector
+
+DOWNSCALE_FACTORS = (1, 2, 4, 8)
+
+
+def main():
+    sequence = list(moving_objects_sequence(shape=(2160, 3840), num_frames=20))
+
+    print(f"{'downscale':>9} {'ms/frame':>9} {'speedup':>8} {'recall':>7}")
+    baseline = None
+    for downscale in DOWNSCALE_FACTORS:
+        detector = MotionDetector(downscale=downscale)
+        detector.update(sequence[0][0])
+
+        elapsed, found, total = 0.0, 0, 0
+        for frame, boxes in sequence[1:]:
+            start = time.perf_counter()
+            regions = detector.update(frame)
+            elapsed += time.perf_counter() - start
+            hits, count = recall(regions, boxes)
+            found, total = found + hits, total + count
+
+        per_frame = 1000 * elapsed / (len(sequence) - 1)
+        baseline = baseline or per_frame
+        print(
+            f"{downscale:>9} {per_frame:>9.2f} {baseline / per_frame:>7.1f}x "
+            f"{found / total:>7.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: scaling of tiled motion detection over worker threads.
+
+Runs detect_motion() and TiledMotionDetector with 1..N worker threads on a
+synthetic 4K sequence of moving squares, reports the per-frame detection time
+and checks that every tiled run returns the same regions as the untiled one.
+The speedup is bounded by the number of CPU cores (os.cpu_count()).
+
+The sequence is run twice: clean, and with 0.3 % of the pixels of every frame
+replaced by speckles. The speckles produce thousands of small blobs, many of
+them crossing tile borders, which stresses the fragment merge step.
+
+Run from the repository root:
+    python -m benchmarks.bench_motion_tiled [max_workers]
+"""
+
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.synthetic import moving_objects_sequence
+from package.motion_detector import detect_motion
+from package.tiled_motion_detector import TiledMotionDetector
+
+TILES = (4, 4)
+SPECKLE_DENSITY: float = 0.003  # Fraction of pixels replaced by speckles
+
+
+def time_detector(detect, frames) -> tuple:
+    """Returns (ms per frame, sorted regions of every frame) for a detect function."""
+    results = []
+    start = time.perf_counter()
+    for prev_frame, frame in zip(frames, frames[1:]):
+        results.append(sorted(detect(prev_frame, frame)))
+    elapsed = time.perf_counter() - start
+    return 1000 * elapsed / (len(frames) - 1), results
+
+
+def add_speckles(frames: list, density: float, seed: int = 0) -> list:
+    """Returns copies of the frames with a fraction of pixels set to white."""
+    rng = np.random.default_rng(seed)
+    speckled = []
+    for frame in frames:
+        frame = frame.copy()
+        frame[rng.random(frame.shape) < density] = 255
+        speckled.append(frame)
+    return speckled
+
+
+def run(name: str, frames: list, max_workers: int) -> None:
+    baseline, expected = time_detector(detect_motion, frames)
+    print(f"\n{name}: {sum(map(len, expected)) / len(expected):.0f} regions/frame")
+    print(f"{'workers':>8} {'ms/frame':>9} {'speedup':>8} {'match':>6}")
+    print(f"{'untiled':>8} {baseline:>9.2f} {1.0:>7.1f}x {'-':>6}")
+    for workers in range(1, max_workers + 1):
+        with TiledMotionDetector(tiles=TILES, workers=workers) as detector:
+            per_frame, results = time_detector(detector.detect, frames)
+        print(
+            f"{workers:>8} {per_frame:>9.2f} {baseline / per_frame:>7.1f}x "
+            f"{str(results == expected):>6}"
+        )
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+    frames = [
+        frame for frame, _ in moving_objects_sequence(shape=(2160, 3840), num_frames=20)
+    ]
+    # Keep OpenCV's own threading out of the comparison
+    cv2.setNumThreads(1)
+
+    print(f"cpu cores: {os.cpu_count()}, tiles: {TILES[0]}x{TILES[1]}")
+    run("clean", frames, max_workers)
+    run(
+        f"speckled ({100 * SPECKLE_DENSITY:.1f} %)",
+        add_speckles(frames, SPECKLE_DENSITY),
+        max_workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark: MotionTracker update time with hundreds of boxes per frame.
+
+Moves N boxes scattered over a 4K frame by a few pixels per frame (with
+some boxes disappearing for a frame) and reports the mean and worst tracker update
+time per frame.
+
+Run from the repository root:
+    python -m benchmarks.bench_motion_tracker
+"""
+
+import time
+
+import numpy as np
+
+from package.motion_tracker import MotionTracker
+
+BOX_COUNTS = (10, 100, 300, 1000)
+NUM_FRAMES = 200
+
+
+def box_sequence(num_boxes, num_frames, shape=(2160, 3840), seed=0):
+    """Yields per-frame box lists of boxes drifting across a 4K frame."""
+    rng = np.random.default_rng(seed)
+    origin = rng.uniform(0, 1, size=(num_boxes, 2)) * (shape[1] - 40, shape[0] - 30)
+    velocity = rng.uniform(-3, 3, size=(num_boxes, 2))
+    for frame in range(num_frames):
+        positions = origin + frame * velocity
+        visible = rng.random(num_boxes) > 0.05
+        yield [(int(x), int(y), 40, 30) for (x, y), v in zip(positions, visible) if v]
+
+
+def main():
+    print(f"{'boxes':>6} {'mean ms':>8} {'max ms':>7} {'tracks':>7}")
+    for num_boxes in BOX_COUNTS:
+        tracker = MotionTracker()
+        times = []
+        for regions in box_sequence(num_boxes, NUM_FRAMES):
+            start = time.perf_counter()
+            tracker.update(regions)
+            times.append(time.perf_counter() - start)
+        print(
+            f"{num_boxes:>6} {1000 * np.mean(times):>8.3f} "
+            f"{1000 * np.max(times):>7.3f} {tracker._next_id:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
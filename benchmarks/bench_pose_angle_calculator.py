@@ -0,0 +1,45 @@
+"""
+Benchmark: calculate_angle (dict of tuples, one triplet per call) vs.
+calculate_angles (one NumPy pass over an (N, 3, 2) array).
+
+Run from the repository root:
+    python -m benchmarks.bench_pose_angle_calculator
+"""
+
+import time
+
+import numpy as np
+
+from package.pose_angle_calculator import calculate_angle, calculate_angles
+
+BATCH_SIZES = (100, 10000, 1000000)
+
+
+def main():
+    rng = np.random.default_rng(0)
+
+    print(f"{'frames':>9} {'dict loop (s)':>14} {'batched (s)':>12} {'speedup':>8}")
+    for batch_size in BATCH_SIZES:
+        triplets = rng.uniform(0.0, 1.0, size=(batch_size, 3, 2))
+        keypoints = [
+            {"shoulder": tuple(s), "elbow": tuple(e), "wrist": tuple(w)}
+            for s, e, w in triplets.tolist()
+        ]
+
+        start = time.perf_counter()
+        for kp in keypoints:
+            calculate_angle(kp)
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        calculate_angles(triplets)
+        batched_time = time.perf_counter() - start
+
+        print(
+            f"{batch_size:>9} {loop_time:>14.4f} {batched_time:>12.4f} "
+            f"{loop_time / batched_time:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
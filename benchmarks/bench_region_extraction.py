@@ -0,0 +1,67 @@
+"""
+Benchmark: findContours vs. connectedComponentsWithStats region extraction.
+
+Builds 1080p binary masks with a few large blobs plus salt noise of increasing
+density (thousands of tiny specks) and times both backends of
+motion_detector.extract_regions() and contour_analysis.analyze_contours().
+
+Run from the repository root:
+    python -m benchmarks.bench_region_extraction
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+from package.contour_analysis import analyze_contours
+from package.motion_detector import extract_regions
+
+NOISE_DENSITIES = (0.0, 0.001, 0.01, 0.05)
+REPEATS: int = 10
+
+
+def noisy_mask(density: float, shape=(1080, 1920), seed: int = 0) -> np.ndarray:
+    """Returns a binary mask with 20 large blobs and salt noise of the given density."""
+    rng = np.random.default_rng(seed)
+    mask = np.zeros(shape, dtype=np.uint8)
+    for _ in range(20):
+        center = (int(rng.integers(0, shape[1])), int(rng.integers(0, shape[0])))
+        cv2.circle(mask, center, int(rng.integers(20, 80)), 255, -1)
+    mask[rng.random(shape) < density] = 255
+    return mask
+
+
+def best_time(function, *args, **kwargs) -> float:
+    """Returns the best wall-clock time (ms) of REPEATS calls."""
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function(*args, **kwargs)
+        timings.append(time.perf_counter() - start)
+    return 1000 * min(timings)
+
+
+def main():
+    print("Best of 10 runs in ms on 1920x1080 masks")
+    print(
+        f"{'noise':>6} {'specks':>7} | {'regions: contours':>17} {'components':>10}"
+        f" | {'analyze: contours':>17} {'components':>10}"
+    )
+    for density in NOISE_DENSITIES:
+        mask = noisy_mask(density)
+        specks = cv2.connectedComponents(mask)[0] - 1
+        row = [
+            best_time(extract_regions, mask, method="contours"),
+            best_time(extract_regions, mask, method="components"),
+            best_time(analyze_contours, mask, method="contours"),
+            best_time(analyze_contours, mask, method="components"),
+        ]
+        print(
+            f"{density:>6.1%} {specks:>7} | {row[0]:>17.2f} {row[1]:>10.2f}"
+            f" | {row[2]:>17.2f} {row[3]:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Benchmark: cost of a ResultCache hit against recomputing analyze_contours().
+
+Analyzes a 4K binary mask with thousands of shapes directly, then through a
+cached wrapper in both hash modes, and reports the time of a hit (which is
+the cost of hashing the frame) next to the time of the hash alone.
+
+Run from the repository root:
+    python -m benchmarks.bench_result_cache
+"""
+
+from package.contour_analysis import analyze_contours
+from package.result_cache import HASH_MODES, ResultCache, frame_key
+
+from .bench_contour_formats import best_time, shapes_mask
+
+
+def main():
+    mask = shapes_mask()
+    direct = best_time(lambda: analyze_contours(mask))
+    print(f"{'mode':>10} {'direct ms':>10} {'hit ms':>8} {'hash ms':>8}")
+    for mode in HASH_MODES:
+        cached_analyze = ResultCache(mode=mode).wrap(analyze_contours)
+        cached_analyze(mask)  # Fill the cache
+        hit = best_time(lambda: cached_analyze(mask))
+        key = best_time(lambda: frame_key(mask, mode))
+        print(f"{mode:>10} {direct:>10.2f} {hit:>8.2f} {key:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: moving-average smoothers and their sibling filters.
+
+Each iteration performs one update() followed by one get_average(), which is
+how the smoothers are polled on every sensor tick. Compared filters:
+    - RealTimeSmoother (deque+sum path)
+    - RealTimeSmoother with running_sum=True
+    - MovingMedianSmoother
+    - ExponentialSmoother with alpha = 2 / (window + 1)
+
+Run from the repository root:
+    python -m benchmarks.bench_smoother
+"""
+
+import random
+import time
+
+from package.smoother import (
+    ExponentialSmoother,
+    MovingMedianSmoother,
+    RealTimeSmoother,
+)
+
+WINDOW_SIZES = (5, 100, 1000, 10000)
+NUM_UPDATES: int = 20000
+
+
+def time_smoother(smoother, values: list) -> float:
+    """Returns the wall-clock time (s) to update and poll the smoother for each value."""
+    start = time.perf_counter()
+    for value in values:
+        smoother.update(value)
+        smoother.get_average()
+    return time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(0)
+    # Gaussian noise with occasional spikes, like the sensors the median targets
+    values = [
+        rng.gauss(20.0, 5.0) if rng.random() > 0.01 else 1000.0
+        for _ in range(NUM_UPDATES)
+    ]
+
+    filters = {
+        "deque+sum": lambda w: RealTimeSmoother(w),
+        "running sum": lambda w: RealTimeSmoother(w, running_sum=True),
+        "median": lambda w: MovingMedianSmoother(w),
+        "EMA": lambda w: ExponentialSmoother(alpha=2 / (w + 1)),
+    }
+
+    print("Throughput in thousands of update+get_average calls per second")
+    print(f"{'window':>8}" + "".join(f"{name:>13}" for name in filters))
+    for window_size in WINDOW_SIZES:
+        row = f"{window_size:>8}"
+        for make_filter in filters.values():
+            elapsed = time_smoother(make_filter(window_size), values)
+            row += f"{NUM_UPDATES / elapsed / 1000:>13.0f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
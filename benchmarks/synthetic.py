@@ -0,0 +1,90 @@
+"""
+Synthetic video sequences with known moving objects, shared by the motion benchmarks.
+"""
+
+import cv2
+import numpy as np
+
+
+def moving_objects_sequence(
+    shape=(2160, 3840),
+    num_frames: int = 20,
+    num_objects: int = 12,
+    size_range=(12, 160),
+    speed: float = 6.0,
+    noise: int = 6,
+    flicker: int = 0,
+    seed: int = 0,
+):
+    """
+    Generates grayscale frames of squares drifting over a textured background.
+
+    Args:
+        shape (tuple): Frame size (height, width).
+        num_frames (int): Number of frames to generate.
+        num_objects (int): Number of moving squares.
+        size_range (tuple): Minimum and maximum side length of the squares in pixels.
+        speed (float): Maximum speed of the squares in pixels per frame.
+        noise (int): Amplitude of the per-frame sensor noise.
+        flicker (int): Amplitude of global per-frame brightness changes.
+        seed (int): Seed of the random generator.
+
+    Yields:
+        tuple: (frame, boxes) where boxes is an (num_objects, 4) array of the
+               ground-truth (x, y, w, h) of every square in the frame.
+    """
+    rng = np.random.default_rng(seed)
+    height, width = shape
+
+    # Smooth background texture so that moving squares are not uniform blobs
+    background = cv2.resize(
+        rng.integers(40, 140, size=(height // 64 + 1, width // 64 + 1), dtype=np.uint8),
+        (width, height),
+        interpolation=cv2.INTER_LINEAR,
+    ).astype(np.int16)
+
+    sizes = rng.integers(size_range[0], size_range[1] + 1, size=num_objects)
+    positions = rng.uniform(0, 1, size=(num_objects, 2)) * (
+        np.array([width, height]) - sizes[:, None]
+    )
+    velocities = rng.uniform(-speed, speed, size=(num_objects, 2))
+    intensities = rng.integers(180, 256, size=num_objects)
+
+    for _ in range(num_frames):
+        frame = background + rng.integers(-noise, noise + 1, size=shape, dtype=np.int16)
+        if flicker:
+            frame += int(rng.integers(-flicker, flicker + 1))
+        frame = np.clip(frame, 0, 255).astype(np.uint8)
+
+        boxes = np.column_stack([positions.astype(int), sizes, sizes])
+        for (x, y, w, h), value in zip(boxes, intensities):
+            frame[y : y + h, x : x + w] = value
+        yield frame, boxes
+
+        positions += velocities
+        # Bounce off the borders
+        limits = np.array([width, height]) - sizes[:, None]
+        outside = (positions < 0) | (positions > limits)
+        velocities[outside] *= -1
+        np.clip(positions, 0, limits, out=positions)
+
+
+def recall(detected: list, boxes: np.ndarray) -> tuple:
+    """
+    Counts ground-truth objects that overlap a detected region.
+
+    Args:
+        detected (list): Detected bounding boxes (x, y, w, h).
+        boxes (numpy.ndarray): Ground-truth boxes (x, y, w, h) of moving objects.
+
+    Returns:
+        tuple: (number of objects found, number of objects).
+    """
+    found = 0
+    for x, y, w, h in boxes:
+        if any(
+            dx < x + w and x < dx + dw and dy < y + h and y < dy + dh
+            for dx, dy, dw, dh in detected
+        ):
+            found += 1
+    return found, len(boxes)
@@ -0,0 +1,286 @@
+"""
+Directory-Scale Batch Contour Analysis
+
+process_and_display_image() handles a single image and blocks on a window,
+so it cannot run headless over a large image collection. This module walks
+directories and glob patterns and analyzes every image without a display:
+
+- Images are decoded on a thread pool (cv2.imread releases the GIL), and the
+  threshold + analyze_contours() work runs on a process pool. The pool starts
+  its workers with "forkserver" (or "spawn" where that is unavailable), since
+  forking this multi-threaded process could copy a lock held by a decoder
+  thread and deadlock the child.
+- Results are streamed as one JSON object per line (JSONL), tagged with the
+  image path, in completion order. The paths are enumerated lazily and only
+  a bounded number of images is in flight, so memory stays constant however
+  large the collection is.
+- The output file doubles as the checkpoint: every line is flushed when it
+  is written, and a rerun skips the paths already in the file (a partially
+  written last line from an interrupted run is discarded). Paths recorded
+  with an "error" are retried, since the failure may have been temporary (an
+  I/O error, a killed worker); a successful retry appends a second record.
+- If the process pool breaks, the images that can no longer be analyzed are
+  recorded as failed instead of aborting the batch.
+
+Example usage:
+    python -m package.batch_contour_analysis ./images "./more/*.png" -o contours.jsonl
+
+Topics: Batch processing, parallelism
+"""
+
+import argparse
+import glob
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Iterator, Optional, Set
+
+import cv2
+import numpy as np
+
+from .contour_analysis import (
+    AREA_THRESHOLD,
+    BINARY_THRESHOLD,
+    CONTOUR_METHODS,
+    analyze_contours,
+)
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp")
+
+
+def find_images(
+    inputs: Iterable[str], extensions: Iterable[str] = IMAGE_EXTENSIONS
+) -> Iterator[str]:
+    """
+    Lazily yields the image paths of directories (recursively) and glob patterns.
+
+    Args:
+        inputs (iterable): Directories, image files or glob patterns.
+        extensions (iterable): Lower-case file extensions that count as images.
+
+    Yields:
+        str: Image paths; each directory is walked in sorted order.
+    """
+    extensions = tuple(extensions)
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, dirs, files in os.walk(item):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(extensions):
+                        yield os.path.join(root, name)
+        elif os.path.isfile(item):
+            yield item
+        else:
+            for path in glob.iglob(item, recursive=True):
+                if os.path.isfile(path) and path.lower().endswith(extensions):
+                    yield path
+
+
+def load_checkpoint(output_path: str) -> Set[str]:
+    """
+    Reads the paths already recorded in an output file.
+
+    A partially written last line (from an interrupted run) is truncated so
+    that appending continues on a clean line. Records with an "error" do not
+    count as done, so their images are retried.
+
+    Args:
+        output_path (str): The JSONL output file of a previous run.
+
+    Returns:
+        set: The image paths that already have a successful result.
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    valid_size = 0
+    with open(output_path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+                if "error" not in record:
+                    done.add(record["path"])
+            except (ValueError, KeyError, TypeError):
+                break
+            valid_size += len(line)
+    if valid_size < os.path.getsize(output_path):
+        logging.warning(f"Discarding an incomplete record at the end of {output_path}")
+        with open(output_path, "r+b") as f:
+            f.truncate(valid_size)
+    return done
+
+
+def _decode_image(path: str) -> Optional[np.ndarray]:
+    """Thread pool task: decodes an image to grayscale (None if unreadable)."""
+    return cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+
+
+def _analyze_image(
+    path: str, gray: np.ndarray, area_threshold: float, method: str
+) -> dict:
+    """Process pool task: thresholds an image and returns its JSON-ready record."""
+    _, binary = cv2.threshold(gray, BINARY_THRESHOLD, 255, cv2.THRESH_BINARY)
+    contours = [
+        {
+            "bbox": list(info["bbox"]),
+            "area": info["area"],
+            "corners": info["corners"],
+            "approx": info["approx"].reshape(-1, 2).tolist(),
+        }
+        for info in analyze_contours(binary, area_threshold, method)
+    ]
+    height, width = gray.shape
+    return {"path": path, "width": width, "height": height, "contours": contours}
+
+
+def run_batch(
+    inputs: Iterable[str],
+    output_path: str,
+    area_threshold: float = AREA_THRESHOLD,
+    method: str = "contours",
+    decode_workers: int = 4,
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    resume: bool = True,
+) -> dict:
+    """
+    Analyzes the contours of every image and appends the results to a JSONL file.
+
+    Args:
+        inputs (iterable): Directories, image files or glob patterns.
+        output_path (str): JSONL file the records are appended to.
+        area_threshold (float): Minimum contour area to consider.
+        method (str): Contour extraction backend, one of CONTOUR_METHODS.
+        decode_workers (int): Number of image decoding threads.
+        workers (int, optional): Number of analysis processes (default: CPU count).
+        max_in_flight (int, optional): Maximum number of images being decoded or
+            analyzed at once (default: twice the number of workers of both pools).
+        resume (bool): Skip the images already recorded in output_path. If
+            False, the output file is overwritten.
+
+    Returns:
+        dict: Counts of "written", "failed" and "skipped" images.
+
+    Raises:
+        ValueError: If the method is unknown.
+    """
+    if method not in CONTOUR_METHODS:
+        raise ValueError(
+            f"Unknown contour method: {method} "
+            f"(expected one of {', '.join(CONTOUR_METHODS)})"
+        )
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * (workers + decode_workers)
+    done = load_checkpoint(output_path) if resume else set()
+    paths = (path for path in find_images(inputs) if path not in done)
+    counts = {"written": 0, "failed": 0, "skipped": len(done)}
+
+    start_method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    with ThreadPoolExecutor(decode_workers) as decoders, ProcessPoolExecutor(
+        workers, mp_context=multiprocessing.get_context(start_method)
+    ) as analyzers, open(output_path, "a" if resume else "w") as output:
+
+        def write(record: dict) -> None:
+            output.write(json.dumps(record) + "\n")
+            output.flush()  # Every written line is part of the checkpoint
+            counts["failed" if "error" in record else "written"] += 1
+
+        pending: dict = {}  # Future -> (stage, path)
+        exhausted = False
+        broken: Optional[str] = None  # Error message once the process pool broke
+        while pending or not exhausted:
+            if broken is not None and not exhausted:
+                # Nothing can be analyzed any more; fail the remaining paths
+                for path in paths:
+                    write({"path": path, "error": broken})
+                exhausted = True
+            # Keep a bounded number of images in flight
+            while not exhausted and len(pending) < max_in_flight:
+                path = next(paths, None)
+                if path is None:
+                    exhausted = True
+                else:
+                    pending[decoders.submit(_decode_image, path)] = ("decode", path)
+            if not pending:
+                break
+
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, path = pending.pop(future)
+                error = future.exception()
+                if error is not None:
+                    write({"path": path, "error": f"{type(error).__name__}: {error}"})
+                elif stage == "analyze":
+                    write(future.result())
+                elif future.result() is None:
+                    write({"path": path, "error": "Cannot decode image"})
+                elif broken is not None:
+                    write({"path": path, "error": broken})
+                else:
+                    try:
+                        analysis: Future = analyzers.submit(
+                            _analyze_image,
+                            path,
+                            future.result(),
+                            area_threshold,
+                            method,
+                        )
+                    except BrokenProcessPool as e:
+                        broken = f"{type(e).__name__}: {e}"
+                        logging.error(f"Analysis process pool is broken: {e}")
+                        write({"path": path, "error": broken})
+                    else:
+                        pending[analysis] = ("analyze", path)
+
+    return counts
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Headless batch contour analysis")
+    parser.add_argument(
+        "inputs", nargs="+", help="Directories, images or glob patterns"
+    )
+    parser.add_argument("-o", "--output", required=True, help="JSONL output file")
+    parser.add_argument("--area-threshold", type=float, default=AREA_THRESHOLD)
+    parser.add_argument("--method", default="contours", choices=CONTOUR_METHODS)
+    parser.add_argument("--decode-workers", type=int, default=4)
+    parser.add_argument("--workers", type=int, help="Analysis processes")
+    parser.add_argument(
+        "--no-resume", action="store_true", help="Overwrite instead of resuming"
+    )
+    args = parser.parse_args(argv)
+
+    counts = run_batch(
+        args.inputs,
+        args.output,
+        area_threshold=args.area_threshold,
+        method=args.method,
+        decode_workers=args.decode_workers,
+        workers=args.workers,
+        resume=not args.no_resume,
+    )
+    logging.info(
+        f"Wrote {counts['written']} record(s), {counts['failed']} failure(s), "
+        f"skipped {counts['skipped']} already processed image(s)"
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
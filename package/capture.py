@@ -0,0 +1,164 @@
+"""
+Threaded Video Capture with Latest-Frame Semantics
+
+Reading frames with cv2.VideoCapture.read() on the processing thread means a
+slow frame lets the driver buffer back up: the loop then processes stale
+frames and latency keeps growing. ThreadedCapture grabs frames on a background
+thread into a small bounded slot. When the slot is full the oldest frame is
+dropped, so read() always returns the most recent frames.
+
+It works with webcams (device indices), video files and already-opened
+capture objects, and reports dropped-frame and capture-to-process latency
+counters.
+
+Example usage:
+    with ThreadedCapture(0) as cap:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            ...
+        logging.info(f"Dropped {cap.frames_dropped} frame(s)")
+
+Topics: Concurrency, real-time video processing
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+
+class ThreadedCapture:
+    """Grabs frames on a background thread and hands out the most recent ones."""
+
+    def __init__(
+        self,
+        source: Union[int, str, cv2.VideoCapture] = 0,
+        max_queued: int = 1,
+        drop_frames: bool = True,
+    ):
+        """
+        Open the source and start the grabber thread.
+
+        Args:
+            source (int | str | cv2.VideoCapture): Device index, video file path
+                or URL, or an already-opened capture object (anything with
+                read(), isOpened() and release()).
+            max_queued (int): Number of frames the slot holds; 1 means read()
+                always returns the latest frame.
+            drop_frames (bool): Drop the oldest queued frame when the slot is
+                full. If False, the grabber waits instead, so every frame of a
+                video file is processed.
+
+        Raises:
+            ValueError: If max_queued is not positive.
+        """
+        if max_queued < 1:
+            raise ValueError(f"max_queued must be positive, got {max_queued}")
+        self.max_queued = max_queued
+        self.drop_frames = drop_frames
+
+        # Counters
+        self.frames_captured: int = 0  # Frames grabbed from the source
+        self.frames_dropped: int = 0  # Frames discarded because the slot was full
+        self.frames_read: int = 0  # Frames handed out by read()
+        # Seconds between grab and read() of the last frame
+        self.last_latency: float = 0.0
+        self._total_latency: float = 0.0
+
+        self._cap = (
+            cv2.VideoCapture(source) if isinstance(source, (int, str)) else source
+        )
+        self._frames: deque = deque()  # (frame, capture timestamp) pairs
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._finished = not self._cap.isOpened()  # No more frames will arrive
+
+        self._thread: Optional[threading.Thread] = None
+        if not self._finished:
+            self._thread = threading.Thread(target=self._grab_frames, daemon=True)
+            self._thread.start()
+
+    @property
+    def average_latency(self) -> float:
+        """Mean time in seconds between grabbing a frame and handing it out."""
+        return self._total_latency / self.frames_read if self.frames_read else 0.0
+
+    def isOpened(self) -> bool:
+        """Returns True while the source is open or frames remain to be read."""
+        with self._condition:
+            return not self._finished or bool(self._frames)
+
+    def read(
+        self, timeout: Optional[float] = None
+    ) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Return the oldest queued frame, waiting for one if necessary.
+
+        Args:
+            timeout (float, optional): Maximum time to wait in seconds.
+
+        Returns:
+            tuple: (True, frame), or (False, None) if the source is exhausted,
+                   the capture was released, or the timeout expired.
+        """
+        with self._condition:
+            available = self._condition.wait_for(
+                lambda: self._frames or self._finished or self._stopped, timeout
+            )
+            if not available or not self._frames:
+                return False, None
+            frame, captured_at = self._frames.popleft()
+            self._condition.notify_all()  # Wake a grabber waiting for space
+
+        self.last_latency = time.perf_counter() - captured_at
+        self._total_latency += self.last_latency
+        self.frames_read += 1
+        return True, frame
+
+    def release(self) -> None:
+        """Stops the grabber thread and releases the source."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        self._cap.release()
+
+    def __enter__(self) -> "ThreadedCapture":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+    def _grab_frames(self) -> None:
+        """Grabber thread: reads frames until the source ends or release() is called."""
+        try:
+            while not self._stopped:
+                ret, frame = self._cap.read()
+                if not ret:
+                    break
+                captured_at = time.perf_counter()
+
+                with self._condition:
+                    self.frames_captured += 1
+                    if not self.drop_frames:
+                        self._condition.wait_for(
+                            lambda: len(self._frames) < self.max_queued or self._stopped
+                        )
+                    elif len(self._frames) >= self.max_queued:
+                        self._frames.popleft()
+                        self.frames_dropped += 1
+                    self._frames.append((frame, captured_at))
+                    self._condition.notify_all()
+        except Exception as e:
+            logging.error(f"[ThreadedCapture] Error grabbing frame: {e}")
+        finally:
+            with self._condition:
+                self._finished = True
+                self._condition.notify_all()
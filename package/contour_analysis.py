@@ -8,6 +8,11 @@ Given a binary image (e.g., from thresholding), extract contours and compute:
 
 Add filtering so only contours with area > threshold are considered.
 
+Contours can be extracted either with findContours ("contours") or from
+connectedComponentsWithStats ("components"). The latter drops small blobs in
+one vectorized step, so on noisy masks with thousands of specks the per-contour
+work (contourArea, approxPolyDP) only runs on the surviving components.
+
 Topics: Shape analysis
 """
 
@@ -20,9 +25,240 @@ import os
 os.environ["QT_QPA_PLATFORM"] = "xcb"
 
 AREA_THRESHOLD: int = 100
+BINARY_THRESHOLD: int = 127  # Gray level separating background and foreground
+
+# Contour extraction backends (see the module docstring)
+CONTOUR_METHODS = ("contours", "components")
+
+# Result forms of analyze_contours(): a list of dicts, one ContourTable of flat
+# NumPy arrays (compact, cheap to pickle and to share between processes), or a
+# list of ContourRecords that compute everything but bbox and area on demand
+OUTPUT_FORMATS = ("dicts", "columnar", "lazy")
+
+# approxPolyDP tolerance as a fraction of the contour perimeter
+APPROX_EPSILON: float = 0.02
+
+
+def _component_contours(image: np.ndarray, area_threshold: int) -> list:
+    """
+    Finds the external contours of connected components that may pass the area filter.
+
+    Returns the same contours as findContours with RETR_EXTERNAL (possibly in a
+    different order), but only for components that may reach area_threshold.
+    The contour runs through pixel centres, so its area is at most
+    (w - 1) * (h - 1) for a w x h bounding box; this cheap bound discards
+    single specks and thin lines before any contour is traced.
+    """
+    _, labels, stats, _ = cv2.connectedComponentsWithStats(
+        image, connectivity=8, ltype=cv2.CV_32S
+    )
+
+    # Vectorized pre-filter on all components at once (label 0 is the background)
+    max_areas = (stats[:, cv2.CC_STAT_WIDTH] - 1) * (stats[:, cv2.CC_STAT_HEIGHT] - 1)
+    candidates = np.flatnonzero(max_areas[1:] >= area_threshold) + 1
+
+    # findContours with RETR_EXTERNAL ignores blobs inside holes of other blobs.
+    # Outermost blobs are exactly those 4-adjacent to the background region that
+    # touches the image border (foreground is 8-connected, so background is
+    # 4-connected), which is found for all components at once in O(pixels).
+    padded = cv2.copyMakeBorder(image, 1, 1, 1, 1, cv2.BORDER_CONSTANT, value=0)
+    _, background = cv2.connectedComponents(
+        (padded == 0).astype(np.uint8), connectivity=4, ltype=cv2.CV_32S
+    )
+    outside = (background == background[0, 0]).astype(np.uint8)
+    cross = cv2.getStructuringElement(cv2.MORPH_CROSS, (3, 3))
+    touching = cv2.dilate(outside, cross)[1:-1, 1:-1].astype(bool)
+    outermost = np.zeros(len(stats), dtype=bool)
+    outermost[labels[touching]] = True
+    candidates = candidates[outermost[candidates]]
+
+    contours = []
+    for label in candidates:
+        x, y, w, h = (int(v) for v in stats[label, :4])
+        component = (labels[y : y + h, x : x + w] == label).astype(np.uint8)
+        outer, _ = cv2.findContours(
+            component, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE, offset=(x, y)
+        )
+        contours.append(outer[0])
+    return contours
+
+
+class ContourTable:
+    """
+    Columnar form of the analyze_contours() results.
+
+    Instead of one dict and one small approx array per contour, all results
+    live in three flat NumPy arrays:
+    - records: structured array with the "bbox" (x, y, w, h), "area" and
+      "corners" of every contour;
+    - vertices: (V, 2) int32 array with the approximation vertices of all
+      contours, one after the other;
+    - offsets: (N + 1,) int64 array; the vertices of contour i are
+      vertices[offsets[i]:offsets[i + 1]].
+
+    The arrays can be pickled, saved or placed in shared memory as they are,
+    and approx(i) returns views into the flat vertex array without copying.
+    """
+
+    RECORD_DTYPE = np.dtype(
+        [("bbox", np.int32, (4,)), ("area", np.float64), ("corners", np.int32)]
+    )
+
+    def __init__(self, records: np.ndarray, vertices: np.ndarray, offsets: np.ndarray):
+        """
+        Args:
+            records (numpy.ndarray): Structured array of RECORD_DTYPE.
+            vertices (numpy.ndarray): (V, 2) int32 approximation vertices.
+            offsets (numpy.ndarray): (N + 1,) start offsets into vertices.
+
+        Raises:
+            ValueError: If the arrays do not describe the same number of contours.
+        """
+        if len(offsets) != len(records) + 1 or offsets[-1] != len(vertices):
+            raise ValueError(
+                f"Inconsistent table: {len(records)} record(s), "
+                f"{len(offsets)} offset(s), {len(vertices)} vertices"
+            )
+        self.records = records
+        self.vertices = vertices
+        self.offsets = offsets
+
+    @property
+    def bboxes(self) -> np.ndarray:
+        """(N, 4) int32 view of the bounding boxes."""
+        return self.records["bbox"]
+
+    @property
+    def areas(self) -> np.ndarray:
+        return self.records["area"]
+
+    @property
+    def corners(self) -> np.ndarray:
+        return self.records["corners"]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def approx(self, index: int) -> np.ndarray:
+        """Returns the (k, 1, 2) approximation of a contour as a view."""
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        return self.vertices[start:stop].reshape(-1, 1, 2)
+
+    def approx_list(self) -> list:
+        """Returns the approximations of all contours as a list of views."""
+        if not len(self):
+            return []  # np.split would return one empty piece
+        return np.split(self.vertices.reshape(-1, 1, 2), self.offsets[1:-1])
+
+    def to_dicts(self) -> list:
+        """Converts the table to the list-of-dicts form of analyze_contours()."""
+        return [
+            {
+                "bbox": tuple(bbox),
+                "area": area,
+                "corners": corners,
+                "approx": approx,
+            }
+            for bbox, area, corners, approx in zip(
+                self.bboxes.tolist(),
+                self.areas.tolist(),
+                self.corners.tolist(),
+                self.approx_list(),
+            )
+        ]
+
+
+class ContourRecord:
+    """
+    Lazily evaluated analyze_contours() result for one contour.
+
+    The area is known from the area filter and the bounding box is cheap, so
+    they are computed up front. The perimeter, approximation, corners, moments
+    and convex hull are computed on first access and cached, so consumers that
+    only need bounding boxes skip the arcLength/approxPolyDP work entirely.
 
+    Records also support the dict-style access of the "dicts" format
+    (record["bbox"], record["approx"], ...), so they can be passed to
+    draw_contours_and_bboxes().
+    """
 
-def analyze_contours(image: np.ndarray, area_threshold: int = AREA_THRESHOLD) -> list:
+    __slots__ = (
+        "contour",
+        "bbox",
+        "area",
+        "_perimeter",
+        "_approx",
+        "_moments",
+        "_hull",
+    )
+
+    KEYS = ("bbox", "area", "corners", "approx")
+
+    def __init__(self, contour: np.ndarray, area: float):
+        """
+        Args:
+            contour (numpy.ndarray): The contour points as returned by findContours.
+            area (float): The contour area.
+        """
+        self.contour = contour
+        self.bbox = cv2.boundingRect(contour)
+        self.area = area
+        self._perimeter = None
+        self._approx = None
+        self._moments = None
+        self._hull = None
+
+    @property
+    def perimeter(self) -> float:
+        if self._perimeter is None:
+            self._perimeter = cv2.arcLength(self.contour, True)
+        return self._perimeter
+
+    @property
+    def approx(self) -> np.ndarray:
+        """Polygon approximation of the contour (approxPolyDP)."""
+        if self._approx is None:
+            epsilon = APPROX_EPSILON * self.perimeter
+            self._approx = cv2.approxPolyDP(self.contour, epsilon, True)
+        return self._approx
+
+    @property
+    def corners(self) -> int:
+        """Number of corners of the approximation."""
+        return len(self.approx)
+
+    @property
+    def moments(self) -> dict:
+        if self._moments is None:
+            self._moments = cv2.moments(self.contour)
+        return self._moments
+
+    @property
+    def hull(self) -> np.ndarray:
+        """Convex hull of the contour."""
+        if self._hull is None:
+            self._hull = cv2.convexHull(self.contour)
+        return self._hull
+
+    def __getitem__(self, key: str):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def to_dict(self) -> dict:
+        """Converts the record to the dict form of analyze_contours()."""
+        return {key: getattr(self, key) for key in self.KEYS}
+
+    def __repr__(self) -> str:
+        return f"ContourRecord(bbox={self.bbox}, area={self.area})"
+
+
+def analyze_contours(
+    image: np.ndarray,
+    area_threshold: int = AREA_THRESHOLD,
+    method: str = "contours",
+    output_format: str = "dicts",
+):
     """
     Analyzes contours in a binary image and computes properties such as bounding boxes,
     contour areas, and shape approximations (number of corners).
@@ -30,19 +266,52 @@ def analyze_contours(image: np.ndarray, area_threshold: int = AREA_THRESHOLD) ->
     Args:
         image (numpy.ndarray): A binary image (0 for background, 255 for foreground).
         area_threshold (int): Minimum contour area to consider. Contours with smaller area are ignored.
+        method (str): Contour extraction backend, one of CONTOUR_METHODS. Both
+            give the same contours; "components" returns them in a different order.
+        output_format (str): One of OUTPUT_FORMATS: "dicts" for a list of dicts,
+            "columnar" for a ContourTable, "lazy" for a list of ContourRecords.
 
     Returns:
-        list: A list of dictionaries containing contour properties (bounding box, area,
-              corners, and approximation).
+        list | ContourTable: A list of dictionaries containing contour properties
+              (bounding box, area, corners, and approximation), or the same
+              results as a ContourTable or as ContourRecords.
+
+    Raises:
+        ValueError: If the method or output format is unknown.
     """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unknown output format: {output_format} "
+            f"(expected one of {', '.join(OUTPUT_FORMATS)})"
+        )
+
     # Convert to grayscale if the image is not already single-channel
     if len(image.shape) == 3:
         image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
 
     # Find contours in the binary image
-    contours, _ = cv2.findContours(image, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    if method == "contours":
+        contours, _ = cv2.findContours(
+            image, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+        )
+    elif method == "components":
+        contours = _component_contours(image, area_threshold)
+    else:
+        raise ValueError(
+            f"Unknown contour method: {method} "
+            f"(expected one of {', '.join(CONTOUR_METHODS)})"
+        )
 
-    results = []
+    if output_format == "lazy":
+        # Only the area filter runs now; everything else is computed on access
+        records = []
+        for cnt in contours:
+            area = cv2.contourArea(cnt)
+            if area >= area_threshold:
+                records.append(ContourRecord(cnt, area))
+        return records
+
+    bboxes, areas, approxes = [], [], []
 
     for cnt in contours:
         # Filter contours by area
@@ -51,49 +320,85 @@ def analyze_contours(image: np.ndarray, area_threshold: int = AREA_THRESHOLD) ->
             continue  # Skip small contours
 
         # Bounding box of the contour
-        x, y, w, h = cv2.boundingRect(cnt)
+        bboxes.append(cv2.boundingRect(cnt))
+        areas.append(area)
 
         # Approximate the contour shape (number of corners)
-        epsilon = 0.02 * cv2.arcLength(cnt, True)
-        approx = cv2.approxPolyDP(cnt, epsilon, True)
-
-        results.append(
-            {
-                "bbox": (x, y, w, h),
-                "area": area,
-                "corners": len(approx),  # Approximation gives number of corners
-                "approx": approx,
-            }
+        epsilon = APPROX_EPSILON * cv2.arcLength(cnt, True)
+        approxes.append(cv2.approxPolyDP(cnt, epsilon, True))
+
+    if output_format == "columnar":
+        records = np.empty(len(bboxes), dtype=ContourTable.RECORD_DTYPE)
+        records["bbox"] = np.reshape(bboxes, (-1, 4))
+        records["area"] = areas
+        records["corners"] = [len(approx) for approx in approxes]
+        offsets = np.zeros(len(approxes) + 1, dtype=np.int64)
+        np.cumsum(records["corners"], out=offsets[1:])
+        vertices = (
+            np.concatenate(approxes).reshape(-1, 2)
+            if approxes
+            else np.empty((0, 2), dtype=np.int32)
         )
+        return ContourTable(records, vertices, offsets)
 
-    return results
+    return [
+        {
+            "bbox": bbox,
+            "area": area,
+            "corners": len(approx),  # Approximation gives number of corners
+            "approx": approx,
+        }
+        for bbox, area, approx in zip(bboxes, areas, approxes)
+    ]
 
 
-def draw_contours_and_bboxes(image: np.ndarray, contours_info: list) -> np.ndarray:
+def bbox_polygons(bboxes) -> np.ndarray:
+    """
+    Converts bounding boxes to closed 4-point polygons, so that many boxes can
+    be drawn with a single cv2.polylines call.
+
+    Args:
+        bboxes (array-like): N bounding boxes as (x, y, w, h).
+
+    Returns:
+        numpy.ndarray: (N, 4, 2) int32 array of the corners of each box, in
+                       the order cv2.rectangle draws them.
+    """
+    bboxes = np.asarray(bboxes, dtype=np.int32).reshape(-1, 4)
+    x0, y0 = bboxes[:, 0], bboxes[:, 1]
+    x1, y1 = x0 + bboxes[:, 2], y0 + bboxes[:, 3]
+    return np.stack([x0, y0, x1, y0, x1, y1, x0, y1], axis=1).reshape(-1, 4, 2)
+
+
+def draw_contours_and_bboxes(image: np.ndarray, contours_info) -> np.ndarray:
     """
     Draws contours, bounding boxes, and corners on the image.
 
+    All bounding boxes are drawn first and all approximations on top of them,
+    so where a box and an approximation of different contours overlap, the
+    approximation wins (as in OverlayRenderer.add_contours()). Drawing box and
+    approximation per contour would let a later box cover an earlier contour.
+
     Args:
         image (numpy.ndarray): The image to draw on.
-        contours_info (list): List of contour information to be drawn (output from analyze_contours).
+        contours_info (list | ContourTable): Contour information to be drawn
+            (output from analyze_contours).
 
     Returns:
         numpy.ndarray: The image with contours drawn.
     """
-    for contour_info in contours_info:
-        # Draw bounding box
-        x, y, w, h = contour_info["bbox"]
-        cv2.rectangle(image, (x, y), (x + w, y + h), (0, 255, 0), 2)
-
-        # Draw contour approximation
+    # One polylines call draws all boxes, and one all approximations
+    if isinstance(contours_info, ContourTable):
+        boxes, approxes = contours_info.bboxes, contours_info.approx_list()
+    else:
+        boxes = [contour_info["bbox"] for contour_info in contours_info]
+        approxes = [contour_info["approx"] for contour_info in contours_info]
+    if len(boxes):
         cv2.polylines(
-            image,
-            [contour_info["approx"]],
-            isClosed=True,
-            color=(0, 0, 255),
-            thickness=2,
+            image, bbox_polygons(boxes), isClosed=True, color=(0, 255, 0), thickness=2
         )
-
+    if approxes:
+        cv2.polylines(image, approxes, isClosed=True, color=(0, 0, 255), thickness=2)
     return image
 
 
@@ -110,7 +415,7 @@ def process_and_display_image(image_path: str, area_threshold: int = AREA_THRESH
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
 
     # Threshold the grayscale image to get a binary image
-    _, binary = cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)
+    _, binary = cv2.threshold(gray, BINARY_THRESHOLD, 255, cv2.THRESH_BINARY)
 
     # Analyze contours in the binary image
     contours_info = analyze_contours(binary, area_threshold)
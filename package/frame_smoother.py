@@ -0,0 +1,115 @@
+"""
+Temporal Frame Smoother
+
+Applies the idea behind RealTimeSmoother to video: each output frame is the
+per-pixel average of the last N input frames. This suppresses sensor noise and
+flicker before frames reach detect_motion() or Processor.process().
+
+The last N frames are kept in a preallocated (N x H x W x C) ring buffer and a
+wide-integer running sum, so every update is one subtract (the evicted frame)
+and one add (the new frame), independent of N. The averaged frame is written
+into a reusable output buffer, so no arrays are allocated per frame.
+
+Example usage:
+    smoother = FrameSmoother(window_size=4)
+    while True:
+        ret, frame = cap.read()
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        smoothed = smoother.update(gray)
+        regions = detect_motion(prev_frame, smoothed)
+        # The output buffer is overwritten by the next update, so keep a copy
+        np.copyto(prev_frame, smoothed)
+
+Topics: Temporal filtering, memory reuse
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+class FrameSmoother:
+    """Maintains a per-pixel moving average over the last N frames."""
+
+    def __init__(self, window_size: int = 5):
+        """
+        Initialize the smoother. Buffers are allocated on the first frame,
+        once the frame shape and dtype are known.
+
+        Args:
+            window_size (int): Number of recent frames to average over.
+
+        Raises:
+            ValueError: If window_size is not positive.
+        """
+        if window_size < 1:
+            raise ValueError(f"window_size must be positive, got {window_size}")
+        self.window_size: int = window_size
+        self.count: int = 0  # Frames currently in the window
+
+        self.buffer: Optional[np.ndarray] = None  # (N, H, W[, C]) ring buffer
+        self.output: Optional[np.ndarray] = None  # Reused for every result
+        self._sum: Optional[np.ndarray] = None  # Wide-integer running sum
+        self._scratch: Optional[np.ndarray] = None  # Rounded-division workspace
+        self._position: int = 0  # Ring buffer slot of the oldest frame
+
+    def update(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Add a new frame to the window and return the current average.
+
+        Args:
+            frame (numpy.ndarray): Integer-valued frame (e.g. uint8 grayscale or BGR).
+
+        Returns:
+            numpy.ndarray: The averaged frame, with the same shape and dtype as
+                           the input. This is the smoother's output buffer, which
+                           is overwritten by the next call.
+
+        Raises:
+            ValueError: If the frame is not integer-valued, or its shape or
+                        dtype differ from the first frame.
+        """
+        if self.buffer is None:
+            self._allocate(frame)
+        elif frame.shape != self.buffer.shape[1:] or frame.dtype != self.buffer.dtype:
+            raise ValueError(
+                f"Expected {self.buffer.dtype} frames of shape {self.buffer.shape[1:]}, "
+                f"got {frame.dtype} {frame.shape}"
+            )
+
+        slot = self.buffer[self._position]
+        if self.count == self.window_size:
+            np.subtract(self._sum, slot, out=self._sum)  # Evict the oldest frame
+        else:
+            self.count += 1
+        np.add(self._sum, frame, out=self._sum)
+        np.copyto(slot, frame)
+        self._position = (self._position + 1) % self.window_size
+
+        # Round to nearest: (sum + count // 2) // count
+        np.add(self._sum, self.count // 2, out=self._scratch)
+        np.floor_divide(self._scratch, self.count, out=self._scratch)
+        np.copyto(self.output, self._scratch, casting="unsafe")
+        return self.output
+
+    def reset(self) -> None:
+        """Empties the window (e.g. after a scene cut), keeping the buffers."""
+        self.count = 0
+        self._position = 0
+        if self._sum is not None:
+            self._sum.fill(0)
+
+    def _allocate(self, frame: np.ndarray) -> None:
+        """Allocates the ring buffer, accumulator and output for the frame format."""
+        if not np.issubdtype(frame.dtype, np.integer):
+            raise ValueError(f"Expected an integer-valued frame, got {frame.dtype}")
+
+        # int32 holds the sum of N uint8 frames for any practical N; fall back
+        # to int64 for deeper windows or wider pixel types
+        max_sum = int(np.iinfo(frame.dtype).max) * self.window_size
+        accumulator = np.int32 if max_sum <= np.iinfo(np.int32).max else np.int64
+
+        self.buffer = np.zeros((self.window_size,) + frame.shape, dtype=frame.dtype)
+        self.output = np.zeros(frame.shape, dtype=frame.dtype)
+        self._sum = np.zeros(frame.shape, dtype=accumulator)
+        self._scratch = np.zeros(frame.shape, dtype=accumulator)
@@ -6,8 +6,11 @@ Use simulated or real-time video (OpenCV + MediaPipe or pre-recorded video).
 
 import cv2
 import mediapipe as mp
+import numpy as np
 import os
 import logging
+from .capture import ThreadedCapture
+from .overlay import OverlayRenderer
 
 # Suppress platform plugin warnings
 os.environ["QT_QPA_PLATFORM"] = "xcb"
@@ -17,12 +20,22 @@ logging.basicConfig(level=logging.INFO)
 
 
 class HandRaiseDetector:
-    def __init__(self):
+    def __init__(self, draw=False):
+        """
+        Parameters:
+            draw (bool): Draw the pose landmarks onto the frames in process_frame().
+                Off by default, so the detector only detects; draw them with an
+                OverlayRenderer from last_landmarks instead.
+        """
+        self.draw = draw
         # Initialize MediaPipe Pose detector
         self.mp_pose = mp.solutions.pose
         self.pose = self.mp_pose.Pose(
             min_detection_confidence=0.5, min_tracking_confidence=0.5
         )
+        # Landmarks of the last processed frame as a (33, 4) array of
+        # x, y, z, visibility (e.g. for JointAngleEngine), or None
+        self.last_landmarks = None
         logging.info("HandRaiseDetector initialized with MediaPipe Pose.")
 
     def is_hand_raised(self, landmarks):
@@ -60,7 +73,8 @@ class HandRaiseDetector:
             frame: Input video frame.
 
         Returns:
-            tuple: The processed frame and a boolean indicating if a hand is raised.
+            tuple: The processed (flipped) frame, with the landmarks drawn if
+                   draw is enabled, and a boolean indicating if a hand is raised.
         """
         # Flip the frame horizontally for a later selfie view
         frame = cv2.flip(frame, 1)
@@ -72,11 +86,20 @@ class HandRaiseDetector:
         results = self.pose.process(rgb_frame)
 
         if results.pose_landmarks:
-            # Draw pose landmarks on the frame
-            mp.solutions.drawing_utils.draw_landmarks(
-                frame, results.pose_landmarks, self.mp_pose.POSE_CONNECTIONS
+            self.last_landmarks = np.array(
+                [
+                    (lm.x, lm.y, lm.z, lm.visibility)
+                    for lm in results.pose_landmarks.landmark
+                ],
+                dtype=np.float32,
             )
 
+            # Draw pose landmarks on the frame (only if asked to)
+            if self.draw:
+                mp.solutions.drawing_utils.draw_landmarks(
+                    frame, results.pose_landmarks, self.mp_pose.POSE_CONNECTIONS
+                )
+
             # Detect if a hand is raised
             hand_raised = self.is_hand_raised(results.pose_landmarks.landmark)
 
@@ -85,14 +108,18 @@ class HandRaiseDetector:
 
             return frame, hand_raised
 
+        self.last_landmarks = None
         return frame, False
 
 
 def main():
+    # The detector only detects; the landmarks are drawn in one batch by the renderer
     detector = HandRaiseDetector()
+    renderer = OverlayRenderer()
 
-    # Start video input using webcam (or replace 0 with video file path for file input)
-    cap = cv2.VideoCapture(0)
+    # Start video input using webcam (or replace 0 with video file path for file input).
+    # Frames are grabbed on a background thread that keeps only the latest one.
+    cap = ThreadedCapture(0)
 
     if not cap.isOpened():
         logging.error("Failed to open video capture device.")
@@ -108,6 +135,10 @@ def main():
 
         # Process the frame for hand raise detection
         frame, hand_raised = detector.process_frame(frame)
+        renderer.add_landmarks(
+            detector.last_landmarks, detector.mp_pose.POSE_CONNECTIONS
+        )
+        frame = renderer.render(frame)
 
         # Display the appropriate text and color based on hand raise status
         text = "Hand Raised!" if hand_raised else "Hand Not Raised"
@@ -125,6 +156,10 @@ def main():
     # Release resources and close windows
     cap.release()
     cv2.destroyAllWindows()
+    logging.info(
+        f"Dropped {cap.frames_dropped} stale frame(s), average "
+        f"capture-to-process latency {1000 * cap.average_latency:.1f} ms"
+    )
     logging.info("Resources released, program finished.")
 
 
@@ -0,0 +1,295 @@
+"""
+Incremental Contour Analysis for Video
+
+Running analyze_contours() on every frame of a mostly static scene re-extracts
+and re-approximates every contour, even when only a small area changed.
+IncrementalContourAnalyzer keeps the previous binary mask and the blobs found
+in it, and per frame:
+
+1. compares the masks and marks the tiles (tile_size x tile_size pixels) that
+   contain changed pixels;
+2. turns groups of dirty tiles into rectangular regions of interest, and
+   invalidates every cached blob whose bounding box (grown by one pixel, for
+   8-connectivity) touches a region. The region is grown to cover the
+   invalidated blob, and this repeats until no more blobs are affected, so
+   every blob that may have changed lies entirely inside one region;
+3. re-extracts the contours only inside those regions and merges them with
+   the cached blobs from the unchanged areas.
+
+The results equal those of a full analyze_contours() call on the frame (the
+order of the contours may differ). When the regions to re-extract cover a
+large part of the frame, or consist of very many separate regions (each costs
+a findContours call), the analyzer simply runs the full extraction.
+
+Example usage:
+    analyzer = IncrementalContourAnalyzer(area_threshold=100)
+    for binary in masks:
+        contours_info = analyzer.analyze(binary)
+
+Topics: Shape analysis, incremental computation
+"""
+
+from typing import List, Optional
+
+import cv2
+import numpy as np
+
+from .contour_analysis import APPROX_EPSILON, AREA_THRESHOLD
+
+# Side length in pixels of the tiles the change detection works on
+TILE_SIZE: int = 32
+# Fall back to a full extraction when the regions to re-extract cover more than
+# this fraction of the frame (re-extracting them would cost about as much)
+FULL_ANALYSIS_FRACTION: float = 0.2
+# Fall back to a full extraction when the changed tiles form more separate
+# regions than this
+FULL_ANALYSIS_REGIONS: int = 64
+
+
+def _merge_rectangles(rectangles) -> np.ndarray:
+    """
+    Merges [x0, y0, x1, y1] rectangles that overlap or touch until none do.
+
+    All touching pairs are found in one vectorized comparison and grouped with
+    a union-find; the union boxes of the groups are merged again until they
+    are disjoint. The analyzer bounds the number of rectangles (see
+    full_analysis_regions), so the pairwise comparison stays small.
+
+    Returns:
+        numpy.ndarray: (N, 4) int64 array of the merged rectangles.
+    """
+    merged = np.asarray(rectangles, dtype=np.int64).reshape(-1, 4)
+    while len(merged) > 1:
+        x0, y0, x1, y1 = merged.T
+        touch = (
+            (x0[:, None] <= x1)
+            & (x0 <= x1[:, None])
+            & (y0[:, None] <= y1)
+            & (y0 <= y1[:, None])
+        )
+        parent = list(range(len(merged)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, j in np.argwhere(np.triu(touch, 1)).tolist():
+            parent[find(i)] = find(j)
+        roots, members = np.unique(
+            [find(i) for i in range(len(merged))], return_inverse=True
+        )
+        if len(roots) == len(merged):
+            break
+
+        # Union box of every group
+        grouped = np.empty((len(roots), 4), dtype=np.int64)
+        grouped[:, :2] = np.iinfo(np.int64).max
+        grouped[:, 2:] = np.iinfo(np.int64).min
+        np.minimum.at(grouped[:, :2], members, merged[:, :2])
+        np.maximum.at(grouped[:, 2:], members, merged[:, 2:])
+        merged = grouped
+    return merged
+
+
+class IncrementalContourAnalyzer:
+    """Re-analyzes only the changed parts of consecutive binary masks."""
+
+    def __init__(
+        self,
+        area_threshold: int = AREA_THRESHOLD,
+        tile_size: int = TILE_SIZE,
+        full_analysis_fraction: float = FULL_ANALYSIS_FRACTION,
+        full_analysis_regions: int = FULL_ANALYSIS_REGIONS,
+    ):
+        """
+        Args:
+            area_threshold (int): Minimum contour area to consider.
+            tile_size (int): Side length in pixels of the change detection tiles.
+            full_analysis_fraction (float): Fraction of the frame to re-extract
+                (or of changed tiles) above which the whole frame is re-analyzed.
+            full_analysis_regions (int): Number of separate changed regions above
+                which the whole frame is re-analyzed.
+
+        Raises:
+            ValueError: If tile_size is not positive.
+        """
+        if tile_size < 1:
+            raise ValueError(f"tile_size must be positive, got {tile_size}")
+        self.area_threshold = area_threshold
+        self.tile_size = tile_size
+        self.full_analysis_fraction = full_analysis_fraction
+        self.full_analysis_regions = full_analysis_regions
+
+        # Counters
+        self.frames_analyzed: int = 0
+        self.full_analyses: int = 0  # Frames analyzed without the cache
+        self.last_dirty_fraction: float = 0.0  # Fraction of pixels re-extracted
+
+        self._mask: Optional[np.ndarray] = None  # Previous binary mask
+        # Every external blob of the previous mask (also those below the area
+        # threshold, since they can merge with changed blobs): its
+        # [x0, y0, x1, y1] box and its result (None if below the threshold)
+        self._boxes = np.empty((0, 4), dtype=np.int64)
+        self._records: List[Optional[dict]] = []
+
+    def analyze(self, image: np.ndarray) -> list:
+        """
+        Analyzes a binary frame, reusing the results of unchanged areas.
+
+        Args:
+            image (numpy.ndarray): A binary image (0 for background, 255 for foreground).
+
+        Returns:
+            list: The same contour dictionaries as analyze_contours() would
+                  return (bbox, area, corners, approx), possibly in a different order.
+        """
+        if image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        self.frames_analyzed += 1
+
+        if self._mask is None or self._mask.shape != image.shape:
+            self._mask = image.copy()
+            regions = [[0, 0, image.shape[1], image.shape[0]]]
+            keep = np.zeros(0, dtype=bool)
+            self.full_analyses += 1
+        else:
+            regions = self._dirty_regions(image)
+            np.copyto(self._mask, image)
+            keep = np.ones(len(self._records), dtype=bool)
+            if regions is None:
+                regions = [[0, 0, image.shape[1], image.shape[0]]]
+                keep[:] = False
+                self.full_analyses += 1
+            else:
+                regions = self._grow_regions(regions, keep)
+                if regions is None:
+                    regions = [[0, 0, image.shape[1], image.shape[0]]]
+                    keep[:] = False
+                    self.full_analyses += 1
+
+        boxes = [self._boxes[keep]]
+        records = [record for record, kept in zip(self._records, keep) if kept]
+        reanalyzed = 0
+        for x0, y0, x1, y1 in regions:
+            reanalyzed += (x1 - x0) * (y1 - y0)
+            contours, _ = cv2.findContours(
+                self._mask[y0:y1, x0:x1],
+                cv2.RETR_EXTERNAL,
+                cv2.CHAIN_APPROX_SIMPLE,
+                offset=(x0, y0),
+            )
+            rects = [cv2.boundingRect(contour) for contour in contours]
+            for contour, (x, y, w, h) in zip(contours, rects):
+                area = cv2.contourArea(contour)
+                if area < self.area_threshold:
+                    records.append(None)
+                    continue
+                epsilon = APPROX_EPSILON * cv2.arcLength(contour, True)
+                approx = cv2.approxPolyDP(contour, epsilon, True)
+                records.append(
+                    {
+                        "bbox": (x, y, w, h),
+                        "area": area,
+                        "corners": len(approx),
+                        "approx": approx,
+                    }
+                )
+            region_boxes = np.array(rects, dtype=np.int64).reshape(-1, 4)
+            # (x, y, w, h) -> (x0, y0, x1, y1)
+            region_boxes[:, 2:] += region_boxes[:, :2]
+            boxes.append(region_boxes)
+
+        self._boxes = np.concatenate(boxes)
+        self._records = records
+        self.last_dirty_fraction = reanalyzed / image.size
+        return [record for record in records if record is not None]
+
+    def reset(self) -> None:
+        """Forgets the previous frame; the next frame is analyzed in full."""
+        self._mask = None
+        self._boxes = np.empty((0, 4), dtype=np.int64)
+        self._records = []
+
+    def _dirty_regions(self, image: np.ndarray) -> Optional[list]:
+        """
+        Finds the rectangles covering the groups of changed tiles.
+
+        Returns:
+            list: [x0, y0, x1, y1] rectangles, or None if so many tiles changed,
+                  or they form so many separate groups, that a full analysis
+                  is cheaper.
+        """
+        height, width = image.shape
+        changed = cv2.compare(image, self._mask, cv2.CMP_NE)
+        if not cv2.countNonZero(changed):
+            return []
+
+        # Maximum over each band of tile_size rows (one vectorized reduction for
+        # the full bands, plus the partial last band), then over each tile column
+        size = self.tile_size
+        full = height // size * size
+        bands = changed[:full].reshape(-1, size, width).max(axis=1)
+        if full < height:
+            bands = np.vstack([bands, changed[full:].max(axis=0)])
+        tiles = np.maximum.reduceat(bands, np.arange(0, width, size), axis=1)
+        if np.count_nonzero(tiles) > self.full_analysis_fraction * tiles.size:
+            return None
+
+        # Each 8-connected group of dirty tiles becomes one rectangle
+        count, _, stats, _ = cv2.connectedComponentsWithStats(
+            tiles, connectivity=8, ltype=cv2.CV_32S
+        )
+        if count - 1 > self.full_analysis_regions:
+            return None
+        regions = []
+        for x, y, w, h, _ in stats[1:count].tolist():
+            regions.append(
+                [
+                    x * size,
+                    y * size,
+                    min((x + w) * size, width),
+                    min((y + h) * size, height),
+                ]
+            )
+        return regions
+
+    def _grow_regions(self, regions: list, keep: np.ndarray) -> Optional[list]:
+        """
+        Grows the regions over the cached blobs they touch until they are stable.
+
+        Blobs touched by a region are marked as not kept in keep (in place).
+
+        Returns:
+            list: The grown [x0, y0, x1, y1] regions, or None as soon as they
+                  cover so much of the frame that a full analysis is cheaper.
+        """
+        boxes = self._boxes
+        limit = self.full_analysis_fraction * self._mask.size
+        while True:
+            regions = _merge_rectangles(regions)
+            x0, y0, x1, y1 = regions.T
+            if np.sum((x1 - x0) * (y1 - y0)) > limit:
+                return None
+
+            # touched[i, j]: region i touches blob j; blob boxes are grown by one
+            # pixel, so 8-neighbours of a region count
+            touched = (
+                keep
+                & (boxes[:, 0] <= x1[:, None])
+                & (boxes[:, 2] >= x0[:, None])
+                & (boxes[:, 1] <= y1[:, None])
+                & (boxes[:, 3] >= y0[:, None])
+            )
+            hit = touched.any(axis=0)
+            if not hit.any():
+                return regions.tolist()
+            keep &= ~hit
+
+            # Grow every region over the blobs it touched
+            for i in np.flatnonzero(touched.any(axis=1)).tolist():
+                grown = boxes[touched[i]]
+                regions[i, :2] = np.minimum(regions[i, :2], grown[:, :2].min(axis=0))
+                regions[i, 2:] = np.maximum(regions[i, 2:], grown[:, 2:].max(axis=0))
+            regions = regions.tolist()
@@ -0,0 +1,127 @@
+"""
+Full-Skeleton Joint Angles
+
+Computes every standard joint angle (elbows, shoulders, hips, knees and
+ankles, on both sides) from MediaPipe's 33-landmark pose layout.
+
+The landmark index triplets of all joints are precomputed once, so the angles
+of a whole (frames x 33 x D) landmark array are obtained with one gather and
+one vectorized calculate_angles() call. Low-confidence joints are masked to
+NaN instead of branching per joint.
+
+Example usage:
+    engine = JointAngleEngine()
+    frame, hand_raised = detector.process_frame(frame)
+    landmarks = detector.last_landmarks  # (33, 4): x, y, z, visibility
+    angles = engine.compute(landmarks[:, :3], visibility=landmarks[:, 3])
+    left_knee = angles[engine.joint_names.index("left_knee")]
+
+Topics: Geometry on body keypoints, vectorization
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .pose_angle_calculator import calculate_angles
+
+NUM_LANDMARKS: int = 33  # Landmarks in MediaPipe Pose
+
+# MediaPipe Pose landmark indices (see mp.solutions.pose.PoseLandmark)
+LEFT_SHOULDER, RIGHT_SHOULDER = 11, 12
+LEFT_ELBOW, RIGHT_ELBOW = 13, 14
+LEFT_WRIST, RIGHT_WRIST = 15, 16
+LEFT_HIP, RIGHT_HIP = 23, 24
+LEFT_KNEE, RIGHT_KNEE = 25, 26
+LEFT_ANKLE, RIGHT_ANKLE = 27, 28
+LEFT_FOOT_INDEX, RIGHT_FOOT_INDEX = 31, 32
+
+# Each joint angle is measured at the middle landmark of its triplet
+JOINT_TRIPLETS: Dict[str, Tuple[int, int, int]] = {
+    "left_elbow": (LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST),
+    "right_elbow": (RIGHT_SHOULDER, RIGHT_ELBOW, RIGHT_WRIST),
+    "left_shoulder": (LEFT_ELBOW, LEFT_SHOULDER, LEFT_HIP),
+    "right_shoulder": (RIGHT_ELBOW, RIGHT_SHOULDER, RIGHT_HIP),
+    "left_hip": (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),
+    "right_hip": (RIGHT_SHOULDER, RIGHT_HIP, RIGHT_KNEE),
+    "left_knee": (LEFT_HIP, LEFT_KNEE, LEFT_ANKLE),
+    "right_knee": (RIGHT_HIP, RIGHT_KNEE, RIGHT_ANKLE),
+    "left_ankle": (LEFT_KNEE, LEFT_ANKLE, LEFT_FOOT_INDEX),
+    "right_ankle": (RIGHT_KNEE, RIGHT_ANKLE, RIGHT_FOOT_INDEX),
+}
+
+MIN_VISIBILITY: float = 0.5  # Landmarks below this visibility are unreliable
+
+
+class JointAngleEngine:
+    """Computes a fixed set of joint angles for batches of pose landmarks."""
+
+    def __init__(
+        self,
+        joints: Optional[Sequence[str]] = None,
+        min_visibility: float = MIN_VISIBILITY,
+    ):
+        """
+        Initialize the engine and precompute the landmark index triplets.
+
+        Args:
+            joints (Sequence[str], optional): Names of the joints to compute, as
+                keys of JOINT_TRIPLETS. Defaults to all of them.
+            min_visibility (float): Joints with any landmark below this
+                visibility are reported as NaN.
+
+        Raises:
+            KeyError: If a joint name is not in JOINT_TRIPLETS.
+        """
+        self.joint_names: list = list(JOINT_TRIPLETS if joints is None else joints)
+        self.min_visibility: float = min_visibility
+        self._triplets = np.array(
+            [JOINT_TRIPLETS[name] for name in self.joint_names], dtype=np.intp
+        )
+
+    def compute(
+        self, landmarks: np.ndarray, visibility: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Compute all joint angles for one or more frames.
+
+        Args:
+            landmarks (numpy.ndarray): Landmark coordinates of shape (33, D) or
+                (frames, 33, D), with D = 2 (x, y) or 3 (x, y, z).
+            visibility (numpy.ndarray, optional): Landmark visibility scores of
+                shape (33,) or (frames, 33).
+
+        Returns:
+            numpy.ndarray: Angles in degrees, of shape (joints,) or
+                           (frames, joints), ordered as joint_names. Joints with
+                           a low-visibility landmark are NaN.
+
+        Raises:
+            ValueError: If the landmark or visibility arrays have the wrong shape.
+        """
+        points = np.asarray(landmarks, dtype=np.float64)
+        single_frame = points.ndim == 2
+        if single_frame:
+            points = points[np.newaxis]
+        if points.ndim != 3 or points.shape[1] != NUM_LANDMARKS:
+            raise ValueError(
+                f"Expected landmarks of shape (frames, {NUM_LANDMARKS}, D), "
+                f"got {np.shape(landmarks)}"
+            )
+
+        num_frames, num_joints = len(points), len(self.joint_names)
+        dims = points.shape[2]
+
+        # Gather every triplet of every frame at once: (frames, joints, 3, D)
+        gathered = points[:, self._triplets]
+        angles = calculate_angles(gathered.reshape(-1, 3, dims))
+        angles = angles.reshape(num_frames, num_joints)
+
+        if visibility is not None:
+            scores = np.asarray(visibility, dtype=np.float64).reshape(
+                num_frames, NUM_LANDMARKS
+            )
+            hidden = (scores[:, self._triplets] < self.min_visibility).any(axis=2)
+            angles[hidden] = np.nan
+
+        return angles[0] if single_frame else angles
@@ -14,7 +14,12 @@ Topics: Video processing basics
 
 import cv2
 import logging
+import numpy as np
 import os
+from typing import Optional
+from .capture import ThreadedCapture
+from .motion_recorder import MotionRecorder
+from .overlay import OverlayRenderer, draw_boxes
 
 # Suppress the error message related to missing platform plugins in Qt
 # qt.qpa.plugin: Could not find the Qt platform plugin "wayland" in ""
@@ -24,6 +29,22 @@ os.environ["QT_QPA_PLATFORM"] = "xcb"
 THRESHOLD: int = 25  # Pixel intensity change required to consider motion
 MIN_AREA: int = 500  # Minimum area in pixels for a contour to be considered motion
 
+# Cheap pre-check: compare only every PRECHECK_STRIDE-th pixel along each axis and
+# skip the full detection when fewer than PRECHECK_MIN_CHANGED samples changed
+PRECHECK_STRIDE: int = 4
+PRECHECK_MIN_CHANGED: int = 8
+
+# Background models for MotionDetector.update(): "frame" compares with the previous
+# frame, "running_average" with an exponentially weighted average of past frames,
+# and "mog2"/"knn" use OpenCV's Gaussian-mixture / k-nearest-neighbours subtractors
+BACKGROUND_MODELS = ("frame", "running_average", "mog2", "knn")
+BACKGROUND_LEARNING_RATE: float = 0.05  # Weight of each new frame in the average
+
+# Ways to turn the motion mask into regions: "contours" (findContours + contourArea
+# per contour) or "components" (connectedComponentsWithStats, filtered in one
+# vectorized step; faster on noisy masks with thousands of specks)
+REGION_METHODS = ("contours", "components")
+
 # Setup logging for the application
 logging.basicConfig(
     level=logging.INFO,
@@ -50,8 +71,109 @@ def setup_camera() -> cv2.VideoCapture:
     return cap
 
 
+def _reduction_steps(downscale: int) -> list:
+    """
+    Splits a downscale factor into per-step factors.
+
+    OpenCV's area resampling has a fast path for halving only, so factors of
+    two are applied as a pyramid of halvings (floor(floor(n / 2) / 2) equals
+    floor(n / 4), so the result has the same size as a single step).
+    """
+    steps = []
+    while downscale % 2 == 0:
+        steps.append(2)
+        downscale //= 2
+    if downscale > 1:
+        steps.append(downscale)
+    return steps
+
+
+def downscale_frame(frame, downscale: int, buffers: Optional[list] = None):
+    """
+    Shrinks a frame by an integer factor using area averaging.
+
+    Args:
+        frame (numpy.ndarray): The frame to shrink.
+        downscale (int): Integer reduction factor per axis (1 returns the frame as-is).
+        buffers (list, optional): Reusable buffers, one per reduction step
+            (see _reduction_steps). Entries may start as None; they are
+            replaced whenever a buffer has to be (re)allocated.
+
+    Returns:
+        numpy.ndarray: The reduced frame.
+    """
+    for i, step in enumerate(_reduction_steps(downscale)):
+        size = (frame.shape[1] // step, frame.shape[0] // step)
+        dst = buffers[i] if buffers is not None else None
+        frame = cv2.resize(frame, size, dst=dst, interpolation=cv2.INTER_AREA)
+        if buffers is not None:
+            buffers[i] = frame
+    return frame
+
+
+def upscale_regions(regions: list, downscale: int) -> list:
+    """
+    Maps bounding boxes found on a downscaled frame back to full-resolution coordinates.
+
+    Args:
+        regions (list): Bounding boxes (x, y, w, h) on the reduced frame.
+        downscale (int): The factor the frame was reduced by.
+
+    Returns:
+        list: The bounding boxes in full-resolution coordinates.
+    """
+    if downscale == 1:
+        return regions
+    return [
+        (x * downscale, y * downscale, w * downscale, h * downscale)
+        for x, y, w, h in regions
+    ]
+
+
+def extract_regions(
+    mask, min_area=MIN_AREA, method: str = "contours", labels=None
+) -> list:
+    """
+    Extracts bounding boxes of the large enough blobs in a binary motion mask.
+
+    With method="components", a blob's area is its pixel count (slightly larger
+    than the contour area used by "contours"), and blobs nested inside holes of
+    other blobs get their own regions.
+
+    Args:
+        mask (numpy.ndarray): Binary mask (0 or 255).
+        min_area (float): The minimum area in pixels for a blob to be considered motion.
+        method (str): One of REGION_METHODS.
+        labels (numpy.ndarray, optional): Reusable int32 label buffer for "components".
+
+    Returns:
+        list: A list of bounding boxes (x, y, w, h).
+
+    Raises:
+        ValueError: If the method is unknown.
+    """
+    if method == "contours":
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        return [cv2.boundingRect(c) for c in contours if cv2.contourArea(c) >= min_area]
+    if method == "components":
+        _, _, stats, _ = cv2.connectedComponentsWithStats(
+            mask, labels, connectivity=8, ltype=cv2.CV_32S
+        )
+        stats = stats[1:]  # Label 0 is the background
+        keep = stats[:, cv2.CC_STAT_AREA] >= min_area
+        return [tuple(box) for box in stats[keep, :4].tolist()]
+    raise ValueError(
+        f"Unknown region method: {method} (expected one of {', '.join(REGION_METHODS)})"
+    )
+
+
 def detect_motion(
-    prev_frame, current_frame, threshold=THRESHOLD, min_area=MIN_AREA
+    prev_frame,
+    current_frame,
+    threshold=THRESHOLD,
+    min_area=MIN_AREA,
+    downscale=1,
+    region_method="contours",
 ) -> list:
     """
     Detects motion by comparing the current and previous frames.
@@ -61,10 +183,20 @@ def detect_motion(
         current_frame (numpy.ndarray): The current frame in grayscale.
         threshold (int): The pixel intensity change required to consider motion.
         min_area (int): The minimum area in pixels for a contour to be considered motion.
+        downscale (int): Run detection on frames reduced by this factor per axis.
+            Bounding boxes are still returned in full-resolution coordinates and
+            min_area keeps its full-resolution meaning.
+        region_method (str): How regions are extracted from the motion mask,
+            one of REGION_METHODS (see extract_regions()).
 
     Returns:
         list: A list of bounding boxes for the regions with detected motion.
     """
+    # Optionally work on reduced frames; min_area shrinks with the pixel count.
+    prev_frame = downscale_frame(prev_frame, downscale)
+    current_frame = downscale_frame(current_frame, downscale)
+    min_area = min_area / downscale**2
+
     # Compute the absolute difference between the previous and current grayscale frames.
     frame_delta = cv2.absdiff(prev_frame, current_frame)
 
@@ -73,14 +205,236 @@ def detect_motion(
     thresh = cv2.dilate(thresh, None, iterations=2)
 
     # Extract contours (connected components) and keep only those above the minimum area.
-    contours, _ = cv2.findContours(
-        thresh.copy(), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
-    )
-    motion_regions = [
-        cv2.boundingRect(c) for c in contours if cv2.contourArea(c) >= min_area
-    ]
+    # findContours no longer modifies its input (OpenCV >= 3.2), so no copy is needed.
+    motion_regions = extract_regions(thresh, min_area, region_method)
 
-    return motion_regions
+    return upscale_regions(motion_regions, downscale)
+
+
+class MotionDetector:
+    """
+    Stateful counterpart of detect_motion() for continuous video streams.
+
+    Owns preallocated work buffers and a prebuilt dilation kernel, and writes
+    every intermediate image into them, so no per-frame arrays are allocated
+    for the delta and mask images. Buffers are (re)allocated only when the
+    frame size changes.
+
+    An optional pre-check compares a subsampled grid of the two frames and
+    skips the expensive absdiff/threshold/dilate/findContours chain when too
+    few samples changed. The frames_processed and frames_skipped counters
+    record how often it fires.
+
+    In streaming use (update()), the reference can also be a background model
+    instead of the previous frame, which catches slow movers and is less
+    sensitive to lighting flicker. detect() always uses frame differencing.
+    """
+
+    def __init__(
+        self,
+        threshold: int = THRESHOLD,
+        min_area: int = MIN_AREA,
+        downscale: int = 1,
+        precheck_stride: int = 0,
+        precheck_min_changed: int = PRECHECK_MIN_CHANGED,
+        background: str = "frame",
+        learning_rate: Optional[float] = None,
+        region_method: str = "contours",
+    ):
+        """
+        Args:
+            threshold (int): The pixel intensity change required to consider motion.
+            min_area (int): The minimum area in pixels for a contour to be considered motion.
+            downscale (int): Run detection on frames reduced by this factor per
+                axis (e.g. 4 for a 4K feed); boxes are mapped back to full resolution.
+            precheck_stride (int): Sampling step of the pre-check grid (0 disables
+                the pre-check, so every frame gets the full detection).
+            precheck_min_changed (int): Minimum number of changed grid samples
+                for a frame to get the full detection.
+            background (str): Reference used by update(), one of BACKGROUND_MODELS.
+                The pre-check only applies to "frame" and "running_average".
+            learning_rate (float, optional): Adaptation speed of the background
+                model. Defaults to BACKGROUND_LEARNING_RATE for "running_average"
+                and to OpenCV's automatic rate for "mog2" and "knn".
+            region_method (str): How regions are extracted from the motion mask,
+                one of REGION_METHODS (see extract_regions()).
+
+        Raises:
+            ValueError: If downscale is smaller than 1, precheck_stride is negative,
+                or the background model or region method is unknown.
+        """
+        if downscale < 1:
+            raise ValueError(f"downscale must be at least 1, got {downscale}")
+        if precheck_stride < 0:
+            raise ValueError(
+                f"precheck_stride must not be negative, got {precheck_stride}"
+            )
+        if background not in BACKGROUND_MODELS:
+            raise ValueError(
+                f"Unknown background model: {background} "
+                f"(expected one of {', '.join(BACKGROUND_MODELS)})"
+            )
+        if region_method not in REGION_METHODS:
+            raise ValueError(
+                f"Unknown region method: {region_method} "
+                f"(expected one of {', '.join(REGION_METHODS)})"
+            )
+        self.threshold = threshold
+        self.min_area = min_area
+        self.downscale = downscale
+        self.precheck_stride = precheck_stride
+        self.precheck_min_changed = precheck_min_changed
+        self.background = background
+        if learning_rate is None:
+            learning_rate = (
+                BACKGROUND_LEARNING_RATE if background == "running_average" else -1.0
+            )
+        self.learning_rate = learning_rate
+        self.region_method = region_method
+
+        # Frames that went through the full detection / were rejected by the pre-check
+        self.frames_processed: int = 0
+        self.frames_skipped: int = 0
+
+        # 3x3 rectangle: the same kernel cv2.dilate uses when given None
+        self.kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+
+        self._delta: Optional[np.ndarray] = None  # absdiff, then thresholded in place
+        self._mask: Optional[np.ndarray] = None  # Dilated motion mask
+        self._labels: Optional[np.ndarray] = None  # Component labels ("components")
+        # Per-step downscaling buffers for the previous and current frames
+        self._reduced = [
+            [None] * len(_reduction_steps(downscale)),
+            [None] * len(_reduction_steps(downscale)),
+        ]
+        self._previous: Optional[np.ndarray] = None  # Last (reduced) frame of update()
+        self._grid = [None, None]  # Pre-check samples of the previous/current frames
+
+        # Background model state: float32 running average (and its uint8 view),
+        # or an OpenCV background subtractor
+        self._average: Optional[np.ndarray] = None
+        self._average_u8: Optional[np.ndarray] = None
+        self._subtractor = None
+        if background == "mog2":
+            self._subtractor = cv2.createBackgroundSubtractorMOG2(detectShadows=False)
+        elif background == "knn":
+            self._subtractor = cv2.createBackgroundSubtractorKNN(detectShadows=False)
+
+    def detect(self, prev_frame, current_frame) -> list:
+        """
+        Detects motion by comparing the current and previous frames.
+
+        Returns exactly the same regions as detect_motion() with the same settings.
+
+        Args:
+            prev_frame (numpy.ndarray): The previous frame in grayscale.
+            current_frame (numpy.ndarray): The current frame in grayscale.
+
+        Returns:
+            list: A list of bounding boxes for the regions with detected motion.
+        """
+        prev_frame = self._reduce(prev_frame, 0)
+        current_frame = self._reduce(current_frame, 1)
+        return self._detect_reduced(prev_frame, current_frame)
+
+    def update(self, frame) -> list:
+        """
+        Detects motion between the given frame and the previous one passed to update().
+
+        The previous frame is kept in an internal buffer (at the reduced
+        resolution), so the caller may reuse its own frame buffer. With a
+        background model, the frame is compared with the model instead and
+        then folded into it.
+
+        Args:
+            frame (numpy.ndarray): The current frame in grayscale.
+
+        Returns:
+            list: A list of bounding boxes for the regions with detected motion
+                  (empty for the first frame).
+        """
+        frame = self._reduce(frame, 1)
+        first_frame = self._previous is None or self._previous.shape != frame.shape
+        if first_frame:
+            self._previous = frame.copy()
+
+        if self.background == "frame":
+            if first_frame:
+                return []
+            motion_regions = self._detect_reduced(self._previous, frame)
+            np.copyto(self._previous, frame)
+            return motion_regions
+
+        if self.background == "running_average":
+            if first_frame:
+                self._average = frame.astype(np.float32)
+                return []
+            self._average_u8 = cv2.convertScaleAbs(self._average, dst=self._average_u8)
+            motion_regions = self._detect_reduced(self._average_u8, frame)
+            cv2.accumulateWeighted(frame, self._average, self.learning_rate)
+            return motion_regions
+
+        # OpenCV subtractors must see every frame, so the pre-check is bypassed
+        self._allocate_masks(frame)
+        self._subtractor.apply(frame, self._delta, self.learning_rate)
+        if first_frame:
+            return []
+        self.frames_processed += 1
+        return self._extract_regions()
+
+    def _reduce(self, frame, slot: int):
+        """Downscales a frame into one of the two sets of reusable buffers."""
+        return downscale_frame(frame, self.downscale, buffers=self._reduced[slot])
+
+    def _passes_precheck(self, prev_frame, current_frame) -> bool:
+        """Counts changed pixels on a subsampled grid of both frames."""
+        height, width = current_frame.shape[:2]
+        size = (
+            max(width // self.precheck_stride, 1),
+            max(height // self.precheck_stride, 1),
+        )
+        for slot, frame in enumerate((prev_frame, current_frame)):
+            self._grid[slot] = cv2.resize(
+                frame, size, dst=self._grid[slot], interpolation=cv2.INTER_NEAREST
+            )
+
+        changes = cv2.absdiff(self._grid[0], self._grid[1], dst=self._grid[0])
+        cv2.threshold(changes, self.threshold, 255, cv2.THRESH_BINARY, dst=changes)
+        return cv2.countNonZero(changes) >= self.precheck_min_changed
+
+    def _detect_reduced(self, prev_frame, current_frame) -> list:
+        """Runs the diff/threshold/dilate/contour chain on (reduced) frames."""
+        if self.precheck_stride and not self._passes_precheck(
+            prev_frame, current_frame
+        ):
+            self.frames_skipped += 1
+            return []
+        self.frames_processed += 1
+
+        self._allocate_masks(current_frame)
+        cv2.absdiff(prev_frame, current_frame, dst=self._delta)
+        cv2.threshold(
+            self._delta, self.threshold, 255, cv2.THRESH_BINARY, dst=self._delta
+        )
+        return self._extract_regions()
+
+    def _allocate_masks(self, frame) -> None:
+        """(Re)allocates the mask buffers when the frame size changes."""
+        if self._delta is None or self._delta.shape != frame.shape:
+            self._delta = np.empty_like(frame)
+            self._mask = np.empty_like(frame)
+            if self.region_method == "components":
+                self._labels = np.empty(frame.shape, dtype=np.int32)
+
+    def _extract_regions(self) -> list:
+        """Dilates the binary motion mask and returns boxes of large enough blobs."""
+        cv2.dilate(self._delta, self.kernel, dst=self._mask, iterations=2)
+
+        min_area = self.min_area / self.downscale**2
+        motion_regions = extract_regions(
+            self._mask, min_area, self.region_method, labels=self._labels
+        )
+        return upscale_regions(motion_regions, self.downscale)
 
 
 def draw_bounding_boxes(frame, regions):
@@ -91,17 +445,26 @@ def draw_bounding_boxes(frame, regions):
         frame (numpy.ndarray): The current frame of the video.
         regions (list): A list of bounding boxes to draw.
     """
-    for x, y, w, h in regions:
-        cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
+    draw_boxes(frame, regions)
 
 
-def run_motion_detector():
+def run_motion_detector(record_dir: Optional[str] = None):
     """
     Runs the motion detection system, processing webcam frames in real-time.
     Detects motion and displays bounding boxes around the moving regions.
+
+    Frames are grabbed on a background thread that keeps only the latest one,
+    so a slow frame never makes the loop fall behind the camera.
+
+    Args:
+        record_dir (str, optional): If given, video segments around the motion
+            (with pre- and post-roll) are written to this directory.
     """
-    cap = setup_camera()
-    prev_frame = None
+    cap = ThreadedCapture(setup_camera())
+    detector = MotionDetector(precheck_stride=PRECHECK_STRIDE)
+    recorder = MotionRecorder(record_dir) if record_dir else None
+    renderer = OverlayRenderer()
+    processed = None
 
     try:
         while True:
@@ -110,24 +473,23 @@ def run_motion_detector():
                 logging.warning("Failed to read frame from webcam")
                 break
 
-            # Preprocess frame: convert to grayscale.
-            processed = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-
-            if prev_frame is None:
-                prev_frame = processed
-                continue
+            # Preprocess frame: convert to grayscale (reusing the buffer after the first frame).
+            processed = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=processed)
 
             # Detect motion between the previous and current frame
-            motion_regions = detect_motion(prev_frame, processed)
-            prev_frame = processed
+            motion_regions = detector.update(processed)
+
+            # Record the frame before the boxes are drawn onto it
+            if recorder is not None:
+                recorder.update(frame, bool(motion_regions))
 
             if motion_regions:
                 logging.info(f"Motion detected in {len(motion_regions)} region(s)")
-                draw_bounding_boxes(frame, motion_regions)
+                renderer.add_boxes(motion_regions)
             else:
                 logging.debug("No significant motion detected")
 
-            cv2.imshow("Motion Detection", frame)
+            cv2.imshow("Motion Detection", renderer.render(frame))
 
             # Exit on 'q' key press
             if cv2.waitKey(1) & 0xFF == ord("q"):
@@ -138,7 +500,21 @@ def run_motion_detector():
         # Clean up resources
         cap.release()
         cv2.destroyAllWindows()
+        if recorder is not None:
+            recorder.close()
+            logging.info(
+                f"Recorded {len(recorder.segments)} segment(s), "
+                f"dropped {recorder.frames_dropped} frame(s) while writing"
+            )
+        logging.info(
+            f"Processed {detector.frames_processed} frame(s), "
+            f"skipped {detector.frames_skipped} static frame(s)"
+        )
+        logging.info(
+            f"Dropped {cap.frames_dropped} stale frame(s), average "
+            f"capture-to-process latency {1000 * cap.average_latency:.1f} ms"
+        )
 
 
 if __name__ == "__main__":
-    run_motion_detector()
+    run_motion_detector(os.environ.get("MOTION_RECORD_DIR"))
@@ -0,0 +1,229 @@
+"""
+Motion-Triggered Segment Recording
+
+Recording everything and searching later wastes disk bandwidth and storage.
+MotionRecorder keeps the last few seconds of frames in memory and writes a
+video segment only while motion is reported, plus a configurable post-roll:
+
+- Pre-roll: the most recent pre_roll frames are kept in a ring of slots, so a
+  segment starts a little before the motion was first detected.
+- Post-roll: recording continues for post_roll frames after the last frame
+  with motion, so short pauses do not split a segment.
+- All frame memory is preallocated on the first frame as a pool of slots;
+  update() copies the frame into a free slot and never allocates.
+- Encoding and disk I/O happen on a background writer thread, so update()
+  never blocks. If the writer falls so far behind that no slot is free, the
+  frame is dropped and counted instead.
+
+Example usage:
+    recorder = MotionRecorder("recordings", fps=30, pre_roll=60, post_roll=90)
+    while True:
+        ...
+        recorder.update(frame, motion=bool(detector.update(gray)))
+    recorder.close()
+
+Topics: Concurrency, memory management, video processing
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from typing import List, Optional
+
+import cv2
+import numpy as np
+
+# Default segment encoding; MJPG in an AVI container is available in every OpenCV build
+FOURCC: str = "MJPG"
+EXTENSION: str = ".avi"
+
+# Writer commands
+_OPEN, _FRAME, _CLOSE, _STOP = range(4)
+
+
+class MotionRecorder:
+    """Writes video segments around motion, with an in-memory pre-roll buffer."""
+
+    def __init__(
+        self,
+        output_dir: str,
+        fps: float = 30.0,
+        pre_roll: int = 60,
+        post_roll: int = 90,
+        max_pending: int = 60,
+        fourcc: str = FOURCC,
+        extension: str = EXTENSION,
+    ):
+        """
+        Args:
+            output_dir (str): Directory the segments are written to (created if needed).
+            fps (float): Frame rate stored in the segment files.
+            pre_roll (int): Number of frames before the motion to include.
+            post_roll (int): Number of frames after the last motion to include.
+            max_pending (int): Number of frames that may wait for the writer
+                thread before new frames are dropped.
+            fourcc (str): Four-character code of the video codec.
+            extension (str): Segment file extension matching the codec's container.
+
+        Raises:
+            ValueError: If fps or max_pending is not positive, or pre_roll or
+                post_roll is negative.
+        """
+        if fps <= 0:
+            raise ValueError(f"fps must be positive, got {fps}")
+        if pre_roll < 0 or post_roll < 0:
+            raise ValueError(
+                f"pre_roll and post_roll must not be negative, got {pre_roll}, {post_roll}"
+            )
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be positive, got {max_pending}")
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.fps = fps
+        self.pre_roll = pre_roll
+        self.post_roll = post_roll
+        self.max_pending = max_pending
+        self.fourcc = cv2.VideoWriter_fourcc(*fourcc)
+        self.extension = extension
+
+        # Counters
+        self.frames_written: int = 0  # Frames encoded by the writer thread
+        self.frames_dropped: int = 0  # Frames lost because the writer fell behind
+        self.segments: List[str] = []  # Paths of the started segments
+
+        self._slots: Optional[np.ndarray] = None  # (pre_roll + max_pending, *shape)
+        self._free: queue.SimpleQueue = queue.SimpleQueue()  # Indices of free slots
+        self._pre_roll: deque = deque()  # Slot indices of the buffered frames
+        self._commands: queue.SimpleQueue = queue.SimpleQueue()
+        self._recording = False
+        self._frames_left = 0  # Post-roll frames left before the segment closes
+        self._writer: Optional[threading.Thread] = None
+
+    @property
+    def recording(self) -> bool:
+        """True while a segment is open."""
+        return self._recording
+
+    def update(self, frame: np.ndarray, motion: bool) -> bool:
+        """
+        Add a frame to the pre-roll buffer or the open segment.
+
+        Args:
+            frame (numpy.ndarray): The frame to record (BGR or grayscale, uint8).
+            motion (bool): Whether motion was detected in this frame
+                (e.g. bool(detect_motion(...))).
+
+        Returns:
+            bool: True if the frame is part of a segment.
+
+        Raises:
+            ValueError: If the frame shape or dtype differs from the first frame.
+        """
+        if self._slots is None:
+            self._allocate(frame)
+        elif frame.shape != self._slots.shape[1:] or frame.dtype != self._slots.dtype:
+            raise ValueError(
+                f"Frame {frame.shape} {frame.dtype} does not match the recorder's "
+                f"{self._slots.shape[1:]} {self._slots.dtype}"
+            )
+
+        if motion and not self._recording:
+            self._start_segment()
+        elif not motion and self._recording:
+            self._frames_left -= 1
+            if self._frames_left < 0:
+                self._stop_segment()
+        if motion:
+            self._frames_left = self.post_roll
+
+        try:
+            slot = self._free.get_nowait()
+        except queue.Empty:
+            # The writer is behind; dropping keeps the detection loop real-time
+            self.frames_dropped += 1
+            return self._recording
+        np.copyto(self._slots[slot], frame)
+
+        if self._recording:
+            self._commands.put((_FRAME, slot))
+        elif self.pre_roll:
+            self._pre_roll.append(slot)
+            if len(self._pre_roll) > self.pre_roll:
+                self._free.put(self._pre_roll.popleft())
+        else:
+            self._free.put(slot)
+        return self._recording
+
+    def close(self) -> None:
+        """Closes the open segment and waits for the writer to finish."""
+        if self._recording:
+            self._stop_segment()
+        if self._writer is not None:
+            self._commands.put((_STOP, None))
+            self._writer.join()
+            self._writer = None
+
+    def __enter__(self) -> "MotionRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _allocate(self, frame: np.ndarray) -> None:
+        """Preallocates the frame slots and starts the writer thread."""
+        count = self.pre_roll + self.max_pending
+        self._slots = np.empty((count,) + frame.shape, dtype=frame.dtype)
+        for slot in range(count):
+            self._free.put(slot)
+        self._writer = threading.Thread(target=self._write_segments, daemon=True)
+        self._writer.start()
+
+    def _start_segment(self) -> None:
+        """Opens a new segment and hands it the pre-roll frames."""
+        name = f"motion_{time.strftime('%Y%m%d-%H%M%S')}_{len(self.segments):04d}"
+        path = os.path.join(self.output_dir, name + self.extension)
+        self.segments.append(path)
+        self._commands.put((_OPEN, path))
+        while self._pre_roll:
+            self._commands.put((_FRAME, self._pre_roll.popleft()))
+        self._recording = True
+        logging.info(f"[MotionRecorder] Recording {path}")
+
+    def _stop_segment(self) -> None:
+        self._commands.put((_CLOSE, None))
+        self._recording = False
+
+    def _write_segments(self) -> None:
+        """Writer thread: encodes the queued frames and returns their slots."""
+        writer = None
+        while True:
+            command, argument = self._commands.get()
+            try:
+                if command == _OPEN:
+                    height, width = self._slots.shape[1:3]
+                    writer = cv2.VideoWriter(
+                        argument,
+                        self.fourcc,
+                        self.fps,
+                        (width, height),
+                        self._slots.ndim == 4,
+                    )
+                    if not writer.isOpened():
+                        logging.error(f"[MotionRecorder] Cannot open {argument}")
+                elif command == _FRAME:
+                    try:
+                        if writer is not None and writer.isOpened():
+                            writer.write(self._slots[argument])
+                            self.frames_written += 1
+                    finally:
+                        self._free.put(argument)
+                elif writer is not None:  # _CLOSE or _STOP
+                    writer.release()
+                    writer = None
+            except Exception as e:
+                logging.error(f"[MotionRecorder] Error writing segment: {e}")
+            if command == _STOP:
+                return
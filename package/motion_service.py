@@ -0,0 +1,421 @@
+"""
+Headless Multi-Stream Motion Detection Service
+
+Running one run_motion_detector() process per camera does not scale: every
+process owns its own capture, window and logging, and the streams compete for
+the cores without any coordination. MotionService takes N sources (device
+indices, video files or frame iterables), grabs each with a ThreadedCapture
+and schedules the detection work onto one fixed pool of worker threads.
+
+Scheduling:
+- Each stream keeps its own MotionDetector (previous-frame state) and has at
+  most one frame in flight, so its frames are processed in order and a busy
+  stream cannot flood the pool.
+- Streams are served round-robin, starting after the stream that was served
+  last, so every stream gets a fair share of the workers.
+- An optional per-stream FPS cap spaces out the frames taken from a stream;
+  frames arriving in between are dropped by the capture's latest-frame slot.
+
+The service reports aggregate throughput and, per stream, the processed and
+dropped frame counts and the capture-to-result latency.
+
+Example usage:
+    with MotionService([0, "lobby.mp4"], workers=4, max_fps=10) as service:
+        service.run(duration=60)
+        logging.info(service.format_stats())
+
+From the command line (every frame of a video file is processed, in order,
+while live cameras and URLs only hand out their latest frame):
+    python -m package.motion_service 0 1 lobby.mp4 --workers 4 --max-fps 10
+
+Topics: Concurrency, scheduling, video processing
+"""
+
+import argparse
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, Sequence, Union
+
+import cv2
+import numpy as np
+
+from .capture import ThreadedCapture
+from .motion_detector import MIN_AREA, THRESHOLD, MotionDetector
+
+# How long the scheduler sleeps when no stream has a frame ready
+POLL_INTERVAL: float = 0.005
+
+
+class _IterableCapture:
+    """Capture-like wrapper that reads frames from an iterable or generator."""
+
+    def __init__(self, frames: Iterable[np.ndarray]):
+        self._frames = iter(frames)
+        self._opened = True
+
+    def isOpened(self) -> bool:
+        return self._opened
+
+    def read(self):
+        frame = next(self._frames, None) if self._opened else None
+        if frame is None:
+            self._opened = False
+            return False, None
+        return True, frame
+
+    def release(self) -> None:
+        self._opened = False
+
+
+class MotionStream:
+    """Per-stream state and statistics of a MotionService."""
+
+    def __init__(
+        self,
+        name: str,
+        capture: ThreadedCapture,
+        detector: MotionDetector,
+        max_fps: Optional[float] = None,
+    ):
+        """
+        Args:
+            name (str): Name used in logs and statistics.
+            capture (ThreadedCapture): Frame source of the stream.
+            detector (MotionDetector): Detector holding the stream's previous frame.
+            max_fps (float, optional): Maximum number of frames processed per second.
+        """
+        self.name = name
+        self.capture = capture
+        self.detector = detector
+        self.min_interval = 1.0 / max_fps if max_fps else 0.0
+
+        self.busy = False  # A frame of this stream is being processed
+        self.next_due = 0.0  # perf_counter() time at which the next frame may start
+        self.last_regions: list = []  # Regions of the last processed frame
+
+        # Counters
+        self.frames_processed: int = 0
+        self.motion_frames: int = 0  # Processed frames with at least one region
+        self.errors: int = 0
+        self.last_latency: float = 0.0  # Seconds from capture to result, last frame
+        self.max_latency: float = 0.0
+        self._total_latency: float = 0.0
+
+    @property
+    def average_latency(self) -> float:
+        """Mean time in seconds between capturing a frame and having its regions."""
+        return (
+            self._total_latency / self.frames_processed
+            if self.frames_processed
+            else 0.0
+        )
+
+    @property
+    def frames_dropped(self) -> int:
+        """Frames the capture discarded because the stream was busy or capped."""
+        return self.capture.frames_dropped
+
+    def record(self, regions: list, latency: float) -> None:
+        """Updates the counters after a frame has been processed."""
+        self.last_regions = regions
+        self.frames_processed += 1
+        self.motion_frames += bool(regions)
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        self._total_latency += latency
+
+
+class MotionService:
+    """Runs motion detection for many streams on a shared worker pool."""
+
+    def __init__(
+        self,
+        sources: Sequence[Union[int, str, Iterable[np.ndarray]]],
+        workers: int = 4,
+        max_fps: Union[None, float, Sequence[Optional[float]]] = None,
+        threshold: int = THRESHOLD,
+        min_area: int = MIN_AREA,
+        on_motion: Optional[Callable[[str, list], None]] = None,
+        drop_frames: Union[bool, Sequence[bool]] = True,
+        **detector_options,
+    ):
+        """
+        Open all sources and start their capture threads.
+
+        Args:
+            sources (sequence): Device indices, video file paths/URLs, capture-like
+                objects or iterables of frames (BGR or grayscale).
+            workers (int): Number of worker threads shared by all streams.
+            max_fps (float | sequence, optional): FPS cap for every stream, or one
+                cap (or None) per stream.
+            threshold (int): The pixel intensity change required to consider motion.
+            min_area (int): The minimum area in pixels for a contour to be considered motion.
+            on_motion (callable, optional): Called from a worker thread as
+                on_motion(stream_name, regions) for every frame with motion.
+            drop_frames (bool | sequence): Keep only the latest frame of each
+                stream (live sources). If False, every frame is processed
+                (offline files). Either one value for every stream or one per
+                stream.
+            **detector_options: Further MotionDetector arguments (e.g. downscale).
+
+        Raises:
+            ValueError: If there are no sources, workers is not positive, or the
+                number of FPS caps or drop_frames values does not match the
+                number of sources.
+        """
+        if not sources:
+            raise ValueError("At least one source is required")
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+        if max_fps is None or isinstance(max_fps, (int, float)):
+            max_fps = [max_fps] * len(sources)
+        if len(max_fps) != len(sources):
+            raise ValueError(f"Got {len(max_fps)} FPS caps for {len(sources)} sources")
+        if isinstance(drop_frames, bool):
+            drop_frames = [drop_frames] * len(sources)
+        if len(drop_frames) != len(sources):
+            raise ValueError(
+                f"Got {len(drop_frames)} drop_frames values for {len(sources)} sources"
+            )
+
+        self.workers = workers
+        self.on_motion = on_motion
+        self.streams: List[MotionStream] = []
+        for index, (source, fps, drop) in enumerate(
+            zip(sources, max_fps, drop_frames)
+        ):
+            if not isinstance(source, (int, str)) and not hasattr(source, "read"):
+                source = _IterableCapture(source)
+            name = str(source) if isinstance(source, (int, str)) else f"stream{index}"
+            capture = ThreadedCapture(source, drop_frames=drop)
+            if not capture.isOpened():
+                logging.warning(f"[MotionService] Cannot open source {name}")
+            detector = MotionDetector(threshold, min_area, **detector_options)
+            self.streams.append(MotionStream(name, capture, detector, fps))
+
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._condition = threading.Condition()  # Signals finished jobs and stop()
+        self._in_flight = 0
+        self._next_stream = 0  # Round-robin position
+        self._stopped = False
+        self._started_at: Optional[float] = None
+        self._elapsed = 0.0
+
+    @property
+    def frames_processed(self) -> int:
+        """Total number of frames processed over all streams."""
+        return sum(stream.frames_processed for stream in self.streams)
+
+    @property
+    def throughput(self) -> float:
+        """Aggregate processed frames per second since run() started."""
+        elapsed = self._elapsed_time()
+        return self.frames_processed / elapsed if elapsed else 0.0
+
+    def run(self, duration: Optional[float] = None) -> None:
+        """
+        Schedule frames until all sources are exhausted, duration has elapsed
+        or stop() is called. Blocks the calling thread.
+
+        Args:
+            duration (float, optional): Maximum run time in seconds.
+        """
+        self._started_at = time.perf_counter()
+        deadline = None if duration is None else self._started_at + duration
+        try:
+            while not self._stopped:
+                now = time.perf_counter()
+                if deadline is not None and now >= deadline:
+                    break
+                if not self._schedule(now):
+                    break
+                self._wait()
+        finally:
+            # Let in-flight frames finish so the statistics are complete
+            with self._condition:
+                self._condition.wait_for(lambda: self._in_flight == 0)
+            self._elapsed = self._elapsed_time()
+            self._started_at = None
+
+    def stop(self) -> None:
+        """Makes run() return after the frames in flight; safe from any thread."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """Stops the service, the worker pool and all captures."""
+        self.stop()
+        self._executor.shutdown()
+        for stream in self.streams:
+            stream.capture.release()
+
+    def __enter__(self) -> "MotionService":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Aggregate throughput and per-stream counters and latencies.
+        """
+        elapsed = self._elapsed_time()
+        return {
+            "elapsed": elapsed,
+            "frames_processed": self.frames_processed,
+            "throughput": self.throughput,
+            "streams": {
+                stream.name: {
+                    "frames_processed": stream.frames_processed,
+                    "frames_dropped": stream.frames_dropped,
+                    "motion_frames": stream.motion_frames,
+                    "errors": stream.errors,
+                    "fps": stream.frames_processed / elapsed if elapsed else 0.0,
+                    "average_latency": stream.average_latency,
+                    "max_latency": stream.max_latency,
+                }
+                for stream in self.streams
+            },
+        }
+
+    def format_stats(self) -> str:
+        """Returns the statistics as a small human-readable table."""
+        stats = self.stats()
+        lines = [
+            f"{stats['frames_processed']} frame(s) in {stats['elapsed']:.1f} s "
+            f"({stats['throughput']:.1f} fps total)",
+            f"{'stream':>12} {'frames':>7} {'dropped':>8} {'motion':>7} "
+            f"{'fps':>6} {'avg ms':>7} {'max ms':>7}",
+        ]
+        for name, s in stats["streams"].items():
+            lines.append(
+                f"{name[-12:]:>12} {s['frames_processed']:>7} {s['frames_dropped']:>8} "
+                f"{s['motion_frames']:>7} {s['fps']:>6.1f} "
+                f"{1000 * s['average_latency']:>7.1f} {1000 * s['max_latency']:>7.1f}"
+            )
+        return "\n".join(lines)
+
+    def _elapsed_time(self) -> float:
+        if self._started_at is None:
+            return self._elapsed
+        return time.perf_counter() - self._started_at
+
+    def _schedule(self, now: float) -> bool:
+        """
+        Submit one frame per ready stream, in round-robin order, while workers are free.
+
+        Returns:
+            bool: False if every stream is exhausted and nothing is in flight.
+        """
+        count = len(self.streams)
+        active = False
+        for offset in range(count):
+            index = (self._next_stream + offset) % count
+            stream = self.streams[index]
+            if stream.busy:
+                active = True
+                continue
+            if not stream.capture.isOpened():
+                continue
+            active = True
+            if now < stream.next_due:
+                continue
+            with self._condition:
+                if self._in_flight >= self.workers:
+                    break
+            ret, frame = stream.capture.read(timeout=0)
+            if not ret:
+                continue
+
+            stream.busy = True
+            stream.next_due = now + stream.min_interval
+            capture_latency = stream.capture.last_latency
+            with self._condition:
+                self._in_flight += 1
+            self._executor.submit(self._process, stream, frame, now - capture_latency)
+            # The next round starts after the stream served last
+            self._next_stream = (index + 1) % count
+        return active
+
+    def _wait(self) -> None:
+        """Waits until a job finishes, stop() is called or the poll interval elapses."""
+        with self._condition:
+            if not self._stopped:
+                self._condition.wait(POLL_INTERVAL)
+
+    def _process(self, stream: MotionStream, frame: np.ndarray, captured_at: float):
+        """Worker: runs one frame of a stream through its detector."""
+        try:
+            if frame.ndim == 3:
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            regions = stream.detector.update(frame)
+            stream.record(regions, time.perf_counter() - captured_at)
+            if regions and self.on_motion is not None:
+                self.on_motion(stream.name, regions)
+        except Exception as e:
+            stream.errors += 1
+            logging.error(f"[MotionService] Error processing {stream.name}: {e}")
+        finally:
+            stream.busy = False
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+
+def parse_source(source: str) -> Union[int, str]:
+    """Device indices are given as integers, everything else is a path or URL."""
+    return int(source) if source.isdigit() else source
+
+
+def is_live_source(source: Union[int, str]) -> bool:
+    """Devices and URLs are live; local video files can be read at any pace."""
+    return not (isinstance(source, str) and os.path.isfile(source))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Headless multi-stream motion detection"
+    )
+    parser.add_argument(
+        "sources", nargs="+", help="Device indices, video files or URLs"
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Worker threads")
+    parser.add_argument("--max-fps", type=float, help="FPS cap for every stream")
+    parser.add_argument("--duration", type=float, help="Run time in seconds")
+    parser.add_argument("--downscale", type=int, default=1, help="Detection downscale")
+    parser.add_argument(
+        "--every-frame",
+        action="store_true",
+        help="Process every frame of every source (by default only of video files)",
+    )
+    args = parser.parse_args(argv)
+    sources = [parse_source(source) for source in args.sources]
+
+    def log_motion(name: str, regions: list) -> None:
+        logging.info(f"[{name}] Motion detected in {len(regions)} region(s)")
+
+    with MotionService(
+        sources,
+        workers=args.workers,
+        max_fps=args.max_fps,
+        # Live sources keep only their latest frame; files are not raced through
+        drop_frames=[
+            is_live_source(source) and not args.every_frame for source in sources
+        ],
+        on_motion=log_motion,
+        downscale=args.downscale,
+    ) as service:
+        try:
+            service.run(args.duration)
+        except KeyboardInterrupt:
+            logging.info("Exiting...")
+        logging.info("Motion service statistics:\n" + service.format_stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""
+Lightweight Multi-Object Tracker over Motion Regions
+
+detect_motion() returns an independent list of boxes for every frame, so
+downstream consumers cannot tell a new blob from one they have already looked
+at. MotionTracker gives motion boxes persistent IDs across frames:
+
+- The IoU of the current tracks against the new boxes is computed in one
+  vectorized NumPy pass over the pairs whose x ranges overlap (iou_matrix()
+  gives the full matrix), and matches are assigned greedily in order of
+  decreasing IoU.
+- Unmatched boxes start new tracks; tracks unmatched for more than max_misses
+  frames are dropped.
+- Every track exposes its age, velocity and whether its box changed since it
+  was last analyzed, so expensive analysis can run once per track and be
+  skipped while the track stays unchanged.
+
+With a few hundred boxes per frame an update takes under a millisecond
+(python -m benchmarks.bench_motion_tracker).
+
+Example usage:
+    tracker = MotionTracker()
+    for track in tracker.update(detect_motion(prev_frame, frame)):
+        if track.needs_analysis:
+            analyze(frame, track.box)
+            track.mark_analyzed()
+
+Topics: Tracking, vectorization
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Minimum IoU for a box to continue a track
+MIN_IOU: float = 0.3
+# Number of frames a track survives without a matching box
+MAX_MISSES: int = 5
+# A box whose IoU with the analyzed box is at least this is considered unchanged
+UNCHANGED_IOU: float = 0.95
+
+
+def _pair_iou(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """IoU of the boxes a[i] and b[i] (broadcasting (x, y, w, h) arrays)."""
+    overlap_w = np.minimum(a[..., 0] + a[..., 2], b[..., 0] + b[..., 2]) - np.maximum(
+        a[..., 0], b[..., 0]
+    )
+    overlap_h = np.minimum(a[..., 1] + a[..., 3], b[..., 1] + b[..., 3]) - np.maximum(
+        a[..., 1], b[..., 1]
+    )
+    intersection = np.clip(overlap_w, 0, None) * np.clip(overlap_h, 0, None)
+    union = a[..., 2] * a[..., 3] + b[..., 2] * b[..., 3] - intersection
+    return np.divide(
+        intersection, union, out=np.zeros_like(intersection), where=union > 0
+    )
+
+
+def iou_matrix(boxes_a, boxes_b) -> np.ndarray:
+    """
+    Computes the pairwise intersection over union of two sets of boxes.
+
+    Args:
+        boxes_a (array-like): N boxes as (x, y, w, h).
+        boxes_b (array-like): M boxes as (x, y, w, h).
+
+    Returns:
+        numpy.ndarray: (N, M) float64 matrix of IoU values in [0, 1].
+    """
+    a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 4)
+    b = np.asarray(boxes_b, dtype=np.float64).reshape(-1, 4)
+    return _pair_iou(a[:, None, :], b[None, :, :])
+
+
+def overlapping_pairs(boxes_a, boxes_b) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes the IoU of only the box pairs whose x ranges overlap.
+
+    Most boxes of a frame are far apart, so instead of the full (N, M) matrix
+    the boxes of b are sorted by x and each box of a is paired with the range
+    of b boxes that can reach it (found with searchsorted).
+
+    Args:
+        boxes_a (array-like): N boxes as (x, y, w, h).
+        boxes_b (array-like): M boxes as (x, y, w, h).
+
+    Returns:
+        tuple: (indices into a, indices into b, IoU values) of the candidate
+               pairs; pairs missing from the result have an IoU of 0.
+    """
+    a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 4)
+    b = np.asarray(boxes_b, dtype=np.float64).reshape(-1, 4)
+    if not len(a) or not len(b):
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty, np.empty(0, dtype=np.float64)
+
+    order = np.argsort(b[:, 0], kind="stable")
+    b_x0 = b[order, 0]
+    # A box of b overlaps box a in x if b.x0 < a.x1 and b.x0 > a.x0 - max width of b
+    lo = np.searchsorted(b_x0, a[:, 0] - b[:, 2].max(), side="right")
+    hi = np.searchsorted(b_x0, a[:, 0] + a[:, 2], side="left")
+    counts = np.maximum(hi - lo, 0)
+
+    rows = np.repeat(np.arange(len(a)), counts)
+    # Position of each pair within its row's range, added to the range start
+    starts = np.cumsum(counts) - counts
+    cols = order[
+        np.repeat(lo, counts) + np.arange(counts.sum()) - np.repeat(starts, counts)
+    ]
+    return rows, cols, _pair_iou(a[rows], b[cols])
+
+
+def _greedy_match(
+    rows: np.ndarray, cols: np.ndarray, iou: np.ndarray, min_iou: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Greedy matching of candidate (row, col, iou) pairs by decreasing IoU."""
+    keep = iou >= min_iou
+    rows, cols, iou = rows[keep], cols[keep], iou[keep]
+    order = np.argsort(-iou, kind="stable")
+
+    row_used, col_used = set(), set()
+    matched_rows, matched_cols = [], []
+    for row, col in zip(rows[order].tolist(), cols[order].tolist()):
+        if row not in row_used and col not in col_used:
+            row_used.add(row)
+            col_used.add(col)
+            matched_rows.append(row)
+            matched_cols.append(col)
+    return np.array(matched_rows, dtype=np.intp), np.array(matched_cols, dtype=np.intp)
+
+
+def greedy_assignment(
+    iou: np.ndarray, min_iou: float = MIN_IOU
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Matches rows to columns greedily in order of decreasing IoU.
+
+    Args:
+        iou (numpy.ndarray): (N, M) IoU matrix.
+        min_iou (float): Pairs below this IoU are never matched.
+
+    Returns:
+        tuple: (row indices, column indices) of the matched pairs.
+    """
+    rows, cols = np.nonzero(iou >= min_iou)
+    return _greedy_match(rows, cols, iou[rows, cols], min_iou)
+
+
+class Track:
+    """A motion box followed across frames."""
+
+    def __init__(self, track_id: int, box: tuple, unchanged_iou: float):
+        """
+        Args:
+            track_id (int): Persistent ID of the track.
+            box (tuple): First bounding box (x, y, w, h).
+            unchanged_iou (float): IoU above which the box counts as unchanged.
+        """
+        self.id = track_id
+        self.box = box
+        self.age: int = 1  # Frames since the track started
+        self.hits: int = 1  # Frames in which the track was matched
+        self.misses: int = 0  # Consecutive frames without a match
+        self.velocity: Tuple[float, float] = (0.0, 0.0)  # Center shift, pixels/frame
+        self.analyzed_box: Optional[tuple] = None  # Box at the last mark_analyzed()
+        self.unchanged_iou = unchanged_iou
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        x, y, w, h = self.box
+        return (x + w / 2, y + h / 2)
+
+    @property
+    def needs_analysis(self) -> bool:
+        """True if the track was never analyzed or its box changed since."""
+        if self.analyzed_box is None:
+            return True
+        return iou_matrix(self.box, self.analyzed_box)[0, 0] < self.unchanged_iou
+
+    def mark_analyzed(self) -> None:
+        """Records the current box as analyzed."""
+        self.analyzed_box = self.box
+
+    def __repr__(self) -> str:
+        return (
+            f"Track(id={self.id}, box={self.box}, age={self.age}, "
+            f"velocity=({self.velocity[0]:.1f}, {self.velocity[1]:.1f}))"
+        )
+
+
+class MotionTracker:
+    """Assigns persistent IDs to motion boxes using vectorized IoU matching."""
+
+    def __init__(
+        self,
+        min_iou: float = MIN_IOU,
+        max_misses: int = MAX_MISSES,
+        unchanged_iou: float = UNCHANGED_IOU,
+    ):
+        """
+        Args:
+            min_iou (float): Minimum IoU for a box to continue a track.
+            max_misses (int): Frames a track survives without a matching box.
+            unchanged_iou (float): IoU with the analyzed box above which a track
+                does not need to be analyzed again.
+
+        Raises:
+            ValueError: If min_iou or unchanged_iou is not in (0, 1], or
+                max_misses is negative.
+        """
+        if not 0 < min_iou <= 1 or not 0 < unchanged_iou <= 1:
+            raise ValueError(
+                f"min_iou and unchanged_iou must be in (0, 1], got {min_iou}, {unchanged_iou}"
+            )
+        if max_misses < 0:
+            raise ValueError(f"max_misses must not be negative, got {max_misses}")
+        self.min_iou = min_iou
+        self.max_misses = max_misses
+        self.unchanged_iou = unchanged_iou
+
+        self.tracks: List[Track] = []  # All live tracks, including missed ones
+        self._boxes = np.empty((0, 4), dtype=np.float64)  # Box of each live track
+        self._next_id = 0
+
+    def update(self, regions: Sequence[tuple]) -> List[Track]:
+        """
+        Match the boxes of a new frame to the existing tracks.
+
+        Args:
+            regions (sequence): Bounding boxes (x, y, w, h) of the current frame,
+                e.g. the output of detect_motion().
+
+        Returns:
+            list: The tracks seen in this frame, in the order of the regions.
+        """
+        boxes = np.asarray(regions, dtype=np.float64).reshape(-1, 4)
+        rows, cols = _greedy_match(
+            *overlapping_pairs(self._boxes, boxes), min_iou=self.min_iou
+        )
+
+        # Velocity of the matched tracks from the shift of the box centers
+        shift = (boxes[cols, :2] + boxes[cols, 2:] / 2) - (
+            self._boxes[rows, :2] + self._boxes[rows, 2:] / 2
+        )
+
+        seen: List[Optional[Track]] = [None] * len(boxes)
+        for row, col, (dx, dy) in zip(rows.tolist(), cols.tolist(), shift.tolist()):
+            track = self.tracks[row]
+            frames = track.misses + 1  # Frames since the track was last seen
+            track.velocity = (dx / frames, dy / frames)
+            track.box = tuple(regions[col])
+            track.age += 1
+            track.hits += 1
+            track.misses = 0
+            seen[col] = track
+
+        for col, track in enumerate(seen):
+            if track is None:
+                seen[col] = Track(
+                    self._next_id, tuple(regions[col]), self.unchanged_iou
+                )
+                self._next_id += 1
+
+        # Unmatched tracks are kept (with their last box) for up to max_misses frames
+        unmatched = np.ones(len(self.tracks), dtype=bool)
+        unmatched[rows] = False
+        kept = []
+        for index in np.flatnonzero(unmatched).tolist():
+            track = self.tracks[index]
+            track.age += 1
+            track.misses += 1
+            if track.misses <= self.max_misses:
+                kept.append(index)
+
+        # Live tracks are ordered as the current regions followed by the missed ones
+        self.tracks = seen + [self.tracks[index] for index in kept]
+        self._boxes = np.concatenate([boxes, self._boxes[kept]])
+        return seen
+
+    def reset(self) -> None:
+        """Forgets all tracks."""
+        self.tracks = []
+        self._boxes = np.empty((0, 4), dtype=np.float64)
@@ -0,0 +1,237 @@
+"""
+Batched Overlay Rendering
+
+The drawing helpers used to issue one OpenCV call per box, polygon or
+landmark on every frame, even in headless runs where nobody looks at the
+result. OverlayRenderer separates drawing from detection:
+
+- Detectors only return boxes, contours or landmarks; the caller queues them
+  with add_boxes(), add_contours(), add_landmarks() or add_polylines().
+- render() draws everything queued with one cv2.polylines call per style
+  (color, thickness, open or closed). Boxes become 4-point polygons, and
+  landmark dots become single-point closed polylines (a thick line from a
+  point to itself is a filled dot).
+- The renderer can draw every Nth frame only, or be disabled entirely; on
+  skipped frames the add_*() calls return immediately, so no pixel is touched
+  and no shape is converted.
+- With copy=True the overlay is drawn on a reusable canvas instead of the
+  frame itself, so the frame stays clean (e.g. for recording) without a new
+  allocation per frame.
+
+Example usage:
+    renderer = OverlayRenderer(every=5)
+    for frame in frames:
+        renderer.add_boxes(detector.update(gray))
+        cv2.imshow("Motion", renderer.render(frame))
+
+Topics: Rendering, batching
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from .contour_analysis import ContourTable, bbox_polygons
+
+# Default styles (BGR), matching the previous per-shape drawing code
+BOX_COLOR: Tuple[int, int, int] = (0, 255, 0)
+CONTOUR_COLOR: Tuple[int, int, int] = (0, 0, 255)
+LANDMARK_COLOR: Tuple[int, int, int] = (0, 0, 255)
+CONNECTION_COLOR: Tuple[int, int, int] = (224, 224, 224)
+THICKNESS: int = 2
+LANDMARK_RADIUS: int = 2
+# Landmarks less visible than this are not drawn (as in MediaPipe's drawing utils)
+VISIBILITY_THRESHOLD: float = 0.5
+
+
+def draw_boxes(
+    image: np.ndarray, boxes, color=BOX_COLOR, thickness: int = THICKNESS
+) -> np.ndarray:
+    """
+    Draws bounding boxes with a single cv2.polylines call.
+
+    The result is pixel-identical to one cv2.rectangle call per box.
+
+    Args:
+        image (numpy.ndarray): The image to draw on (in place).
+        boxes (array-like): N boxes as (x, y, w, h).
+        color (tuple): Line color.
+        thickness (int): Line thickness in pixels.
+
+    Returns:
+        numpy.ndarray: The image.
+    """
+    polylines = bbox_polygons(boxes)
+    if len(polylines):
+        cv2.polylines(image, polylines, isClosed=True, color=color, thickness=thickness)
+    return image
+
+
+class OverlayRenderer:
+    """Queues shapes and draws them in batched calls, every Nth frame or never."""
+
+    def __init__(self, every: int = 1, enabled: bool = True):
+        """
+        Args:
+            every (int): Draw on every Nth rendered frame only (1 draws every frame).
+            enabled (bool): If False, nothing is ever drawn.
+
+        Raises:
+            ValueError: If every is not positive.
+        """
+        if every < 1:
+            raise ValueError(f"every must be positive, got {every}")
+        self.every = every
+        self.enabled = enabled
+
+        # Counters
+        self.frames_rendered: int = 0  # Frames the overlay was drawn on
+        self.frames_skipped: int = 0  # Frames returned untouched
+
+        self._frame_index = 0
+        # (color, thickness, closed) -> polylines, drawn in one call per style
+        self._styles: Dict[tuple, List[np.ndarray]] = {}
+        # (landmarks, connections) in normalized coordinates, scaled in render()
+        self._landmarks: List[Tuple[np.ndarray, Optional[np.ndarray]]] = []
+        self._canvas: Optional[np.ndarray] = None
+
+    @property
+    def active(self) -> bool:
+        """True if the next render() call draws the overlay."""
+        return self.enabled and self._frame_index % self.every == 0
+
+    def add_polylines(
+        self,
+        polylines: Sequence[np.ndarray],
+        color=CONTOUR_COLOR,
+        thickness: int = THICKNESS,
+        closed: bool = True,
+    ) -> None:
+        """
+        Queues polylines (e.g. contour approximations) for the next render().
+
+        Args:
+            polylines (sequence): Int32 point arrays of shape (K, 1, 2) or (K, 2).
+            color (tuple): Line color.
+            thickness (int): Line thickness in pixels.
+            closed (bool): Whether to connect the last point to the first.
+        """
+        if self.active:
+            self._queue(polylines, color, thickness, closed)
+
+    def add_boxes(self, boxes, color=BOX_COLOR, thickness: int = THICKNESS) -> None:
+        """
+        Queues bounding boxes (x, y, w, h) for the next render().
+
+        Args:
+            boxes (array-like): N boxes, e.g. the output of detect_motion().
+            color (tuple): Line color.
+            thickness (int): Line thickness in pixels.
+        """
+        if self.active:
+            self.add_polylines(bbox_polygons(boxes), color, thickness)
+
+    def add_contours(self, contours_info) -> None:
+        """
+        Queues the bounding boxes and approximations of analyze_contours() results.
+
+        Args:
+            contours_info (list | ContourTable): Output of analyze_contours() in
+                any output format.
+        """
+        if not self.active:
+            return
+        if isinstance(contours_info, ContourTable):
+            boxes, approxes = contours_info.bboxes, contours_info.approx_list()
+        else:
+            boxes = [info["bbox"] for info in contours_info]
+            approxes = [info["approx"] for info in contours_info]
+        self.add_boxes(boxes)
+        self.add_polylines(approxes, CONTOUR_COLOR)
+
+    def add_landmarks(self, landmarks: Optional[np.ndarray], connections=None) -> None:
+        """
+        Queues pose landmarks and the connections between them.
+
+        Args:
+            landmarks (numpy.ndarray): (N, 2+) array of normalized x, y (and
+                optionally z, visibility) coordinates, e.g.
+                HandRaiseDetector.last_landmarks. None queues nothing.
+            connections (iterable, optional): Pairs of landmark indices to
+                connect, e.g. mediapipe's POSE_CONNECTIONS.
+        """
+        if not self.active or landmarks is None:
+            return
+        if connections is not None:
+            connections = np.array(sorted(connections), dtype=np.intp).reshape(-1, 2)
+        self._landmarks.append((np.asarray(landmarks), connections))
+
+    def render(self, frame: np.ndarray, copy: bool = False) -> np.ndarray:
+        """
+        Draws the queued shapes (if this frame is rendered) and clears the queue.
+
+        Args:
+            frame (numpy.ndarray): The frame to draw the overlay on.
+            copy (bool): Draw on a reusable canvas holding a copy of the frame
+                instead of on the frame itself.
+
+        Returns:
+            numpy.ndarray: The frame with the overlay (with copy=True, the
+                           canvas, which is overwritten by the next render());
+                           on skipped frames the untouched input frame.
+        """
+        draw = self.active
+        self._frame_index += 1
+        if not draw:
+            self.frames_skipped += 1
+            return frame
+
+        if copy:
+            if (
+                self._canvas is None
+                or self._canvas.shape != frame.shape
+                or self._canvas.dtype != frame.dtype
+            ):
+                self._canvas = np.empty_like(frame)
+            np.copyto(self._canvas, frame)
+            frame = self._canvas
+
+        self._queue_landmarks(frame.shape[1], frame.shape[0])
+        for (color, thickness, closed), polylines in self._styles.items():
+            cv2.polylines(
+                frame, polylines, isClosed=closed, color=color, thickness=thickness
+            )
+        self._styles.clear()
+        self.frames_rendered += 1
+        return frame
+
+    def _queue_landmarks(self, width: int, height: int) -> None:
+        """Converts the queued landmarks to pixel polylines for a frame size."""
+        for landmarks, connections in self._landmarks:
+            points = np.rint(landmarks[:, :2] * (width, height)).astype(np.int32)
+            visible = (
+                landmarks[:, 3] >= VISIBILITY_THRESHOLD
+                if landmarks.shape[1] > 3
+                else np.ones(len(landmarks), dtype=bool)
+            )
+            if connections is not None and len(connections):
+                connections = connections[visible[connections].all(axis=1)]
+                self._queue(
+                    points[connections], CONNECTION_COLOR, THICKNESS, closed=False
+                )
+            # A closed single-point polyline is a dot of diameter = thickness
+            self._queue(
+                points[visible].reshape(-1, 1, 2),
+                LANDMARK_COLOR,
+                2 * LANDMARK_RADIUS + 1,
+                closed=True,
+            )
+        self._landmarks.clear()
+
+    def _queue(self, polylines, color, thickness: int, closed: bool) -> None:
+        """Adds polylines to the batch of their style."""
+        if len(polylines):
+            self._styles.setdefault((tuple(color), thickness, closed), []).extend(
+                polylines
+            )
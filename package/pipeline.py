@@ -9,13 +9,25 @@ Write a modular pipeline with the following components:
 Use Object-Oriented Programming (OOP) to organize your code and demonstrate how
 you'd isolate testable units.
 
-Topics: Architecture design
+Pipeline.run() executes the stages one after another, so a frame takes the sum
+of the stage latencies. Pipeline.run_concurrent() runs every stage on its own
+thread, connected by bounded queues, so throughput is limited by the slowest
+stage instead.
+
+Topics: Architecture design, concurrency
 """
 
 from typing import Optional
+import queue
+import threading
 import cv2
 import numpy as np
 
+# Seconds a blocked stage waits before checking whether another stage failed
+QUEUE_TIMEOUT: float = 0.1
+# End-of-stream marker passed between the stages
+_DONE = object()
+
 
 class DataSource:
     """Simulates a real-time data source like a camera or sensor stream."""
@@ -100,3 +112,135 @@ class Pipeline:
                 break
             processed = self.processor.process(frame)
             self.output.output(processed)
+
+    def run_concurrent(
+        self, queue_size: int = 4, workers: int = 1, preserve_order: bool = True
+    ):
+        """
+        Runs the stages concurrently, each on its own thread, until the source
+        returns None.
+
+        Frames travel between the stages through bounded queues, and at most
+        queue_size frames are between the source and the output stage at once:
+        a slow stage makes the source wait (backpressure) instead of letting
+        frames pile up. If a stage raises, the other stages stop and the
+        exception is re-raised in the caller.
+
+        Args:
+            queue_size (int): Maximum number of frames in flight.
+            workers (int): Number of processing threads. With more than one,
+                the processor must be thread-safe.
+            preserve_order (bool): Output the frames in source order. Only
+                matters with several workers, which may finish out of order.
+
+        Raises:
+            ValueError: If queue_size or workers is not positive.
+        """
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be positive, got {queue_size}")
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+
+        frames = queue.Queue(queue_size)  # (index, frame) from source to processors
+        results = queue.Queue(queue_size)  # (index, result) from processors to output
+        in_flight = threading.Semaphore(queue_size)
+        stop = threading.Event()  # Set when a stage failed
+        errors = []
+
+        def put(q: queue.Queue, item) -> bool:
+            """Blocks until the item is queued; False if the pipeline stopped."""
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=QUEUE_TIMEOUT)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def get(q: queue.Queue):
+            """Blocks until an item arrives; _DONE if the pipeline stopped."""
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=QUEUE_TIMEOUT)
+                except queue.Empty:
+                    pass
+            return _DONE
+
+        def read():
+            index = 0
+            while True:
+                while not in_flight.acquire(timeout=QUEUE_TIMEOUT):
+                    if stop.is_set():
+                        return
+                frame = self.source.get_frame()
+                if frame is None:
+                    break
+                if not put(frames, (index, frame)):
+                    return
+                index += 1
+            for _ in range(workers):
+                put(frames, _DONE)
+
+        def process():
+            while True:
+                item = get(frames)
+                if item is _DONE:
+                    put(results, _DONE)
+                    return
+                index, frame = item
+                if not put(results, (index, self.processor.process(frame))):
+                    return
+
+        def write():
+            pending = {}  # Results that finished before an earlier frame
+            next_index = 0
+            finished = 0
+            while finished < workers:
+                item = get(results)
+                if stop.is_set():
+                    return
+                if item is _DONE:
+                    finished += 1
+                    continue
+                index, processed = item
+                if not preserve_order:
+                    self.output.output(processed)
+                    in_flight.release()
+                    continue
+                pending[index] = processed
+                while next_index in pending:
+                    self.output.output(pending.pop(next_index))
+                    in_flight.release()
+                    next_index += 1
+
+        def guarded(stage):
+            def run_stage():
+                try:
+                    stage()
+                except BaseException as e:
+                    errors.append(e)
+                    stop.set()
+
+            return run_stage
+
+        threads = (
+            [threading.Thread(target=guarded(read), name="pipeline-source")]
+            + [
+                threading.Thread(target=guarded(process), name=f"pipeline-process-{i}")
+                for i in range(workers)
+            ]
+            + [threading.Thread(target=guarded(write), name="pipeline-output")]
+        )
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            # Also stops the stages if the caller is interrupted
+            stop.set()
+            for thread in threads:
+                if thread.is_alive():
+                    thread.join()
+        if errors:
+            raise errors[0]
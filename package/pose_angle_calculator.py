@@ -10,12 +10,18 @@ Example:
 keypoints = { "shoulder": (x1, y1), "elbow": (x2, y2), "wrist": (x3, y3) }
 calculate_angle(keypoints)
 
+To process recorded pose sequences, calculate_angles() computes the angles of
+N shoulder/elbow/wrist triplets, given as an (N, 3, 2) or (N, 3, 3) array, in
+a single vectorized pass.
+
 Topics: Geometry on body keypoints
 """
 
 import math
 from typing import Dict, Tuple
 
+import numpy as np
+
 
 def calculate_angle(keypoints: Dict[str, Tuple[float, float]]) -> float:
     """
@@ -50,3 +56,37 @@ def calculate_angle(keypoints: Dict[str, Tuple[float, float]]) -> float:
         return math.degrees(math.acos(cosine))
 
     return angle_between(keypoints["shoulder"], keypoints["elbow"], keypoints["wrist"])
+
+
+def calculate_angles(triplets: np.ndarray) -> np.ndarray:
+    """
+    Calculates the elbow flexion angles in degrees for a batch of keypoint triplets.
+
+    This is the vectorized counterpart of calculate_angle(): a zero-length
+    shoulder-elbow or elbow-wrist vector yields 0.0, and the cosine is clamped
+    to [-1, 1] before taking the arc cosine.
+
+    Args:
+        triplets: An array of shape (N, 3, 2) or (N, 3, 3) holding the shoulder,
+                  elbow and wrist coordinates (in that order) for N poses.
+
+    Returns:
+        An array of shape (N,) with the angles in degrees.
+
+    Raises:
+        ValueError: If the array does not have shape (N, 3, 2) or (N, 3, 3).
+    """
+    points = np.asarray(triplets, dtype=np.float64)
+    if points.ndim != 3 or points.shape[1] != 3 or points.shape[2] not in (2, 3):
+        raise ValueError(f"Expected shape (N, 3, 2) or (N, 3, 3), got {points.shape}")
+
+    a = points[:, 0] - points[:, 1]
+    b = points[:, 2] - points[:, 1]
+    dot_product = np.einsum("ij,ij->i", a, b)
+    magnitudes = np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
+
+    # Degenerate triplets keep a cosine of 1.0, i.e. an angle of 0.0
+    cosine = np.ones_like(dot_product)
+    np.divide(dot_product, magnitudes, out=cosine, where=magnitudes != 0)
+    np.clip(cosine, -1.0, 1.0, out=cosine)  # Clamp for numerical stability
+    return np.degrees(np.arccos(cosine))
@@ -0,0 +1,151 @@
+"""
+Streaming Angle Kinematics
+
+Tracks joint angles over a live pose stream (e.g. the output of
+JointAngleEngine or calculate_angles) and derives per-joint angular velocity
+and acceleration, for applications such as rep counting or fall detection.
+
+Recent angles are kept in a fixed-size NumPy ring buffer with running sums,
+so each frame is an O(1) update (per joint) that writes the smoothed angle,
+velocity and acceleration of all joints into preallocated arrays. No arrays
+are allocated per frame.
+
+Example usage:
+    engine = JointAngleEngine()
+    kinematics = AngleKinematics(num_joints=len(engine.joint_names), fps=60.0)
+    for landmarks in stream:
+        angles = engine.compute(landmarks)
+        smoothed, velocity, acceleration = kinematics.update(angles)
+
+Topics: State management, filtering, finite differences
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class AngleKinematics:
+    """Smooths joint angles and estimates their angular velocity and acceleration."""
+
+    def __init__(self, num_joints: int, window_size: int = 5, fps: float = 30.0):
+        """
+        Initialize the ring buffer and output arrays.
+
+        Args:
+            num_joints (int): Number of joint angles per frame.
+            window_size (int): Number of recent frames in the moving average.
+            fps (float): Frame rate used for the time step when update() is
+                not given timestamps.
+
+        Raises:
+            ValueError: If window_size or fps is not positive.
+        """
+        if window_size < 1:
+            raise ValueError(f"window_size must be positive, got {window_size}")
+        if fps <= 0:
+            raise ValueError(f"fps must be positive, got {fps}")
+        self.num_joints: int = num_joints
+        self.window_size: int = window_size
+        self.fps: float = fps
+
+        # Ring buffer of recent angles; NaN (hidden) angles are stored as 0.0
+        # and excluded through the valid mask and per-joint counts
+        self._buffer = np.zeros((window_size, num_joints), dtype=np.float64)
+        self._valid = np.zeros((window_size, num_joints), dtype=bool)
+        self._sums = np.zeros(num_joints, dtype=np.float64)
+        self._counts = np.zeros(num_joints, dtype=np.int64)
+        self._position: int = 0
+        self._updates: int = 0  # Updates since the last re-anchoring
+
+        # Rows: smoothed angle (deg), velocity (deg/s), acceleration (deg/s^2)
+        self.state: np.ndarray = np.full((3, num_joints), np.nan)
+        self._previous = np.full((2, num_joints), np.nan)  # Smoothed, velocity
+        self._mask = np.zeros(num_joints, dtype=bool)  # Scratch mask
+        self._last_timestamp: Optional[float] = None
+
+    def update(
+        self, angles: np.ndarray, timestamp: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Add the joint angles of a new frame.
+
+        Args:
+            angles (numpy.ndarray): Angles in degrees of shape (num_joints,);
+                NaN marks joints that were not visible in this frame.
+            timestamp (float, optional): Capture time of the frame in seconds.
+                Defaults to advancing by 1 / fps.
+
+        Returns:
+            tuple: Views of the smoothed angles, angular velocities and angular
+                   accelerations, each of shape (num_joints,). These arrays are
+                   overwritten by the next update. Values are NaN until enough
+                   frames with the joint visible have been seen.
+
+        Raises:
+            ValueError: If the timestamp is not later than the previous one.
+        """
+        # Time step since the previous frame, checked before any state changes
+        if timestamp is None or self._last_timestamp is None:
+            dt = 1.0 / self.fps
+        else:
+            dt = timestamp - self._last_timestamp
+            if dt <= 0:
+                raise ValueError(
+                    f"Timestamps must increase, got {timestamp} after "
+                    f"{self._last_timestamp}"
+                )
+        if timestamp is not None:
+            self._last_timestamp = timestamp
+
+        smoothed, velocity, acceleration = self.state
+        previous_smoothed, previous_velocity = self._previous
+        slot, valid = self._buffer[self._position], self._valid[self._position]
+
+        # Evict the oldest frame (a zero slot with no valid entries while filling)
+        np.subtract(self._sums, slot, out=self._sums)
+        np.subtract(self._counts, valid, out=self._counts)
+
+        # Store the new frame with hidden joints zeroed out
+        np.isnan(angles, out=self._mask)
+        np.logical_not(self._mask, out=valid)
+        np.copyto(slot, angles)
+        np.copyto(slot, 0.0, where=self._mask)
+        np.add(self._sums, slot, out=self._sums)
+        np.add(self._counts, valid, out=self._counts)
+        self._position = (self._position + 1) % self.window_size
+
+        # Re-anchor the running sums once per window so float drift cannot build up
+        self._updates += 1
+        if self._updates >= self.window_size:
+            np.sum(self._buffer, axis=0, out=self._sums)
+            self._updates = 0
+
+        np.copyto(previous_smoothed, smoothed)
+        np.copyto(previous_velocity, velocity)
+
+        # Moving average over the visible samples; NaN where there are none
+        np.greater(self._counts, 0, out=self._mask)
+        np.divide(self._sums, self._counts, out=smoothed, where=self._mask)
+        np.logical_not(self._mask, out=self._mask)
+        np.copyto(smoothed, np.nan, where=self._mask)
+
+        # Backward differences; NaN propagates from frames without a value
+        np.subtract(smoothed, previous_smoothed, out=velocity)
+        np.divide(velocity, dt, out=velocity)
+        np.subtract(velocity, previous_velocity, out=acceleration)
+        np.divide(acceleration, dt, out=acceleration)
+
+        return smoothed, velocity, acceleration
+
+    def reset(self) -> None:
+        """Clears all history, e.g. when the tracked person changes."""
+        self._buffer.fill(0.0)
+        self._valid.fill(False)
+        self._sums.fill(0.0)
+        self._counts.fill(0)
+        self._position = 0
+        self._updates = 0
+        self.state.fill(np.nan)
+        self._previous.fill(np.nan)
+        self._last_timestamp = None
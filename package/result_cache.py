@@ -0,0 +1,263 @@
+"""
+Content-Addressed LRU Result Cache
+
+Inspection cameras often deliver bit-identical (or nearly identical) frames,
+and analyze_contours() or a pipeline Processor then recomputes the same result
+every time. ResultCache memoizes such results, keyed by a fast hash of the
+frame contents plus the call parameters:
+
+- "exact" mode hashes the raw frame buffer (SHA-1 from hashlib, which most
+  CPUs accelerate in hardware), so only bit-identical frames share a result.
+- "perceptual" mode hashes a small, coarsely quantized thumbnail of the frame,
+  so frames that differ only by sensor noise also share a result. This is an
+  approximation and must only be used where such frames may be treated alike.
+
+The cache is bounded by a number of entries and optionally by the memory held
+by the cached arrays; the least recently used entries are evicted first. Hits,
+misses and evictions are counted. Cached NumPy arrays are made read-only, so a
+caller cannot corrupt the results handed to later callers. This also holds for
+the result returned on a miss, which is the cached object itself: a stage that
+draws onto a result in place must copy it first, and fails on the first frame
+(not only once the cache starts hitting) if it does not.
+
+Example usage:
+    cache = ResultCache(max_entries=256)
+    cached_analyze = cache.wrap(analyze_contours)
+    contours_info = cached_analyze(binary, area_threshold=100)
+
+    pipeline = Pipeline(source, CachedProcessor(Processor("edges"), cache), output)
+
+Topics: Caching, memoization
+"""
+
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+import cv2
+import numpy as np
+
+from .pipeline import Processor
+
+# Frame hashing modes (see the module docstring)
+HASH_MODES = ("exact", "perceptual")
+# Perceptual hash: thumbnail side length and number of gray levels kept
+THUMBNAIL_SIZE: int = 16
+PERCEPTUAL_LEVELS: int = 16
+
+
+def frame_key(frame: np.ndarray, mode: str = "exact") -> bytes:
+    """
+    Computes a content hash of a frame.
+
+    Args:
+        frame (numpy.ndarray): The frame to hash.
+        mode (str): One of HASH_MODES.
+
+    Returns:
+        bytes: A 20-byte digest that also covers the frame's shape and dtype.
+
+    Raises:
+        ValueError: If the mode is unknown.
+    """
+    digest = hashlib.sha1(usedforsecurity=False)
+    digest.update(repr((frame.shape, frame.dtype.str)).encode())
+    if mode == "exact":
+        digest.update(np.ascontiguousarray(frame).data)
+    elif mode == "perceptual":
+        # Subsample large frames first; averaging every pixel is far slower
+        # than the rest of the hash and barely changes the thumbnail
+        stride = max(1, min(frame.shape[:2]) // (8 * THUMBNAIL_SIZE))
+        thumbnail = cv2.resize(
+            np.ascontiguousarray(frame[::stride, ::stride]),
+            (THUMBNAIL_SIZE, THUMBNAIL_SIZE),
+            interpolation=cv2.INTER_AREA,
+        )
+        step = 256 // PERCEPTUAL_LEVELS
+        digest.update((thumbnail.astype(np.uint16) // step).astype(np.uint8).data)
+    else:
+        raise ValueError(
+            f"Unknown hash mode: {mode} (expected one of {', '.join(HASH_MODES)})"
+        )
+    return digest.digest()
+
+
+def _freeze(result: Any) -> int:
+    """Makes the NumPy arrays of a result read-only and returns their total size in bytes."""
+    if isinstance(result, np.ndarray):
+        result.flags.writeable = False
+        return result.nbytes
+    if isinstance(result, dict):
+        return sum(_freeze(value) for value in result.values())
+    if isinstance(result, (list, tuple)):
+        return sum(_freeze(value) for value in result)
+    size = 0
+    if hasattr(result, "__dict__"):  # e.g. ContourTable
+        size += sum(_freeze(value) for value in vars(result).values())
+    # Classes with __slots__ (e.g. ContourRecord); attributes that are computed
+    # lazily after caching are neither counted nor frozen
+    for cls in type(result).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if name not in ("__dict__", "__weakref__") and hasattr(result, name):
+                size += _freeze(getattr(result, name))
+    return size
+
+
+class ResultCache:
+    """Bounded LRU cache of analysis results keyed by frame content and parameters."""
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: Optional[int] = None,
+        mode: str = "exact",
+    ):
+        """
+        Args:
+            max_entries (int): Maximum number of cached results.
+            max_bytes (int, optional): Maximum total size of the cached arrays.
+            mode (str): Frame hashing mode, one of HASH_MODES.
+
+        Raises:
+            ValueError: If max_entries is not positive or the mode is unknown.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        if mode not in HASH_MODES:
+            raise ValueError(
+                f"Unknown hash mode: {mode} (expected one of {', '.join(HASH_MODES)})"
+            )
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.mode = mode
+
+        # Counters
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.current_bytes: int = 0  # Size of the cached arrays
+
+        self._entries: OrderedDict = OrderedDict()  # key -> (result, size)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def key(self, frame: np.ndarray, *params: Hashable) -> tuple:
+        """Builds a cache key from a frame's content and hashable call parameters."""
+        return (frame_key(frame, self.mode),) + params
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for key, computing and storing it on a miss.
+
+        Args:
+            key (hashable): The cache key (see key()).
+            compute (callable): Computes the result when it is not cached.
+
+        Returns:
+            The cached or newly computed result, with its arrays made read-only
+            in both cases.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+
+        # Compute outside the lock so other threads can use the cache meanwhile
+        result = compute()
+        size = _freeze(result)
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (result, size)
+                self.current_bytes += size
+                self._evict()
+        return result
+
+    def wrap(self, function: Callable) -> Callable:
+        """
+        Memoizes a function whose first argument is a frame.
+
+        Further NumPy array arguments (e.g. the second frame of detect_motion)
+        are hashed by content like the first one. The other arguments become
+        part of the key as they are, so they must be hashable (numbers,
+        strings, tuples).
+
+        Args:
+            function (callable): E.g. analyze_contours or detect_motion.
+
+        Returns:
+            callable: A function with the same signature that uses the cache.
+        """
+
+        @functools.wraps(function)
+        def cached(frame, *args, **kwargs):
+            key = self.key(
+                frame,
+                function.__qualname__,
+                tuple(self._param_key(value) for value in args),
+                tuple(
+                    (name, self._param_key(value))
+                    for name, value in sorted(kwargs.items())
+                ),
+            )
+            return self.get_or_compute(key, lambda: function(frame, *args, **kwargs))
+
+        cached.cache = self
+        return cached
+
+    def _param_key(self, value: Any) -> Hashable:
+        """Key part of a call argument: arrays by content, anything else as is."""
+        if isinstance(value, np.ndarray):
+            return ("ndarray", frame_key(value, self.mode))
+        return value
+
+    def clear(self) -> None:
+        """Removes all entries (the counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def _evict(self) -> None:
+        """Drops least recently used entries until the limits hold. Lock must be held."""
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None
+            and self.current_bytes > self.max_bytes
+            and len(self._entries) > 1
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self.current_bytes -= size
+            self.evictions += 1
+
+
+class CachedProcessor(Processor):
+    """Pipeline Processor that memoizes another Processor's results by frame content."""
+
+    def __init__(self, processor: Processor, cache: Optional[ResultCache] = None):
+        """
+        Args:
+            processor (Processor): The processor whose results are cached.
+            cache (ResultCache, optional): The cache to use; a new one by default.
+        """
+        self.processor = processor
+        self.cache = cache if cache is not None else ResultCache()
+
+    @property
+    def method(self) -> str:
+        return self.processor.method
+
+    def process(self, frame: np.ndarray) -> np.ndarray:
+        """Returns the (read-only) cached result, or processes the frame on a miss."""
+        key = self.cache.key(frame, type(self.processor).__qualname__, self.method)
+        return self.cache.get_or_compute(key, lambda: self.processor.process(frame))
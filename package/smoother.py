@@ -10,29 +10,66 @@ Example usage:
     smoother.update(12.5)
     current_avg = smoother.get_average()
 
+For large windows that are polled on every update, pass running_sum=True so
+get_average() runs in constant time:
+    smoother = RealTimeSmoother(window_size=5000, running_sum=True)
+
+For thousands of concurrent sensor streams, MultiChannelSmoother keeps every
+channel in a single NumPy ring buffer and updates them all in one call:
+    smoother = MultiChannelSmoother(num_channels=4096, window_size=50)
+    smoother.update_many(readings)  # readings has shape (4096,)
+    averages = smoother.get_averages()
+
+Recorded logs can be replayed in bulk with MovingAverageReplay, which returns
+every per-sample average for a chunk at once and carries state across chunks:
+    replay = MovingAverageReplay(window_size=5)
+    for chunk in chunks:
+        averages = replay.process(chunk)
+    live = replay.to_smoother()  # Continue with a live RealTimeSmoother
+
+Sibling filters with the same update()/get_average() interface:
+    - MovingMedianSmoother: moving median, robust to outlier spikes, with
+      O(log N) updates (two heaps with lazy deletion)
+    - ExponentialSmoother: O(1) exponential moving average
+
 Handles edge cases such as:
-    - No values yet (returns 0.0)
+    - No values yet (returns 0.0, per channel for MultiChannelSmoother)
     - Outliers are naturally smoothed by the moving average
+    - Floating-point drift of the running sum (compensated summation plus
+      periodic re-anchoring to the exact window sum)
 
 Topics: State management and filtering
 """
 
-from collections import deque  # Actual class where we store values
-from typing import Deque  # Just for type hint annotations
+import heapq
+import math
+from collections import defaultdict, deque  # Actual class where we store values
+from typing import Deque, Dict, List, Optional  # Just for type hint annotations
+
+import numpy as np
 
 
 class RealTimeSmoother:
     """Maintains a moving average over the last N values."""
 
-    def __init__(self, window_size: int = 5):
+    def __init__(self, window_size: int = 5, running_sum: bool = False):
         """
         Initialize the smoother.
 
         Args:
             window_size (int): Number of recent values to average over.
+            running_sum (bool): If True, keep a running sum that is updated as
+                values are pushed and evicted, so get_average() is O(1)
+                instead of O(window_size).
         """
         self.window_size: int = window_size
         self.values: Deque[float] = deque(maxlen=window_size)
+        self.running_sum: bool = running_sum
+
+        # Running-sum state (only used when running_sum is True)
+        self._sum: float = 0.0
+        self._compensation: float = 0.0  # Neumaier correction term
+        self._evictions: int = 0  # Evictions since the last re-anchoring
 
     def update(self, new_value: float) -> None:
         """
@@ -41,8 +78,21 @@ class RealTimeSmoother:
         Args:
             new_value (float): The new sensor reading to include.
         """
+        if self.running_sum:
+            if self.values and len(self.values) == self.window_size:
+                # The deque is about to drop its oldest value (a zero-size
+                # window holds nothing, like the deque path)
+                self._accumulate(-self.values[0])
+                self._evictions += 1
+            self._accumulate(new_value)
+
         self.values.append(new_value)
 
+        # Re-anchor once per full window turnover: amortized O(1), and it
+        # bounds drift no matter how many updates the stream sees
+        if self.running_sum and self._evictions >= self.window_size:
+            self._reanchor()
+
     def get_average(self) -> float:
         """
         Calculate the current moving average.
@@ -53,4 +103,362 @@ class RealTimeSmoother:
         """
         if not self.values:
             return 0.0
+        if self.running_sum:
+            return (self._sum + self._compensation) / len(self.values)
         return sum(self.values) / len(self.values)
+
+    def _accumulate(self, value: float) -> None:
+        """Adds a value to the running sum using Neumaier compensated summation."""
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    def _reanchor(self) -> None:
+        """Resets the running sum to the exactly rounded sum of the window."""
+        self._sum = math.fsum(self.values)
+        self._compensation = 0.0
+        self._evictions = 0
+
+
+class MovingMedianSmoother:
+    """Maintains a moving median over the last N values."""
+
+    def __init__(self, window_size: int = 5):
+        """
+        Initialize the smoother.
+
+        Args:
+            window_size (int): Number of recent values to take the median of.
+        """
+        self.window_size: int = window_size
+        self.values: Deque[float] = deque(maxlen=window_size)
+
+        # The smaller half of the window lives in a max-heap (stored negated)
+        # and the larger half in a min-heap. Evicted values are only marked
+        # in _delayed and dropped once they surface at the top of a heap.
+        self._low: List[float] = []
+        self._high: List[float] = []
+        self._low_size: int = 0  # Live (non-evicted) entries per heap
+        self._high_size: int = 0
+        self._delayed: Dict[float, int] = defaultdict(int)
+
+    def update(self, new_value: float) -> None:
+        """
+        Add a new value to the window.
+
+        Args:
+            new_value (float): The new sensor reading to include.
+        """
+        if not self.window_size:
+            return  # A zero-size window holds nothing, like RealTimeSmoother
+        if len(self.values) == self.window_size:
+            self._remove(self.values[0])
+        self.values.append(new_value)
+        self._insert(new_value)
+
+        # Evicted entries buried deep in a heap are never popped on their own
+        # (e.g. on a monotonic stream), so rebuild once they dominate
+        if len(self._low) + len(self._high) > 2 * self.window_size + 16:
+            self._rebuild()
+
+    def get_median(self) -> float:
+        """
+        Calculate the current moving median.
+
+        Returns:
+            float: The median of the most recent values,
+                   or 0.0 if no values have been added.
+        """
+        if not self.values:
+            return 0.0
+        if self._low_size > self._high_size:
+            return -self._low[0]
+        return (-self._low[0] + self._high[0]) / 2
+
+    # Alias so the filter is a drop-in replacement for RealTimeSmoother
+    get_average = get_median
+
+    def _insert(self, value: float) -> None:
+        if not self._low_size or value <= -self._low[0]:
+            heapq.heappush(self._low, -value)
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, value)
+            self._high_size += 1
+        self._rebalance()
+
+    def _remove(self, value: float) -> None:
+        self._delayed[value] += 1
+        if value <= -self._low[0]:
+            self._low_size -= 1
+            self._prune(self._low, -1)
+        else:
+            self._high_size -= 1
+            self._prune(self._high, 1)
+        self._rebalance()
+
+    def _rebalance(self) -> None:
+        """Keeps the low heap equal in size to, or one larger than, the high heap."""
+        if self._low_size > self._high_size + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+            self._low_size -= 1
+            self._high_size += 1
+            self._prune(self._low, -1)
+        elif self._low_size < self._high_size:
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+            self._low_size += 1
+            self._high_size -= 1
+            self._prune(self._high, 1)
+
+    def _prune(self, heap: List[float], sign: int) -> None:
+        """Pops evicted values off the top of a heap."""
+        while heap and self._delayed.get(sign * heap[0], 0):
+            value = sign * heapq.heappop(heap)
+            self._delayed[value] -= 1
+            if not self._delayed[value]:
+                del self._delayed[value]
+
+    def _rebuild(self) -> None:
+        """Rebuilds both heaps from the window, discarding all evicted entries."""
+        ordered = sorted(self.values)
+        split = (len(ordered) + 1) // 2
+        self._low = [-value for value in ordered[:split]]
+        self._high = ordered[split:]
+        heapq.heapify(self._low)
+        heapq.heapify(self._high)
+        self._low_size, self._high_size = len(self._low), len(self._high)
+        self._delayed.clear()
+
+
+class ExponentialSmoother:
+    """Maintains an exponential moving average (EMA) of a sensor stream."""
+
+    def __init__(self, alpha: float = 0.2):
+        """
+        Initialize the smoother.
+
+        Args:
+            alpha (float): Weight of the newest value, in (0, 1]. An EMA with
+                alpha = 2 / (N + 1) has the same center of mass as an N-sample
+                moving average.
+
+        Raises:
+            ValueError: If alpha is outside (0, 1].
+        """
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        self.alpha: float = alpha
+        self.average: Optional[float] = None
+
+    def update(self, new_value: float) -> None:
+        """
+        Fold a new value into the average.
+
+        Args:
+            new_value (float): The new sensor reading to include.
+        """
+        if self.average is None:
+            self.average = float(new_value)
+        else:
+            self.average += self.alpha * (new_value - self.average)
+
+    def get_average(self) -> float:
+        """
+        Return the current exponential moving average.
+
+        Returns:
+            float: The EMA, or 0.0 if no values have been added.
+        """
+        return 0.0 if self.average is None else self.average
+
+
+class MultiChannelSmoother:
+    """Maintains independent moving averages for many channels in one NumPy ring buffer."""
+
+    def __init__(self, num_channels: int, window_size: int = 5):
+        """
+        Initialize the smoother.
+
+        Args:
+            num_channels (int): Number of independent sensor channels.
+            window_size (int): Number of recent values to average over, per channel.
+        """
+        self.num_channels: int = num_channels
+        self.window_size: int = window_size
+
+        # (channels x window) ring buffer; unfilled slots hold 0.0 so they can
+        # be "evicted" from the running sums without special-casing
+        self.buffer: np.ndarray = np.zeros(
+            (num_channels, window_size), dtype=np.float64
+        )
+        self.counts: np.ndarray = np.zeros(num_channels, dtype=np.int64)
+
+        # Next ring buffer slot of each channel
+        self._positions = np.zeros(num_channels, dtype=np.int64)
+        self._sums = np.zeros(num_channels, dtype=np.float64)
+        self._all_channels = np.arange(num_channels)
+        self._ticks: int = 0  # Ticks since the last re-anchoring
+
+    def update_many(self, new_values, mask: Optional[np.ndarray] = None) -> None:
+        """
+        Add one new reading per channel.
+
+        Args:
+            new_values (array-like): Readings of shape (num_channels,).
+            mask (numpy.ndarray, optional): Boolean array of shape (num_channels,)
+                marking the channels that received a reading this tick. Channels
+                where the mask is False are left untouched, so each channel fills
+                its window independently.
+
+        Raises:
+            ValueError: If new_values or mask do not have shape (num_channels,).
+        """
+        values = np.asarray(new_values, dtype=np.float64)
+        if values.shape != (self.num_channels,):
+            raise ValueError(
+                f"Expected {self.num_channels} readings, got shape {values.shape}"
+            )
+
+        if mask is None:
+            channels = self._all_channels
+        else:
+            mask = np.asarray(mask, dtype=bool)
+            if mask.shape != (self.num_channels,):
+                raise ValueError(
+                    f"Expected mask of shape ({self.num_channels},), got {mask.shape}"
+                )
+            channels = np.flatnonzero(mask)
+            values = values[channels]
+        if not self.window_size:
+            return  # A zero-size window holds nothing, like RealTimeSmoother
+
+        positions = self._positions[channels]
+        self._sums[channels] += values - self.buffer[channels, positions]
+        self.buffer[channels, positions] = values
+        self._positions[channels] = (positions + 1) % self.window_size
+        self.counts[channels] = np.minimum(self.counts[channels] + 1, self.window_size)
+
+        # Re-anchor the running sums once per window's worth of ticks (amortized
+        # O(channels)) so floating-point drift cannot accumulate
+        self._ticks += 1
+        if self._ticks >= self.window_size:
+            self.buffer.sum(axis=1, out=self._sums)
+            self._ticks = 0
+
+    def get_averages(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate the current moving average of every channel.
+
+        Args:
+            out (numpy.ndarray, optional): Preallocated float64 array of shape
+                (num_channels,) to write the averages into.
+
+        Returns:
+            numpy.ndarray: The per-channel averages, with 0.0 for channels that
+                           have not received any values yet.
+        """
+        if out is None:
+            out = np.zeros(self.num_channels, dtype=np.float64)
+        else:
+            out.fill(0.0)
+        np.divide(self._sums, self.counts, out=out, where=self.counts > 0)
+        return out
+
+
+class MovingAverageReplay:
+    """Computes RealTimeSmoother averages for whole arrays of recorded samples."""
+
+    # Samples per cumulative-sum block; keeps cancellation error of the
+    # prefix-sum differences bounded for arbitrarily long chunks
+    BLOCK_SIZE: int = 1 << 14
+
+    def __init__(self, window_size: int = 5):
+        """
+        Initialize the replay.
+
+        Args:
+            window_size (int): Number of recent values to average over.
+        """
+        self.window_size: int = window_size
+        self.samples_seen: int = 0
+        self._tail = np.empty(0, dtype=np.float64)  # Last window_size samples
+
+    def process(self, chunk) -> np.ndarray:
+        """
+        Replay a chunk of samples, continuing from the previous chunks.
+
+        Args:
+            chunk (array-like): 1-D array of sensor readings.
+
+        Returns:
+            numpy.ndarray: The moving average after each sample, i.e. what
+                           RealTimeSmoother.get_average() would return right
+                           after the corresponding update().
+
+        Raises:
+            ValueError: If the chunk is not one-dimensional.
+        """
+        values = np.asarray(chunk, dtype=np.float64)
+        if values.ndim != 1:
+            raise ValueError(f"Expected a 1-D array, got shape {values.shape}")
+        if not self.window_size:
+            # A zero-size window holds nothing, like RealTimeSmoother
+            self.samples_seen += len(values)
+            return np.zeros(len(values), dtype=np.float64)
+
+        averages = np.empty(len(values), dtype=np.float64)
+        block_size = max(self.BLOCK_SIZE, 4 * self.window_size)
+        for start in range(0, len(values), block_size):
+            stop = start + block_size
+            averages[start:stop] = self._process_block(values[start:stop])
+        return averages
+
+    def to_smoother(self, running_sum: bool = False) -> RealTimeSmoother:
+        """
+        Create a live smoother in the same state as the end of the replay.
+
+        Args:
+            running_sum (bool): Passed through to RealTimeSmoother.
+
+        Returns:
+            RealTimeSmoother: A smoother whose window holds the last replayed samples.
+        """
+        smoother = RealTimeSmoother(self.window_size, running_sum=running_sum)
+        for value in self._tail:
+            smoother.update(float(value))
+        return smoother
+
+    def _process_block(self, block: np.ndarray) -> np.ndarray:
+        """Computes the averages of one block using differences of prefix sums."""
+        # Prepend the samples that are still inside the window of the first output
+        prefix_length = min(len(self._tail), self.window_size - 1)
+        prefix = self._tail[len(self._tail) - prefix_length :]
+        extended = np.concatenate((prefix, block))
+
+        cumulative = np.zeros(len(extended) + 1, dtype=np.float64)
+        np.cumsum(extended, out=cumulative[1:])
+
+        ends = np.arange(len(prefix) + 1, len(extended) + 1)
+        starts = np.maximum(ends - self.window_size, 0)
+        averages = (cumulative[ends] - cumulative[starts]) / (ends - starts)
+
+        self._tail = extended[-self.window_size :].copy()
+        self.samples_seen += len(block)
+        return averages
+
+
+def replay_moving_average(values, window_size: int = 5) -> np.ndarray:
+    """
+    Compute the moving average after every sample of a recorded stream.
+
+    Args:
+        values (array-like): 1-D array of sensor readings.
+        window_size (int): Number of recent values to average over.
+
+    Returns:
+        numpy.ndarray: The per-sample moving averages.
+    """
+    return MovingAverageReplay(window_size).process(values)
@@ -0,0 +1,289 @@
+"""
+Tiled Parallel Motion Detection for 4K/8K Frames
+
+A single detect_motion() call runs on one core, and OpenCV's internal
+threading helps little with the contour stage. TiledMotionDetector splits the
+frame into a grid of tiles and runs the absdiff/threshold/dilate/findContours
+chain of every tile on a thread pool (OpenCV releases the GIL while it works).
+
+Each tile is processed with a halo of DILATION_HALO pixels around it, so the
+dilated mask of the tile itself is identical to the untiled mask. Blobs that
+lie entirely inside one tile are finished by that tile. Blobs that touch an
+internal tile border are merged afterwards: their fragments are grouped, and
+the contours are re-extracted from the shared mask over the union of each
+group's boxes. Grouping uses a union-find over a coarse grid of cells, so only
+boxes that share a cell are compared and noisy frames with thousands of
+fragments merge in near-linear time. The result is the same set of regions as detect_motion()
+(possibly in a different order).
+
+Example usage:
+    with TiledMotionDetector(tiles=(4, 4), workers=8) as detector:
+        regions = detector.detect(prev_frame, current_frame)
+
+Topics: Parallelism, video processing
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .motion_detector import MIN_AREA, THRESHOLD
+
+# detect_motion() dilates twice with a 3x3 kernel, so a mask pixel depends on
+# input pixels up to 2 pixels away
+DILATION_ITERATIONS: int = 2
+DILATION_HALO: int = DILATION_ITERATIONS
+# Side length in pixels of the grid cells boxes are bucketed into when merging
+MERGE_CELL_SIZE: int = 64
+
+
+def _boxes_touch(a: tuple, b: tuple) -> bool:
+    """True if two (x, y, w, h) boxes overlap or are 8-adjacent."""
+    return (
+        a[0] <= b[0] + b[2]
+        and b[0] <= a[0] + a[2]
+        and a[1] <= b[1] + b[3]
+        and b[1] <= a[1] + a[3]
+    )
+
+
+def _box_cells(box: tuple) -> list:
+    """Grid cells covered by a box grown by one pixel, so touching boxes share a cell."""
+    x, y, w, h = box
+    return [
+        (cx, cy)
+        for cy in range(y // MERGE_CELL_SIZE, (y + h) // MERGE_CELL_SIZE + 1)
+        for cx in range(x // MERGE_CELL_SIZE, (x + w) // MERGE_CELL_SIZE + 1)
+    ]
+
+
+def _touching_groups(boxes: list) -> list:
+    """
+    Groups (x, y, w, h) boxes that touch, directly or through other boxes.
+
+    Returns:
+        list: Lists of box indices, one per group.
+    """
+    parent = list(range(len(boxes)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    cells: dict = {}  # Cell -> indices of the boxes covering it
+    for i, box in enumerate(boxes):
+        for cell in _box_cells(box):
+            bucket = cells.setdefault(cell, [])
+            for j in bucket:
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j and _boxes_touch(box, boxes[j]):
+                    parent[root_i] = root_j
+            bucket.append(i)
+
+    groups: dict = {}
+    for i in range(len(boxes)):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
+
+def _union_box(boxes: list) -> tuple:
+    """Smallest (x, y, w, h) box containing all given boxes."""
+    x0 = min(b[0] for b in boxes)
+    y0 = min(b[1] for b in boxes)
+    x1 = max(b[0] + b[2] for b in boxes)
+    y1 = max(b[1] + b[3] for b in boxes)
+    return (x0, y0, x1 - x0, y1 - y0)
+
+
+class TiledMotionDetector:
+    """Runs frame-differencing motion detection over a grid of tiles in parallel."""
+
+    def __init__(
+        self,
+        threshold: int = THRESHOLD,
+        min_area: int = MIN_AREA,
+        tiles: Tuple[int, int] = (2, 2),
+        workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            threshold (int): The pixel intensity change required to consider motion.
+            min_area (int): The minimum area in pixels for a contour to be considered motion.
+            tiles (tuple): Number of tile (rows, columns).
+            workers (int, optional): Number of worker threads; defaults to one per tile.
+
+        Raises:
+            ValueError: If the tile grid is empty.
+        """
+        if tiles[0] < 1 or tiles[1] < 1:
+            raise ValueError(f"tiles must be at least (1, 1), got {tiles}")
+        self.threshold = threshold
+        self.min_area = min_area
+        self.tiles = tiles
+        self.workers = workers or tiles[0] * tiles[1]
+
+        self.kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self._mask: Optional[np.ndarray] = None  # Shared full-frame motion mask
+        self._cores: List[tuple] = []  # (x0, y0, x1, y1) of each tile
+        self._buffers: List[list] = []  # Per-tile [delta, dilated] work buffers
+
+    def detect(self, prev_frame, current_frame) -> list:
+        """
+        Detects motion by comparing the current and previous frames.
+
+        Args:
+            prev_frame (numpy.ndarray): The previous frame in grayscale.
+            current_frame (numpy.ndarray): The current frame in grayscale.
+
+        Returns:
+            list: A list of bounding boxes for the regions with detected motion,
+                  the same set as detect_motion() returns.
+        """
+        if self._mask is None or self._mask.shape != current_frame.shape:
+            self._layout(current_frame.shape)
+
+        tile_results = list(
+            self._executor.map(
+                lambda index: self._detect_tile(index, prev_frame, current_frame),
+                range(len(self._cores)),
+            )
+        )
+        interior = [region for regions, _ in tile_results for region in regions]
+        fragments = [box for _, boxes in tile_results for box in boxes]
+        return self._merge(interior, fragments)
+
+    def close(self) -> None:
+        """Shuts down the worker threads."""
+        self._executor.shutdown()
+
+    def __enter__(self) -> "TiledMotionDetector":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _layout(self, shape: tuple) -> None:
+        """Splits the frame into tile cores and allocates the shared mask."""
+        height, width = shape[:2]
+        rows = np.linspace(0, height, self.tiles[0] + 1).astype(int)
+        cols = np.linspace(0, width, self.tiles[1] + 1).astype(int)
+        self._cores = [
+            (cols[c], rows[r], cols[c + 1], rows[r + 1])
+            for r in range(self.tiles[0])
+            for c in range(self.tiles[1])
+        ]
+        self._mask = np.zeros(shape[:2], dtype=np.uint8)
+        self._buffers = [[None, None] for _ in self._cores]
+        self._width, self._height = width, height
+
+    def _detect_tile(self, index: int, prev_frame, current_frame) -> tuple:
+        """
+        Computes the mask of one tile and extracts its contours.
+
+        Returns:
+            tuple: (regions of blobs entirely inside the tile, as
+                   (box, contour point) pairs; boxes of blob fragments that
+                   touch an internal tile border).
+        """
+        x0, y0, x1, y1 = self._cores[index]
+        # Expand the tile by the halo (clipped to the frame) for the mask computation
+        hx0, hy0 = max(x0 - DILATION_HALO, 0), max(y0 - DILATION_HALO, 0)
+        hx1 = min(x1 + DILATION_HALO, self._width)
+        hy1 = min(y1 + DILATION_HALO, self._height)
+
+        buffers = self._buffers[index]
+        delta = buffers[0] = cv2.absdiff(
+            prev_frame[hy0:hy1, hx0:hx1],
+            current_frame[hy0:hy1, hx0:hx1],
+            dst=buffers[0],
+        )
+        cv2.threshold(delta, self.threshold, 255, cv2.THRESH_BINARY, dst=delta)
+        dilated = buffers[1] = cv2.dilate(
+            delta, self.kernel, dst=buffers[1], iterations=DILATION_ITERATIONS
+        )
+
+        # Only the tile core is exact; publish it to the shared mask
+        core = self._mask[y0:y1, x0:x1]
+        np.copyto(core, dilated[y0 - hy0 : y1 - hy0, x0 - hx0 : x1 - hx0])
+
+        contours, _ = cv2.findContours(
+            core, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE, offset=(int(x0), int(y0))
+        )
+        regions, fragments = [], []
+        for contour in contours:
+            box = cv2.boundingRect(contour)
+            if self._touches_internal_border(box, (x0, y0, x1, y1)):
+                fragments.append(box)
+            elif cv2.contourArea(contour) >= self.min_area:
+                regions.append((box, tuple(float(v) for v in contour[0, 0])))
+        return regions, fragments
+
+    def _touches_internal_border(self, box: tuple, core: tuple) -> bool:
+        """True if a box reaches a tile edge that is not the frame edge."""
+        x, y, w, h = box
+        x0, y0, x1, y1 = core
+        return (
+            (x == x0 and x0 > 0)
+            or (y == y0 and y0 > 0)
+            or (x + w == x1 and x1 < self._width)
+            or (y + h == y1 and y1 < self._height)
+        )
+
+    def _is_interior(self, box: tuple) -> bool:
+        """True if a blob's box was finished by a single tile in _detect_tile()."""
+        x, y, w, h = box
+        for core in self._cores:
+            x0, y0, x1, y1 = core
+            if x0 <= x and y0 <= y and x + w <= x1 and y + h <= y1:
+                return not self._touches_internal_border(box, core)
+        return False
+
+    def _merge(self, interior: list, fragments: list) -> list:
+        """Re-extracts blobs that cross tile borders and combines all regions."""
+        # Group fragments whose boxes touch, then merge groups until their
+        # union boxes are disjoint, so each union box holds complete blobs
+        unions = fragments
+        while True:
+            groups = _touching_groups(unions)
+            if len(groups) == len(unions):
+                break
+            unions = [_union_box([unions[i] for i in group]) for group in groups]
+
+        regions = []
+        crossing = []  # Outer contours of the blobs that cross tile borders
+        cells: dict = {}  # Grid cell -> indices into crossing
+        for x, y, w, h in unions:
+            contours, _ = cv2.findContours(
+                self._mask[y : y + h, x : x + w],
+                cv2.RETR_EXTERNAL,
+                cv2.CHAIN_APPROX_SIMPLE,
+                offset=(int(x), int(y)),
+            )
+            for contour in contours:
+                box = cv2.boundingRect(contour)
+                # Blobs that stay within one tile were already handled by that tile
+                if self._is_interior(box):
+                    continue
+                for cell in _box_cells(box):
+                    cells.setdefault(cell, []).append(len(crossing))
+                crossing.append((box, contour))
+                if cv2.contourArea(contour) >= self.min_area:
+                    regions.append(box)
+
+        # A blob that looked external inside its tile may sit in a hole of a
+        # blob that crosses tile borders; the untiled detector ignores those
+        for box, point in interior:
+            candidates = {i for cell in _box_cells(box) for i in cells.get(cell, ())}
+            nested = any(
+                _boxes_touch(box, crossing[i][0])
+                and cv2.pointPolygonTest(crossing[i][1], point, False) > 0
+                for i in candidates
+            )
+            if not nested:
+                regions.append(box)
+        return regions
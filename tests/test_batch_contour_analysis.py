@@ -0,0 +1,153 @@
+import json
+import os
+import tempfile
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+import cv2
+import numpy as np
+from package.batch_contour_analysis import find_images, load_checkpoint, run_batch
+from package.contour_analysis import analyze_contours
+
+
+def write_shapes_image(path, seed):
+    """Writes a grayscale image with a few random filled rectangles."""
+    rng = np.random.default_rng(seed)
+    image = np.zeros((120, 160), dtype=np.uint8)
+    for _ in range(3):
+        x, y = int(rng.integers(0, 120)), int(rng.integers(0, 80))
+        cv2.rectangle(image, (x, y), (x + 30, y + 30), 255, -1)
+    cv2.imwrite(path, image)
+    return image
+
+
+class BrokenPool:
+    """Stands in for a ProcessPoolExecutor whose worker processes have died."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def submit(self, *args):
+        raise BrokenProcessPool("A child process terminated abruptly")
+
+
+def read_records(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestBatchContourAnalysis(unittest.TestCase):
+    """Unit tests for the headless batch contour analysis."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.image_dir = os.path.join(self.tmp.name, "images")
+        os.makedirs(os.path.join(self.image_dir, "sub"))
+        self.images = {}
+        for i in range(6):
+            folder = self.image_dir if i < 4 else os.path.join(self.image_dir, "sub")
+            path = os.path.join(folder, f"img{i}.png")
+            self.images[path] = write_shapes_image(path, i)
+        with open(os.path.join(self.image_dir, "notes.txt"), "w") as f:
+            f.write("not an image")
+        self.output = os.path.join(self.tmp.name, "results.jsonl")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_find_images(self):
+        self.assertEqual(sorted(find_images([self.image_dir])), sorted(self.images))
+        pattern = os.path.join(self.image_dir, "img[01].png")
+        self.assertEqual(len(list(find_images([pattern]))), 2)
+
+    def test_records_match_analyze_contours(self):
+        counts = run_batch([self.image_dir], self.output, workers=2, decode_workers=2)
+        self.assertEqual(counts, {"written": 6, "failed": 0, "skipped": 0})
+
+        records = read_records(self.output)
+        self.assertEqual(sorted(r["path"] for r in records), sorted(self.images))
+        for record in records:
+            expected = analyze_contours(self.images[record["path"]])
+            self.assertEqual((record["height"], record["width"]), (120, 160))
+            self.assertEqual(
+                [c["bbox"] for c in record["contours"]],
+                [list(info["bbox"]) for info in expected],
+            )
+            self.assertEqual(
+                [c["area"] for c in record["contours"]],
+                [info["area"] for info in expected],
+            )
+
+    def test_resume_skips_recorded_images(self):
+        first = os.path.join(self.image_dir, "img0.png")
+        run_batch([first], self.output, workers=1)
+        # Simulate a run interrupted while writing a record
+        with open(self.output, "a") as f:
+            f.write('{"path": "trunc')
+
+        counts = run_batch([self.image_dir], self.output, workers=2)
+        self.assertEqual(counts, {"written": 5, "failed": 0, "skipped": 1})
+        paths = [r["path"] for r in read_records(self.output)]
+        self.assertEqual(sorted(paths), sorted(self.images))
+
+        self.assertEqual(load_checkpoint(self.output), set(self.images))
+        counts = run_batch([self.image_dir], self.output, workers=1)
+        self.assertEqual(counts["written"], 0)
+
+    def test_unreadable_image_is_recorded_as_failure(self):
+        broken = os.path.join(self.image_dir, "broken.png")
+        with open(broken, "wb") as f:
+            f.write(b"not a png")
+        counts = run_batch([broken], self.output, workers=1, resume=False)
+        self.assertEqual(counts["failed"], 1)
+        self.assertIn("error", read_records(self.output)[0])
+
+    def test_failed_images_are_retried_on_resume(self):
+        first = os.path.join(self.image_dir, "img0.png")
+        with open(self.output, "w") as f:
+            f.write(json.dumps({"path": first, "error": "OSError: temporary"}) + "\n")
+        self.assertEqual(load_checkpoint(self.output), set())
+
+        counts = run_batch([first], self.output, workers=1)
+        self.assertEqual(counts, {"written": 1, "failed": 0, "skipped": 0})
+        self.assertEqual(load_checkpoint(self.output), {first})
+
+    def test_broken_process_pool_fails_remaining_images(self):
+        target = "package.batch_contour_analysis.ProcessPoolExecutor"
+        with mock.patch(target, BrokenPool):
+            counts = run_batch([self.image_dir], self.output, max_in_flight=2)
+        self.assertEqual(counts, {"written": 0, "failed": 6, "skipped": 0})
+        records = read_records(self.output)
+        self.assertEqual(sorted(r["path"] for r in records), sorted(self.images))
+        self.assertTrue(all("BrokenProcessPool" in r["error"] for r in records))
+
+        # The failures are retried once the pool works again
+        counts = run_batch([self.image_dir], self.output, workers=2)
+        self.assertEqual(counts, {"written": 6, "failed": 0, "skipped": 0})
+
+    def test_workers_are_not_forked(self):
+        # Forking while decoder threads run could deadlock the workers
+        contexts = []
+
+        class RecordingPool(BrokenPool):
+            def __init__(self, *args, mp_context=None):
+                contexts.append(mp_context)
+
+        target = "package.batch_contour_analysis.ProcessPoolExecutor"
+        with mock.patch(target, RecordingPool):
+            run_batch([self.image_dir], self.output, workers=1)
+        self.assertIn(contexts[0].get_start_method(), ("forkserver", "spawn"))
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            run_batch([self.image_dir], self.output, method="unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
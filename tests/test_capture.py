@@ -0,0 +1,97 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+import cv2
+import numpy as np
+from package.capture import ThreadedCapture
+
+
+def write_test_video(path, num_frames=20, size=(64, 48)):
+    """Writes a small MJPG video whose frames encode their index as brightness."""
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 30, size)
+    for i in range(num_frames):
+        writer.write(np.full((size[1], size[0], 3), i * 10, dtype=np.uint8))
+    writer.release()
+
+
+class FakeCamera:
+    """Capture-like source producing numbered frames at a fixed rate."""
+
+    def __init__(self, num_frames, interval=0.0):
+        self.num_frames = num_frames
+        self.interval = interval
+        self.index = 0
+        self.released = threading.Event()
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        if self.index >= self.num_frames:
+            return False, None
+        time.sleep(self.interval)
+        self.index += 1
+        return True, np.full((4, 4), self.index, dtype=np.uint8)
+
+    def release(self):
+        self.released.set()
+
+
+class TestThreadedCapture(unittest.TestCase):
+    def test_video_file_without_dropping(self):
+        """With drop_frames=False every frame of a file is delivered in order."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "test.avi")
+            write_test_video(path)
+            with ThreadedCapture(path, drop_frames=False) as cap:
+                frames = []
+                while True:
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    frames.append(frame)
+
+            self.assertEqual(len(frames), 20)
+            self.assertEqual(cap.frames_dropped, 0)
+            brightness = [int(round(f.mean() / 10)) for f in frames]
+            self.assertEqual(brightness, list(range(20)))
+            self.assertFalse(cap.isOpened())
+
+    def test_slow_consumer_gets_latest_frames(self):
+        """A slow consumer skips stale frames instead of falling behind."""
+        cap = ThreadedCapture(FakeCamera(num_frames=30, interval=0.002))
+        received = []
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            received.append(int(frame[0, 0]))
+            time.sleep(0.02)  # Processing is ~10x slower than the camera
+        cap.release()
+
+        self.assertGreater(cap.frames_dropped, 0)
+        self.assertEqual(cap.frames_captured, 30)
+        self.assertEqual(cap.frames_read + cap.frames_dropped, 30)
+        self.assertEqual(received, sorted(received))
+        self.assertEqual(received[-1], 30)
+        self.assertGreater(cap.average_latency, 0.0)
+
+    def test_release_stops_grabber(self):
+        camera = FakeCamera(num_frames=10**6, interval=0.001)
+        cap = ThreadedCapture(camera)
+        self.assertTrue(cap.read(timeout=1.0)[0])
+        cap.release()
+        self.assertTrue(camera.released.is_set())
+        self.assertFalse(cap._thread.is_alive())
+
+    def test_missing_file(self):
+        cap = ThreadedCapture("does_not_exist.avi")
+        self.assertFalse(cap.isOpened())
+        self.assertEqual(cap.read(), (False, None))
+        cap.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,13 @@
+import pickle
 import unittest
 import cv2
 import numpy as np
-from package.contour_analysis import analyze_contours, draw_contours_and_bboxes
+from package.contour_analysis import (
+    ContourRecord,
+    ContourTable,
+    analyze_contours,
+    draw_contours_and_bboxes,
+)
 
 
 class TestContourAnalysis(unittest.TestCase):
@@ -55,6 +61,29 @@ class TestContourAnalysis(unittest.TestCase):
         # Ensure the resulting image has been modified (i.e., the rectangle is drawn)
         self.assertTrue(np.any(result_image != image))
 
+    def test_approximations_are_drawn_over_boxes(self):
+        # Two triangles whose bounding boxes cross each other's approximation
+        image = np.zeros((130, 130), dtype=np.uint8)
+        cv2.fillPoly(image, [np.array([(20, 20), (100, 20), (20, 100)])], 255)
+        cv2.fillPoly(image, [np.array([(30, 110), (110, 110), (110, 30)])], 255)
+        contours_info = analyze_contours(image, area_threshold=100)
+        self.assertEqual(len(contours_info), 2)
+
+        canvas = np.zeros((130, 130, 3), dtype=np.uint8)
+        box_mask = np.zeros((130, 130), dtype=np.uint8)
+        approx_mask = np.zeros((130, 130), dtype=np.uint8)
+        for info in contours_info:
+            x, y, w, h = info["bbox"]
+            cv2.rectangle(box_mask, (x, y), (x + w, y + h), 255, 2)
+            cv2.polylines(approx_mask, [info["approx"]], True, 255, 2)
+        overlap = (box_mask > 0) & (approx_mask > 0)
+        self.assertTrue(overlap.any())
+
+        # Boxes are drawn first, then all approximations on top of them
+        result = draw_contours_and_bboxes(canvas, contours_info)
+        self.assertTrue((result[overlap] == (0, 0, 255)).all())
+        self.assertTrue((result[(box_mask > 0) & ~overlap] == (0, 255, 0)).all())
+
     def test_empty_image(self):
         # Test an empty image (no contours)
         empty_image = np.zeros((200, 200), dtype=np.uint8)
@@ -66,5 +95,161 @@ class TestContourAnalysis(unittest.TestCase):
         self.assertEqual(len(contours_info), 0)
 
 
+class TestComponentsBackend(unittest.TestCase):
+    """Unit tests for the connected-components contour extraction backend."""
+
+    def summarize(self, contours_info):
+        return sorted((c["bbox"], c["area"], c["corners"]) for c in contours_info)
+
+    def test_matches_contours_backend(self):
+        """Same contours as findContours, including rings with blobs in their holes."""
+        image = np.zeros((300, 300), dtype=np.uint8)
+        cv2.rectangle(image, (20, 20), (120, 120), 255, -1)
+        cv2.circle(image, (200, 200), 70, 255, 8)  # Ring...
+        cv2.circle(image, (200, 200), 25, 255, -1)  # ...with a blob in its hole
+        noise = np.random.default_rng(0).random(image.shape) < 0.03
+        image[noise] = 255
+
+        expected = analyze_contours(image, area_threshold=100)
+        actual = analyze_contours(image, area_threshold=100, method="components")
+        self.assertEqual(len(actual), 2)
+        self.assertEqual(self.summarize(actual), self.summarize(expected))
+
+    def test_many_small_blobs(self):
+        """Thousands of specks, some nested in a ring, with a low area threshold."""
+        image = np.zeros((600, 800), dtype=np.uint8)
+        image[::6, ::6] = 255  # 10000 single pixels...
+        image[3::6, 3::6] = 255
+        image[3::6, 4::6] = 255
+        image[4::6, 3::6] = 255
+        image[4::6, 4::6] = 255  # ...and 10000 2x2 squares
+        cv2.circle(image, (400, 300), 150, 255, 5)
+
+        expected = analyze_contours(image, area_threshold=1)
+        actual = analyze_contours(image, area_threshold=1, method="components")
+        self.assertGreater(len(actual), 9000)
+        self.assertEqual(self.summarize(actual), self.summarize(expected))
+
+    def test_unknown_method_raises(self):
+        with self.assertRaises(ValueError):
+            analyze_contours(np.zeros((10, 10), dtype=np.uint8), method="hull")
+
+
+def shapes_image(seed=0, size=400, count=40):
+    """Binary image with random rectangles and circles of various sizes."""
+    rng = np.random.default_rng(seed)
+    image = np.zeros((size, size), dtype=np.uint8)
+    for _ in range(count):
+        x, y = (int(v) for v in rng.integers(0, size, 2))
+        if rng.random() < 0.5:
+            cv2.rectangle(
+                image, (x, y), (x + int(rng.integers(3, 40)), y + 20), 255, -1
+            )
+        else:
+            cv2.circle(image, (x, y), int(rng.integers(3, 25)), 255, -1)
+    return image
+
+
+class TestColumnarOutput(unittest.TestCase):
+    """Unit tests for the ContourTable output format."""
+
+    def setUp(self):
+        self.image = shapes_image()
+        self.dicts = analyze_contours(self.image, area_threshold=50)
+        self.table = analyze_contours(
+            self.image, area_threshold=50, output_format="columnar"
+        )
+
+    def test_matches_dicts(self):
+        self.assertIsInstance(self.table, ContourTable)
+        self.assertEqual(len(self.table), len(self.dicts))
+        for i, info in enumerate(self.dicts):
+            self.assertEqual(tuple(self.table.bboxes[i]), info["bbox"])
+            self.assertEqual(self.table.areas[i], info["area"])
+            self.assertEqual(self.table.corners[i], info["corners"])
+            np.testing.assert_array_equal(self.table.approx(i), info["approx"])
+
+    def test_to_dicts_round_trip(self):
+        converted = self.table.to_dicts()
+        self.assertEqual(
+            [(c["bbox"], c["area"], c["corners"]) for c in converted],
+            [(c["bbox"], c["area"], c["corners"]) for c in self.dicts],
+        )
+
+    def test_approx_is_a_view(self):
+        self.assertTrue(np.shares_memory(self.table.approx(0), self.table.vertices))
+
+    def test_pickle_is_smaller(self):
+        restored = pickle.loads(pickle.dumps(self.table))
+        np.testing.assert_array_equal(restored.records, self.table.records)
+        np.testing.assert_array_equal(restored.vertices, self.table.vertices)
+        self.assertLess(len(pickle.dumps(self.table)), len(pickle.dumps(self.dicts)))
+
+    def test_draw_matches_dicts(self):
+        canvas = np.zeros(self.image.shape + (3,), dtype=np.uint8)
+        expected = draw_contours_and_bboxes(canvas.copy(), self.dicts)
+        actual = draw_contours_and_bboxes(canvas.copy(), self.table)
+        np.testing.assert_array_equal(actual, expected)
+
+    def test_empty_table(self):
+        table = analyze_contours(
+            np.zeros((50, 50), dtype=np.uint8), output_format="columnar"
+        )
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.approx_list(), [])
+        self.assertEqual(table.to_dicts(), [])
+        canvas = np.zeros((50, 50, 3), dtype=np.uint8)
+        self.assertFalse(draw_contours_and_bboxes(canvas, table).any())
+
+    def test_unknown_output_format_raises(self):
+        with self.assertRaises(ValueError):
+            analyze_contours(self.image, output_format="arrow")
+
+
+class TestLazyOutput(unittest.TestCase):
+    """Unit tests for the lazily evaluated ContourRecord output format."""
+
+    def setUp(self):
+        self.image = shapes_image(seed=1)
+        self.dicts = analyze_contours(self.image, area_threshold=50)
+        self.records = analyze_contours(
+            self.image, area_threshold=50, output_format="lazy"
+        )
+
+    def test_matches_dicts(self):
+        self.assertEqual(len(self.records), len(self.dicts))
+        for record, info in zip(self.records, self.dicts):
+            self.assertIsInstance(record, ContourRecord)
+            self.assertEqual(record.bbox, info["bbox"])
+            self.assertEqual(record["area"], info["area"])
+            self.assertEqual(record["corners"], info["corners"])
+            np.testing.assert_array_equal(record.approx, info["approx"])
+
+    def test_properties_are_computed_on_demand_and_cached(self):
+        record = self.records[0]
+        self.assertIsNone(record._approx)
+        approx = record.approx
+        self.assertIsNotNone(record._perimeter)
+        self.assertIs(record.approx, approx)
+        self.assertEqual(record.moments["m00"], record.area)
+        self.assertIs(record.hull, record.hull)
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            self.records[0].extra = 1
+        with self.assertRaises(KeyError):
+            self.records[0]["contour"]
+
+    def test_draw_and_to_dict(self):
+        canvas = np.zeros(self.image.shape + (3,), dtype=np.uint8)
+        np.testing.assert_array_equal(
+            draw_contours_and_bboxes(canvas.copy(), self.records),
+            draw_contours_and_bboxes(canvas.copy(), self.dicts),
+        )
+        self.assertEqual(
+            sorted(self.records[0].to_dict()), ["approx", "area", "bbox", "corners"]
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+from package.frame_smoother import FrameSmoother
+from package.motion_detector import detect_motion
+
+
+class TestFrameSmoother(unittest.TestCase):
+    """Unit tests for the FrameSmoother class."""
+
+    def setUp(self):
+        self.shape = (4, 6, 3)
+
+    def test_average_and_eviction(self):
+        """Output is the rounded mean of the last N frames."""
+        smoother = FrameSmoother(window_size=2)
+        frames = [np.full(self.shape, v, dtype=np.uint8) for v in (10, 21, 255)]
+
+        np.testing.assert_array_equal(smoother.update(frames[0]), frames[0])
+        self.assertTrue(np.all(smoother.update(frames[1]) == 16))  # round(15.5)
+        self.assertTrue(np.all(smoother.update(frames[2]) == 138))  # round(138.0)
+
+    def test_output_buffer_is_reused(self):
+        smoother = FrameSmoother(window_size=3)
+        first = smoother.update(np.zeros(self.shape, dtype=np.uint8))
+        second = smoother.update(np.ones(self.shape, dtype=np.uint8))
+        self.assertIs(first, second)
+
+    def test_matches_mean_of_recent_frames(self):
+        rng = np.random.default_rng(0)
+        frames = rng.integers(0, 256, size=(20,) + self.shape, dtype=np.uint8)
+        smoother = FrameSmoother(window_size=5)
+        for frame in frames:
+            result = smoother.update(frame)
+        expected = np.floor(frames[-5:].astype(np.float64).mean(axis=0) + 0.5)
+        np.testing.assert_array_equal(result, expected.astype(np.uint8))
+
+    def test_shape_change_raises(self):
+        smoother = FrameSmoother()
+        smoother.update(np.zeros(self.shape, dtype=np.uint8))
+        with self.assertRaises(ValueError):
+            smoother.update(np.zeros((5, 5, 3), dtype=np.uint8))
+
+    def test_suppresses_noise_before_motion_detection(self):
+        """Averaging static noisy frames removes spurious motion regions."""
+        rng = np.random.default_rng(1)
+        background = np.full((120, 160), 100, dtype=np.int16)
+
+        def noisy_frame():
+            noise = rng.integers(-40, 41, size=background.shape)
+            return np.clip(background + noise, 0, 255).astype(np.uint8)
+
+        raw_prev, raw_curr = noisy_frame(), noisy_frame()
+        self.assertGreater(len(detect_motion(raw_prev, raw_curr)), 0)
+
+        smoother = FrameSmoother(window_size=16)
+        for _ in range(16):
+            smoother.update(noisy_frame())
+        prev = smoother.output.copy()
+        for _ in range(4):
+            smoother.update(noisy_frame())
+        self.assertEqual(len(detect_motion(prev, smoother.output)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
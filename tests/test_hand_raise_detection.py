@@ -1,6 +1,7 @@
 import unittest
 from collections import namedtuple
 import logging
+import numpy as np
 from package.hand_raise_detection import HandRaiseDetector
 
 # Set up logging configuration
@@ -65,6 +66,18 @@ class TestHandRaiseDetection(unittest.TestCase):
         logging.info("Running test: No hands raised.")
         self.assertFalse(self.detector.is_hand_raised(landmarks))
 
+    def test_process_frame_without_drawing(self):
+        # Detectors do not draw unless asked to
+        detector = HandRaiseDetector()
+        self.assertFalse(detector.draw)
+        frame = np.zeros((120, 160, 3), dtype=np.uint8)
+        frame[:, :80] = 255
+        processed, hand_raised = detector.process_frame(frame)
+        # Only flipped: no person in the frame, and nothing drawn
+        np.testing.assert_array_equal(processed, frame[:, ::-1])
+        self.assertFalse(hand_raised)
+        self.assertIsNone(detector.last_landmarks)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+import cv2
+import numpy as np
+from package.contour_analysis import analyze_contours
+from package.incremental_contours import IncrementalContourAnalyzer
+
+
+def summarize(contours_info):
+    return sorted(
+        (c["bbox"], c["area"], c["corners"], c["approx"].tobytes())
+        for c in contours_info
+    )
+
+
+def random_shapes(rng, image, count, color=255):
+    """Draws random filled discs and rings (which can hold blobs in their holes)."""
+    height, width = image.shape
+    for _ in range(count):
+        center = (int(rng.integers(0, width)), int(rng.integers(0, height)))
+        thickness = -1 if rng.random() < 0.6 else int(rng.integers(1, 5))
+        cv2.circle(image, center, int(rng.integers(2, 40)), color, thickness)
+
+
+class TestIncrementalContourAnalyzer(unittest.TestCase):
+    """Unit tests for the dirty-region based incremental contour analysis."""
+
+    def test_matches_full_analysis(self):
+        rng = np.random.default_rng(0)
+        for _ in range(10):
+            image = np.zeros((240, 320), dtype=np.uint8)
+            random_shapes(rng, image, 25)
+            analyzer = IncrementalContourAnalyzer(
+                area_threshold=int(rng.integers(1, 200)),
+                tile_size=int(rng.integers(4, 40)),
+            )
+            for _ in range(10):
+                # Add and erase a few shapes per frame
+                random_shapes(rng, image, int(rng.integers(0, 3)))
+                random_shapes(rng, image, int(rng.integers(0, 2)), color=0)
+                self.assertEqual(
+                    summarize(analyzer.analyze(image)),
+                    summarize(analyze_contours(image, analyzer.area_threshold)),
+                )
+
+    def test_blob_merging_with_small_cached_blob(self):
+        # A speck below the area threshold joins a growing blob in the next frame
+        image = np.zeros((200, 200), dtype=np.uint8)
+        cv2.rectangle(image, (100, 100), (104, 104), 255, -1)
+        analyzer = IncrementalContourAnalyzer(area_threshold=100, tile_size=8)
+        self.assertEqual(analyzer.analyze(image), [])
+        cv2.rectangle(image, (60, 90), (99, 130), 255, -1)
+        self.assertEqual(
+            summarize(analyzer.analyze(image)),
+            summarize(analyze_contours(image, 100)),
+        )
+
+    def test_static_frames_reuse_the_cache(self):
+        image = np.zeros((256, 256), dtype=np.uint8)
+        random_shapes(np.random.default_rng(1), image, 20)
+        analyzer = IncrementalContourAnalyzer(area_threshold=50)
+        first = analyzer.analyze(image)
+        second = analyzer.analyze(image.copy())
+        self.assertEqual(analyzer.last_dirty_fraction, 0.0)
+        self.assertEqual(summarize(second), summarize(first))
+        # The cached dicts are returned as they are
+        self.assertTrue(all(a is b for a, b in zip(first, second)))
+
+    def test_small_change_reanalyzes_a_small_area(self):
+        image = np.zeros((512, 512), dtype=np.uint8)
+        cv2.rectangle(image, (10, 10), (60, 60), 255, -1)
+        cv2.rectangle(image, (400, 400), (480, 480), 255, -1)
+        analyzer = IncrementalContourAnalyzer()
+        analyzer.analyze(image)
+        cv2.rectangle(image, (20, 20), (30, 30), 0, -1)  # Punch a hole
+        result = analyzer.analyze(image)
+        self.assertLess(analyzer.last_dirty_fraction, 0.05)
+        self.assertEqual(analyzer.full_analyses, 1)
+        self.assertEqual(summarize(result), summarize(analyze_contours(image)))
+
+    def test_large_change_falls_back_to_full_analysis(self):
+        analyzer = IncrementalContourAnalyzer()
+        analyzer.analyze(np.zeros((100, 100), dtype=np.uint8))
+        analyzer.analyze(np.full((100, 100), 255, dtype=np.uint8))
+        self.assertEqual(analyzer.full_analyses, 2)
+
+    def test_many_scattered_changes_fall_back_to_full_analysis(self):
+        image = np.zeros((1024, 1024), dtype=np.uint8)
+        analyzer = IncrementalContourAnalyzer(area_threshold=1, tile_size=32)
+        analyzer.analyze(image)
+        # 64 isolated changes, in 6 % of the tiles, are re-extracted one by one
+        image[16::128, 16::128] = 255
+        image[16, 16:18] = 255
+        analyzer.analyze(image)
+        self.assertEqual(analyzer.full_analyses, 1)
+
+        # 121 isolated changes are still only in 12 % of the tiles, but too
+        # many separate regions to pay off
+        image[48::96, 48::96] = 255
+        result = analyzer.analyze(image)
+        self.assertEqual(analyzer.full_analyses, 2)
+        self.assertEqual(summarize(result), summarize(analyze_contours(image, 1)))
+
+    def test_shape_change_and_reset(self):
+        analyzer = IncrementalContourAnalyzer()
+        image = np.zeros((100, 100), dtype=np.uint8)
+        cv2.rectangle(image, (10, 10), (50, 50), 255, -1)
+        self.assertEqual(len(analyzer.analyze(image)), 1)
+        self.assertEqual(len(analyzer.analyze(np.zeros((50, 80), np.uint8))), 0)
+        analyzer.reset()
+        self.assertEqual(len(analyzer.analyze(image)), 1)
+        self.assertEqual(analyzer.full_analyses, 3)
+
+    def test_invalid_tile_size(self):
+        with self.assertRaises(ValueError):
+            IncrementalContourAnalyzer(tile_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import importlib.util
+import unittest
+import numpy as np
+from package import joint_angles
+from package.joint_angles import JOINT_TRIPLETS, JointAngleEngine
+from package.pose_angle_calculator import calculate_angles
+
+
+class TestJointAngleEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = JointAngleEngine()
+        self.landmarks = np.random.default_rng(0).uniform(0, 1, size=(5, 33, 3))
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("mediapipe"), "mediapipe is not installed"
+    )
+    def test_landmark_indices_match_mediapipe(self):
+        """The hard-coded indices agree with MediaPipe's PoseLandmark enum."""
+        import mediapipe as mp
+
+        pose_landmark = mp.solutions.pose.PoseLandmark
+        for name in ("LEFT_SHOULDER", "RIGHT_KNEE", "LEFT_FOOT_INDEX", "RIGHT_HIP"):
+            self.assertEqual(getattr(joint_angles, name), pose_landmark[name].value)
+
+    def test_matches_per_joint_calculation(self):
+        angles = self.engine.compute(self.landmarks)
+        self.assertEqual(angles.shape, (5, len(JOINT_TRIPLETS)))
+        for j, name in enumerate(self.engine.joint_names):
+            triplets = self.landmarks[:, list(JOINT_TRIPLETS[name])]
+            np.testing.assert_allclose(angles[:, j], calculate_angles(triplets))
+
+    def test_right_angle_elbow(self):
+        landmarks = np.zeros((33, 2))
+        landmarks[joint_angles.LEFT_SHOULDER] = (0.5, 0.2)
+        landmarks[joint_angles.LEFT_ELBOW] = (0.5, 0.4)
+        landmarks[joint_angles.LEFT_WRIST] = (0.7, 0.4)
+        engine = JointAngleEngine(joints=["left_elbow"])
+        np.testing.assert_allclose(engine.compute(landmarks), [90.0])
+
+    def test_low_visibility_joints_are_nan(self):
+        visibility = np.ones((5, 33))
+        visibility[2, joint_angles.RIGHT_KNEE] = 0.1
+        angles = self.engine.compute(self.landmarks, visibility=visibility)
+
+        masked = np.isnan(angles)
+        expected = {
+            name
+            for name, triplet in JOINT_TRIPLETS.items()
+            if joint_angles.RIGHT_KNEE in triplet
+        }
+        self.assertEqual(
+            {self.engine.joint_names[j] for j in np.flatnonzero(masked[2])}, expected
+        )
+        self.assertFalse(masked[[0, 1, 3, 4]].any())
+
+    def test_invalid_shape_raises(self):
+        with self.assertRaises(ValueError):
+            self.engine.compute(np.zeros((5, 17, 3)))
+
+
+if __name__ == "__main__":
+    unittest.main()
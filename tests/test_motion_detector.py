@@ -1,5 +1,5 @@
 import unittest
-from package.motion_detector import detect_motion
+from package.motion_detector import MotionDetector, detect_motion, extract_regions
 import cv2
 import numpy as np
 
@@ -73,5 +73,209 @@ class TestMotionDetection(unittest.TestCase):
         )
 
 
+def random_blob_frames(rng, shape=(240, 320), num_blobs=8):
+    """Creates a pair of noisy grayscale frames with randomly placed moving blobs."""
+    prev_frame = rng.integers(0, 20, size=shape, dtype=np.uint8)
+    current_frame = prev_frame.copy()
+    for _ in range(num_blobs):
+        x, y = rng.integers(0, shape[1]), rng.integers(0, shape[0])
+        radius = int(rng.integers(3, 30))
+        cv2.circle(current_frame, (int(x), int(y)), radius, 255, -1)
+    return prev_frame, current_frame
+
+
+class TestMotionDetector(unittest.TestCase):
+    """Unit tests for the stateful, buffer-reusing MotionDetector."""
+
+    def test_matches_detect_motion(self):
+        rng = np.random.default_rng(0)
+        detector = MotionDetector()
+        for _ in range(20):
+            prev_frame, current_frame = random_blob_frames(rng)
+            self.assertEqual(
+                detector.detect(prev_frame, current_frame),
+                detect_motion(prev_frame, current_frame),
+            )
+
+    def test_buffers_are_reused(self):
+        rng = np.random.default_rng(1)
+        detector = MotionDetector()
+        detector.detect(*random_blob_frames(rng))
+        mask = detector._mask
+        detector.detect(*random_blob_frames(rng))
+        self.assertIs(detector._mask, mask)
+
+    def test_update_keeps_previous_frame(self):
+        """update() compares against its own copy of the last frame."""
+        rng = np.random.default_rng(2)
+        prev_frame, current_frame = random_blob_frames(rng)
+        detector = MotionDetector()
+
+        frame = prev_frame.copy()
+        self.assertEqual(detector.update(frame), [])
+        frame[:] = current_frame  # Caller reuses its buffer
+        self.assertEqual(
+            detector.update(frame), detect_motion(prev_frame, current_frame)
+        )
+
+
+class TestDownscaledMotionDetection(unittest.TestCase):
+    """Unit tests for motion detection on downscaled frames."""
+
+    def setUp(self):
+        self.prev_frame = np.zeros((480, 640), dtype=np.uint8)
+        self.current_frame = self.prev_frame.copy()
+        cv2.rectangle(self.current_frame, (200, 120), (279, 199), 255, -1)
+
+    def test_boxes_in_full_resolution_coordinates(self):
+        """A box found at 1/4 scale still covers the object at full resolution."""
+        regions = detect_motion(self.prev_frame, self.current_frame, downscale=4)
+        self.assertEqual(len(regions), 1)
+        x, y, w, h = regions[0]
+        full = detect_motion(self.prev_frame, self.current_frame)[0]
+        # Dilation happens at the reduced scale, so the box grows by a few
+        # reduced pixels on each side
+        self.assertLessEqual(abs(x - full[0]), 3 * 4)
+        self.assertLessEqual(abs(y - full[1]), 3 * 4)
+        self.assertLessEqual(abs(w - full[2]), 6 * 4)
+        self.assertLessEqual(abs(h - full[3]), 6 * 4)
+
+    def test_min_area_is_scaled(self):
+        """min_area keeps its full-resolution meaning at any downscale factor."""
+        small = self.prev_frame.copy()
+        cv2.rectangle(small, (10, 10), (16, 16), 255, -1)  # Well below MIN_AREA
+        for downscale in (1, 2):
+            self.assertEqual(
+                detect_motion(self.prev_frame, small, downscale=downscale), []
+            )
+
+    def test_detector_matches_function(self):
+        detector = MotionDetector(downscale=2)
+        self.assertEqual(
+            detector.detect(self.prev_frame, self.current_frame),
+            detect_motion(self.prev_frame, self.current_frame, downscale=2),
+        )
+        detector.update(self.prev_frame)
+        self.assertEqual(
+            detector.update(self.current_frame),
+            detect_motion(self.prev_frame, self.current_frame, downscale=2),
+        )
+
+    def test_invalid_downscale_raises(self):
+        with self.assertRaises(ValueError):
+            MotionDetector(downscale=0)
+
+
+class TestMotionPrecheck(unittest.TestCase):
+    """Unit tests for the pre-check that skips static frames."""
+
+    def setUp(self):
+        self.static_frame = np.full((240, 320), 80, dtype=np.uint8)
+        self.moving_frame = self.static_frame.copy()
+        cv2.rectangle(self.moving_frame, (50, 50), (100, 100), 255, -1)
+
+    def test_static_frames_are_skipped(self):
+        detector = MotionDetector(precheck_stride=4)
+        for _ in range(5):
+            self.assertEqual(detector.update(self.static_frame), [])
+        detector.update(self.moving_frame)
+
+        self.assertEqual(detector.frames_skipped, 4)
+        self.assertEqual(detector.frames_processed, 1)
+
+    def test_motion_passes_precheck(self):
+        """Frames with real motion give the same regions as without the pre-check."""
+        detector = MotionDetector(precheck_stride=4)
+        self.assertEqual(
+            detector.detect(self.static_frame, self.moving_frame),
+            detect_motion(self.static_frame, self.moving_frame),
+        )
+        self.assertEqual(detector.frames_skipped, 0)
+
+    def test_precheck_disabled_by_default(self):
+        detector = MotionDetector()
+        detector.detect(self.static_frame, self.static_frame)
+        self.assertEqual(detector.frames_processed, 1)
+        self.assertEqual(detector.frames_skipped, 0)
+
+
+class TestBackgroundModels(unittest.TestCase):
+    """Unit tests for the background-model modes of MotionDetector.update()."""
+
+    def setUp(self):
+        self.background = np.full((240, 320), 80, dtype=np.uint8)
+
+    def test_all_models_detect_new_object(self):
+        frame = self.background.copy()
+        cv2.rectangle(frame, (50, 50), (100, 100), 255, -1)
+        for model in ("running_average", "mog2", "knn"):
+            with self.subTest(model=model):
+                detector = MotionDetector(background=model)
+                for _ in range(20):  # Let the model learn the background
+                    detector.update(self.background)
+                self.assertEqual(detector.update(self.background), [])
+                self.assertEqual(detector.update(frame), [(48, 48, 55, 55)])
+
+    def test_running_average_catches_slow_mover(self):
+        """A square creeping 1 px per frame is missed by frame differencing only."""
+        frame_detector = MotionDetector()
+        average_detector = MotionDetector(background="running_average")
+        for detector in (frame_detector, average_detector):
+            detector.update(self.background)
+
+        for step in range(1, 15):
+            frame = self.background.copy()
+            cv2.rectangle(frame, (100 + step, 100), (160 + step, 160), 120, -1)
+            frame_regions = frame_detector.update(frame)
+            average_regions = average_detector.update(frame)
+
+        self.assertEqual(frame_regions, [])
+        self.assertEqual(len(average_regions), 1)
+
+    def test_unknown_model_raises(self):
+        with self.assertRaises(ValueError):
+            MotionDetector(background="median")
+
+
+class TestRegionMethods(unittest.TestCase):
+    """Unit tests for contour- and component-based region extraction."""
+
+    def test_components_match_contours(self):
+        """Blobs well above min_area give the same boxes with both methods."""
+        prev_frame = np.zeros((240, 320), dtype=np.uint8)
+        current_frame = prev_frame.copy()
+        cv2.rectangle(current_frame, (10, 10), (40, 40), 255, -1)
+        cv2.circle(current_frame, (200, 120), 30, 255, -1)
+        cv2.rectangle(current_frame, (100, 150), (110, 230), 255, -1)
+        cv2.rectangle(current_frame, (250, 20), (252, 22), 255, -1)  # Too small
+
+        expected = detect_motion(prev_frame, current_frame)
+        actual = detect_motion(prev_frame, current_frame, region_method="components")
+        self.assertEqual(len(actual), 3)
+        self.assertEqual(sorted(actual), sorted(expected))
+
+    def test_components_drop_noise(self):
+        mask = np.zeros((240, 320), dtype=np.uint8)
+        mask[np.random.default_rng(4).random(mask.shape) < 0.01] = 255
+        cv2.rectangle(mask, (100, 100), (150, 150), 255, -1)
+        regions = extract_regions(mask, method="components")
+        self.assertEqual(len(regions), 1)
+        self.assertEqual(regions, extract_regions(mask, method="contours"))
+
+    def test_detector_with_components(self):
+        prev_frame = np.zeros((240, 320), dtype=np.uint8)
+        current_frame = prev_frame.copy()
+        cv2.rectangle(current_frame, (50, 50), (80, 80), 255, -1)
+        detector = MotionDetector(region_method="components")
+        self.assertEqual(
+            detector.detect(prev_frame, current_frame),
+            detect_motion(prev_frame, current_frame),
+        )
+
+    def test_unknown_method_raises(self):
+        with self.assertRaises(ValueError):
+            MotionDetector(region_method="blobs")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,129 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+import cv2
+import numpy as np
+from package.motion_recorder import MotionRecorder
+
+
+def numbered_frame(index, size=(64, 48)):
+    """BGR frame whose brightness encodes its index."""
+    return np.full((size[1], size[0], 3), index * 10 % 250, dtype=np.uint8)
+
+
+def frame_count(path):
+    cap = cv2.VideoCapture(path)
+    count = 0
+    while cap.read()[0]:
+        count += 1
+    cap.release()
+    return count
+
+
+class BlockingWriter:
+    """VideoWriter stand-in whose write() waits until it is released."""
+
+    release_writes = threading.Event()
+
+    def __init__(self, *args):
+        pass
+
+    def isOpened(self):
+        return True
+
+    def write(self, frame):
+        self.release_writes.wait()
+
+    def release(self):
+        pass
+
+
+class TestMotionRecorder(unittest.TestCase):
+    """Unit tests for the motion-triggered segment recorder."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output_dir = os.path.join(self.tmp.name, "segments")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_segments_with_pre_and_post_roll(self):
+        # Motion in frames 20-24 and 60-61; the gap is longer than the post-roll
+        motion = [20 <= i < 25 or 60 <= i < 62 for i in range(100)]
+        with MotionRecorder(self.output_dir, pre_roll=5, post_roll=10) as recorder:
+            recorded = [
+                recorder.update(numbered_frame(i), m) for i, m in enumerate(motion)
+            ]
+
+        self.assertEqual(len(recorder.segments), 2)
+        self.assertEqual(recorded.index(True), 20)
+        self.assertEqual(sum(recorded), 5 + 10 + 2 + 10)
+        # Pre-roll + motion + post-roll frames end up in each file
+        self.assertEqual(frame_count(recorder.segments[0]), 5 + 5 + 10)
+        self.assertEqual(frame_count(recorder.segments[1]), 5 + 2 + 10)
+        self.assertEqual(recorder.frames_written, 37)
+        self.assertEqual(recorder.frames_dropped, 0)
+
+    def test_short_pause_does_not_split_segment(self):
+        motion = [i in (10, 15, 20) for i in range(40)]
+        with MotionRecorder(self.output_dir, pre_roll=0, post_roll=8) as recorder:
+            for i, m in enumerate(motion):
+                recorder.update(numbered_frame(i), m)
+        self.assertEqual(len(recorder.segments), 1)
+        self.assertEqual(frame_count(recorder.segments[0]), 11 + 8)
+
+    def test_segment_open_at_close_is_finished(self):
+        recorder = MotionRecorder(self.output_dir, pre_roll=3)
+        for i in range(10):
+            recorder.update(numbered_frame(i), i >= 5)
+        self.assertTrue(recorder.recording)
+        recorder.close()
+        self.assertFalse(recorder.recording)
+        self.assertEqual(frame_count(recorder.segments[0]), 8)
+
+    def test_grayscale_frames(self):
+        with MotionRecorder(self.output_dir, pre_roll=2, post_roll=0) as recorder:
+            for i in range(6):
+                recorder.update(numbered_frame(i)[:, :, 0].copy(), i == 3)
+        self.assertEqual(frame_count(recorder.segments[0]), 3)
+
+    def test_slots_are_preallocated(self):
+        with MotionRecorder(self.output_dir, pre_roll=4, max_pending=8) as recorder:
+            recorder.update(numbered_frame(0), False)
+            slots = recorder._slots
+            for i in range(1, 50):
+                recorder.update(numbered_frame(i), i % 7 == 0)
+            self.assertIs(recorder._slots, slots)
+            self.assertEqual(slots.shape, (12, 48, 64, 3))
+
+    def test_drops_frames_instead_of_blocking(self):
+        BlockingWriter.release_writes.clear()
+        with mock.patch("package.motion_recorder.cv2.VideoWriter", BlockingWriter):
+            recorder = MotionRecorder(self.output_dir, pre_roll=2, max_pending=3)
+            for i in range(20):
+                recorder.update(numbered_frame(i), True)
+            BlockingWriter.release_writes.set()
+            recorder.close()
+        self.assertGreater(recorder.frames_dropped, 0)
+        self.assertEqual(recorder.frames_written + recorder.frames_dropped, 20)
+
+    def test_rejects_mismatched_frames(self):
+        with MotionRecorder(self.output_dir) as recorder:
+            recorder.update(numbered_frame(0), False)
+            with self.assertRaises(ValueError):
+                recorder.update(numbered_frame(0, size=(32, 32)), False)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            MotionRecorder(self.output_dir, fps=0)
+        with self.assertRaises(ValueError):
+            MotionRecorder(self.output_dir, pre_roll=-1)
+        with self.assertRaises(ValueError):
+            MotionRecorder(self.output_dir, max_pending=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
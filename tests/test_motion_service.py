@@ -0,0 +1,143 @@
+import tempfile
+import threading
+import time
+import unittest
+import cv2
+import numpy as np
+from package.motion_detector import MotionDetector
+from package.motion_service import MotionService, is_live_source
+
+
+def moving_square_frames(num_frames, shape=(120, 320), step=10, color=False):
+    """Frames of a white square moving to the right on a black background."""
+    frames = []
+    for i in range(num_frames):
+        frame = np.zeros(shape, dtype=np.uint8)
+        x = (i * step) % (shape[1] - 40)
+        cv2.rectangle(frame, (x, 40), (x + 40, 80), 255, -1)
+        frames.append(cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR) if color else frame)
+    return frames
+
+
+def slow_frames(frames, interval):
+    """Yields frames at a fixed rate, like a live camera."""
+    for frame in frames:
+        time.sleep(interval)
+        yield frame
+
+
+class TestMotionService(unittest.TestCase):
+    """Unit tests for the multi-stream motion detection service."""
+
+    def test_processes_every_frame_in_order(self):
+        frames = moving_square_frames(20)
+        expected = MotionDetector()
+        expected_regions = [expected.update(frame) for frame in frames]
+
+        results = {}
+        lock = threading.Lock()
+
+        def on_motion(name, regions):
+            with lock:
+                results.setdefault(name, []).append(regions)
+
+        with MotionService(
+            [frames, frames, moving_square_frames(20, color=True)],
+            workers=2,
+            drop_frames=False,
+            on_motion=on_motion,
+        ) as service:
+            service.run(duration=10)
+            stats = service.stats()
+
+        self.assertEqual(stats["frames_processed"], 60)
+        with_motion = [regions for regions in expected_regions if regions]
+        for name in ["stream0", "stream1", "stream2"]:
+            self.assertEqual(stats["streams"][name]["frames_processed"], 20)
+            self.assertEqual(stats["streams"][name]["errors"], 0)
+            self.assertEqual(results[name], with_motion)
+
+    def test_fair_scheduling_with_one_worker(self):
+        sources = [moving_square_frames(30) for _ in range(3)]
+        with MotionService(sources, workers=1, drop_frames=False) as service:
+            service.run(duration=10)
+            counts = [s.frames_processed for s in service.streams]
+        self.assertEqual(counts, [30, 30, 30])
+
+    def test_fps_cap(self):
+        frames = moving_square_frames(200)
+        with MotionService(
+            [slow_frames(frames, 0.002), slow_frames(frames, 0.002)],
+            workers=2,
+            max_fps=[10, None],
+        ) as service:
+            service.run(duration=0.5)
+            capped, uncapped = service.streams
+        self.assertLessEqual(capped.frames_processed, 6)
+        self.assertGreater(uncapped.frames_processed, capped.frames_processed)
+        self.assertGreater(capped.frames_dropped, 0)
+
+    def test_stop_from_another_thread(self):
+        frames = moving_square_frames(1000)
+        with MotionService([slow_frames(frames, 0.001)]) as service:
+            threading.Timer(0.1, service.stop).start()
+            start = time.perf_counter()
+            service.run()
+            self.assertLess(time.perf_counter() - start, 2.0)
+            self.assertGreater(service.stats()["throughput"], 0)
+            self.assertGreater(service.streams[0].average_latency, 0)
+
+    def test_scheduler_sleeps_while_streams_are_idle(self):
+        frames = moving_square_frames(20)
+        with MotionService([slow_frames(frames, 0.05)]) as service:
+            schedule = service._schedule
+            calls = []
+
+            def counting_schedule(now):
+                calls.append(now)
+                return schedule(now)
+
+            service._schedule = counting_schedule
+            service.run(duration=0.5)
+        # Polling every POLL_INTERVAL gives about 100 rounds, busy-waiting many more
+        self.assertGreater(len(calls), 0)
+        self.assertLess(len(calls), 300)
+
+    def test_worker_errors_are_counted(self):
+        # Two-channel frames cannot be converted to grayscale
+        frames = [np.zeros((10, 10), np.uint8), np.zeros((10, 10, 2), np.uint8)]
+        with MotionService([frames], drop_frames=False) as service:
+            service.run(duration=5)
+            self.assertEqual(service.streams[0].errors, 1)
+            self.assertIn("stream0", service.format_stats())
+
+    def test_per_stream_drop_frames(self):
+        frames = moving_square_frames(50)
+        with MotionService(
+            [slow_frames(frames, 0.001), frames], drop_frames=[True, False]
+        ) as service:
+            self.assertTrue(service.streams[0].capture.drop_frames)
+            self.assertFalse(service.streams[1].capture.drop_frames)
+            service.run(duration=10)
+            self.assertEqual(service.streams[1].frames_processed, 50)
+            self.assertEqual(service.streams[1].frames_dropped, 0)
+
+    def test_is_live_source(self):
+        with tempfile.NamedTemporaryFile(suffix=".mp4") as video:
+            self.assertFalse(is_live_source(video.name))
+        self.assertTrue(is_live_source(0))
+        self.assertTrue(is_live_source("rtsp://camera/stream"))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            MotionService([])
+        with self.assertRaises(ValueError):
+            MotionService([[]], workers=0)
+        with self.assertRaises(ValueError):
+            MotionService([[], []], max_fps=[10])
+        with self.assertRaises(ValueError):
+            MotionService([[], []], drop_frames=[False])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import numpy as np
+from package.motion_tracker import (
+    MotionTracker,
+    greedy_assignment,
+    iou_matrix,
+    overlapping_pairs,
+)
+
+
+def box_iou(a, b):
+    """Scalar reference IoU of two (x, y, w, h) boxes."""
+    w = max(0, min(a[0] + a[2], b[0] + b[2]) - max(a[0], b[0]))
+    h = max(0, min(a[1] + a[3], b[1] + b[3]) - max(a[1], b[1]))
+    union = a[2] * a[3] + b[2] * b[3] - w * h
+    return w * h / union if union else 0.0
+
+
+class TestIoU(unittest.TestCase):
+    """Unit tests for the vectorized IoU helpers."""
+
+    def test_iou_matrix_matches_scalar_iou(self):
+        rng = np.random.default_rng(0)
+        a = rng.integers(0, 100, size=(15, 4)) + [0, 0, 1, 1]
+        b = rng.integers(0, 100, size=(12, 4)) + [0, 0, 1, 1]
+        expected = [[box_iou(p, q) for q in b] for p in a]
+        np.testing.assert_allclose(iou_matrix(a, b), expected)
+
+    def test_overlapping_pairs_matches_matrix(self):
+        rng = np.random.default_rng(1)
+        for _ in range(50):
+            a = rng.integers(0, 300, size=(rng.integers(0, 40), 4)) + [0, 0, 1, 1]
+            b = rng.integers(0, 300, size=(rng.integers(0, 40), 4)) + [0, 0, 1, 1]
+            rows, cols, iou = overlapping_pairs(a, b)
+            sparse = np.zeros((len(a), len(b)))
+            sparse[rows, cols] = iou
+            np.testing.assert_allclose(sparse, iou_matrix(a, b))
+
+    def test_greedy_assignment(self):
+        # Row 1 prefers column 0, but row 0 takes it first with a higher IoU
+        iou = np.array([[0.9, 0.8, 0.0], [0.85, 0.4, 0.0], [0.0, 0.0, 0.2]])
+        rows, cols = greedy_assignment(iou, min_iou=0.3)
+        self.assertEqual(sorted(zip(rows.tolist(), cols.tolist())), [(0, 0), (1, 1)])
+        rows, cols = greedy_assignment(iou, min_iou=0.5)
+        self.assertEqual(list(zip(rows.tolist(), cols.tolist())), [(0, 0)])
+
+
+class TestMotionTracker(unittest.TestCase):
+    """Unit tests for the IoU-based multi-object tracker."""
+
+    def test_ids_persist_across_frames(self):
+        tracker = MotionTracker()
+        first = tracker.update([(0, 0, 20, 20), (100, 100, 30, 30)])
+        second = tracker.update([(102, 101, 30, 30), (3, 0, 20, 20), (300, 0, 5, 5)])
+        self.assertEqual([t.id for t in first], [0, 1])
+        self.assertEqual([t.id for t in second], [1, 0, 2])
+        self.assertEqual(second[0].age, 2)
+        self.assertEqual(second[2].age, 1)
+        self.assertEqual(second[0].velocity, (2.0, 1.0))
+        self.assertEqual(second[1].velocity, (3.0, 0.0))
+
+    def test_missed_tracks_expire(self):
+        tracker = MotionTracker(max_misses=2)
+        (track,) = tracker.update([(0, 0, 20, 20)])
+        tracker.update([])
+        tracker.update([])
+        self.assertEqual(tracker.update([(4, 0, 20, 20)])[0].id, track.id)
+        # Velocity is averaged over the frames the track was missing
+        self.assertEqual(track.velocity, (4 / 3, 0.0))
+        for _ in range(3):
+            tracker.update([])
+        self.assertEqual(tracker.tracks, [])
+        self.assertNotEqual(tracker.update([(4, 0, 20, 20)])[0].id, track.id)
+
+    def test_needs_analysis_until_box_changes(self):
+        tracker = MotionTracker(unchanged_iou=0.9)
+        (track,) = tracker.update([(0, 0, 100, 100)])
+        self.assertTrue(track.needs_analysis)
+        track.mark_analyzed()
+        tracker.update([(1, 0, 100, 100)])
+        self.assertFalse(track.needs_analysis)
+        tracker.update([(20, 0, 100, 100)])
+        self.assertTrue(track.needs_analysis)
+
+    def test_many_moving_boxes(self):
+        rng = np.random.default_rng(2)
+        grid = np.arange(400)
+        origin = np.stack([grid % 20 * 50, grid // 20 * 50], axis=1)
+        velocity = rng.integers(-1, 2, size=(400, 2))
+        tracker = MotionTracker()
+        ids = None
+        for frame in range(10):
+            boxes = [(x, y, 30, 30) for x, y in (origin + frame * velocity).tolist()]
+            frame_ids = [track.id for track in tracker.update(boxes)]
+            ids = ids or frame_ids
+            self.assertEqual(frame_ids, ids)
+        self.assertEqual(len(tracker.tracks), 400)
+
+    def test_reset(self):
+        tracker = MotionTracker()
+        tracker.update([(0, 0, 10, 10)])
+        tracker.reset()
+        self.assertEqual(tracker.tracks, [])
+        self.assertEqual(len(tracker.update([(0, 0, 10, 10)])), 1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            MotionTracker(min_iou=0)
+        with self.assertRaises(ValueError):
+            MotionTracker(unchanged_iou=1.5)
+        with self.assertRaises(ValueError):
+            MotionTracker(max_misses=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
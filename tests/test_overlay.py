@@ -0,0 +1,100 @@
+import unittest
+import cv2
+import numpy as np
+from package.contour_analysis import analyze_contours, draw_contours_and_bboxes
+from package.overlay import OverlayRenderer, draw_boxes
+
+
+def shapes_mask():
+    mask = np.zeros((120, 160), dtype=np.uint8)
+    cv2.rectangle(mask, (10, 10), (50, 60), 255, -1)
+    cv2.circle(mask, (110, 60), 25, 255, -1)
+    return mask
+
+
+class TestDrawBoxes(unittest.TestCase):
+    """Unit tests for the batched box drawing."""
+
+    def test_matches_rectangles(self):
+        boxes = [(5, 5, 30, 20), (40, 10, 1, 50), (60, 70, 80, 30), (0, 0, 0, 0)]
+        expected = np.zeros((100, 150, 3), dtype=np.uint8)
+        for x, y, w, h in boxes:
+            cv2.rectangle(expected, (x, y), (x + w, y + h), (0, 255, 0), 2)
+        actual = draw_boxes(np.zeros_like(expected), boxes)
+        np.testing.assert_array_equal(actual, expected)
+
+    def test_no_boxes(self):
+        self.assertFalse(draw_boxes(np.zeros((10, 10, 3), np.uint8), []).any())
+
+
+class TestOverlayRenderer(unittest.TestCase):
+    """Unit tests for OverlayRenderer."""
+
+    def setUp(self):
+        self.frame = np.zeros((120, 160, 3), dtype=np.uint8)
+        self.contours_info = analyze_contours(shapes_mask())
+
+    def test_contours_match_direct_drawing(self):
+        expected = draw_contours_and_bboxes(self.frame.copy(), self.contours_info)
+        for output_format in ["dicts", "columnar", "lazy"]:
+            renderer = OverlayRenderer()
+            renderer.add_contours(
+                analyze_contours(shapes_mask(), output_format=output_format)
+            )
+            actual = renderer.render(self.frame.copy())
+            np.testing.assert_array_equal(actual, expected)
+
+    def test_every_nth_frame(self):
+        renderer = OverlayRenderer(every=3)
+        drawn = []
+        for _ in range(7):
+            renderer.add_boxes([(10, 10, 20, 20)])
+            drawn.append(bool(renderer.render(self.frame.copy()).any()))
+        self.assertEqual(drawn, [True, False, False, True, False, False, True])
+        self.assertEqual((renderer.frames_rendered, renderer.frames_skipped), (3, 4))
+
+    def test_disabled(self):
+        renderer = OverlayRenderer(enabled=False)
+        renderer.add_contours(self.contours_info)
+        renderer.add_landmarks(np.full((3, 4), 0.5), [(0, 1)])
+        self.assertIs(renderer.render(self.frame), self.frame)
+        self.assertFalse(self.frame.any())
+        self.assertEqual(renderer.frames_skipped, 1)
+
+    def test_queue_is_cleared(self):
+        renderer = OverlayRenderer()
+        renderer.add_boxes([(10, 10, 20, 20)])
+        renderer.render(self.frame.copy())
+        self.assertFalse(renderer.render(self.frame.copy()).any())
+
+    def test_reusable_canvas(self):
+        renderer = OverlayRenderer()
+        renderer.add_boxes([(10, 10, 20, 20)])
+        first = renderer.render(self.frame, copy=True)
+        self.assertFalse(self.frame.any())  # The input frame is left clean
+        self.assertTrue(first.any())
+        second = renderer.render(self.frame, copy=True)
+        self.assertIs(first, second)
+        self.assertFalse(second.any())
+
+    def test_landmarks(self):
+        # Normalized x, y, z, visibility; the last landmark is not visible
+        landmarks = np.array(
+            [[0.25, 0.25, 0, 1], [0.75, 0.25, 0, 1], [0.5, 0.75, 0, 0.1]],
+            dtype=np.float32,
+        )
+        renderer = OverlayRenderer()
+        renderer.add_landmarks(landmarks, [(0, 1), (1, 2)])
+        frame = renderer.render(np.zeros((100, 100, 3), dtype=np.uint8))
+        self.assertTrue(frame[25, 25].any() and frame[25, 75].any())
+        self.assertTrue(frame[25, 50].any())  # Connection 0-1
+        self.assertFalse(frame[75, 50].any())
+        self.assertFalse(frame[50, 62].any())  # Connection 1-2 is hidden
+
+    def test_invalid_every(self):
+        with self.assertRaises(ValueError):
+            OverlayRenderer(every=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
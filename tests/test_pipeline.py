@@ -1,3 +1,5 @@
+import threading
+import time
 import unittest
 import numpy as np
 from package.pipeline import DataSource, Processor, OutputStage, Pipeline
@@ -51,5 +53,126 @@ class TestPipeline(unittest.TestCase):
             self.assertEqual(entry["shape"], (30, 30))
 
 
+class IndexedSource(DataSource):
+    """Source whose frames carry their index in the first pixel."""
+
+    def __init__(self, num_frames, delay=0.0):
+        super().__init__(num_frames, frame_size=(8, 8))
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.max_in_flight = 0
+        self.output_stage = None
+
+    def get_frame(self):
+        time.sleep(self.delay)
+        frame = super().get_frame()
+        if frame is not None:
+            frame[0, 0, 0] = self.frames_generated - 1
+            with self.lock:
+                in_flight = self.frames_generated - len(self.output_stage.indices)
+                self.max_in_flight = max(self.max_in_flight, in_flight)
+        return frame
+
+
+class SlowProcessor(Processor):
+    """Processor that sleeps, for a varying time if jitter is set."""
+
+    def __init__(self, delay=0.0, jitter=False, fail_at=None):
+        super().__init__()
+        self.delay = delay
+        self.jitter = jitter
+        self.fail_at = fail_at
+
+    def process(self, frame):
+        index = int(frame[0, 0, 0])
+        if index == self.fail_at:
+            raise RuntimeError(f"Cannot process frame {index}")
+        time.sleep(self.delay * (1 + index % 3 if self.jitter else 1))
+        return frame
+
+
+class IndexOutput(OutputStage):
+    """Output stage that records the frame indices."""
+
+    def __init__(self, delay=0.0):
+        super().__init__()
+        self.delay = delay
+        self.indices = []
+
+    def output(self, processed_frame):
+        time.sleep(self.delay)
+        self.indices.append(int(processed_frame[0, 0, 0]))
+
+
+class TestConcurrentPipeline(unittest.TestCase):
+    def run_pipeline(self, source, processor, output, **kwargs):
+        source.output_stage = output
+        Pipeline(source, processor, output).run_concurrent(**kwargs)
+
+    def test_matches_sequential_run(self):
+        expected, actual = OutputStage(), OutputStage()
+        Pipeline(DataSource(num_frames=20), Processor(), expected).run()
+        Pipeline(DataSource(num_frames=20), Processor(), actual).run_concurrent()
+        self.assertEqual(actual.logged, expected.logged)
+
+    def test_preserves_order_with_several_workers(self):
+        output = IndexOutput()
+        self.run_pipeline(
+            IndexedSource(30),
+            SlowProcessor(0.002, jitter=True),
+            output,
+            workers=3,
+        )
+        self.assertEqual(output.indices, list(range(30)))
+
+    def test_unordered_output(self):
+        output = IndexOutput()
+        self.run_pipeline(
+            IndexedSource(30),
+            SlowProcessor(0.002, jitter=True),
+            output,
+            workers=3,
+            preserve_order=False,
+        )
+        self.assertEqual(sorted(output.indices), list(range(30)))
+
+    def test_backpressure(self):
+        source, output = IndexedSource(20), IndexOutput(delay=0.005)
+        self.run_pipeline(source, SlowProcessor(), output, queue_size=3)
+        self.assertEqual(output.indices, list(range(20)))
+        self.assertLessEqual(source.max_in_flight, 3)
+
+    def test_throughput_is_limited_by_slowest_stage(self):
+        delay, num_frames = 0.01, 20
+        output = IndexOutput(delay)
+        start = time.perf_counter()
+        self.run_pipeline(
+            IndexedSource(num_frames, delay), SlowProcessor(delay), output
+        )
+        elapsed = time.perf_counter() - start
+        # Sequentially this takes 3 * num_frames * delay
+        self.assertLess(elapsed, 2 * num_frames * delay)
+        self.assertEqual(len(output.indices), num_frames)
+
+    def test_exception_is_propagated(self):
+        output = IndexOutput()
+        with self.assertRaises(RuntimeError):
+            self.run_pipeline(
+                IndexedSource(50), SlowProcessor(fail_at=10), output, workers=2
+            )
+        self.assertLess(len(output.indices), 50)
+        # No stage thread is left running
+        self.assertFalse(
+            [t for t in threading.enumerate() if t.name.startswith("pipeline-")]
+        )
+
+    def test_invalid_arguments(self):
+        pipeline = Pipeline(DataSource(), Processor(), OutputStage())
+        with self.assertRaises(ValueError):
+            pipeline.run_concurrent(queue_size=0)
+        with self.assertRaises(ValueError):
+            pipeline.run_concurrent(workers=0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from package.pose_angle_calculator import calculate_angle
+import numpy as np
+from package.pose_angle_calculator import calculate_angle, calculate_angles
 
 
 class TestPoseAngleCalculator(unittest.TestCase):
@@ -32,5 +33,37 @@ class TestPoseAngleCalculator(unittest.TestCase):
         self.assertAlmostEqual(angle, 2.58, places=2)
 
 
+class TestBatchedPoseAngles(unittest.TestCase):
+    def test_matches_dict_version(self):
+        """Each batched angle equals calculate_angle on the same keypoints."""
+        triplets = np.random.default_rng(0).uniform(0, 100, size=(200, 3, 2))
+        angles = calculate_angles(triplets)
+        self.assertEqual(angles.shape, (200,))
+        for triplet, angle in zip(triplets, angles):
+            keypoints = dict(zip(("shoulder", "elbow", "wrist"), map(tuple, triplet)))
+            self.assertAlmostEqual(angle, calculate_angle(keypoints), places=9)
+
+    def test_edge_cases(self):
+        """Zero-length vectors give 0.0; collinear points stay within the clamp."""
+        triplets = np.array(
+            [
+                [[1.0, 1.0], [1.0, 1.0], [5.0, 2.0]],  # Shoulder on the elbow
+                [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]],  # Straight arm
+                [[0.1, 0.1], [0.3, 0.3], [0.1, 0.1]],  # Fully folded arm
+            ]
+        )
+        np.testing.assert_allclose(
+            calculate_angles(triplets), [0.0, 180.0, 0.0], atol=1e-5
+        )
+
+    def test_three_dimensional_keypoints(self):
+        triplets = np.array([[[1.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 1.0]]])
+        np.testing.assert_allclose(calculate_angles(triplets), [90.0])
+
+    def test_invalid_shape_raises(self):
+        with self.assertRaises(ValueError):
+            calculate_angles(np.zeros((4, 2, 2)))
+
+
 if __name__ == "__main__":
     unittest.main()
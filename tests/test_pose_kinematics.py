@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+from package.joint_angles import JointAngleEngine
+from package.pose_kinematics import AngleKinematics
+
+
+class TestAngleKinematics(unittest.TestCase):
+    def test_constant_angular_velocity(self):
+        """A linear ramp has constant velocity and zero acceleration."""
+        kinematics = AngleKinematics(num_joints=2, window_size=4, fps=60.0)
+        for i in range(20):
+            angles = np.array([10.0 + 0.5 * i, 90.0])  # 0.5 deg/frame, static
+            smoothed, velocity, acceleration = kinematics.update(angles)
+
+        np.testing.assert_allclose(smoothed, [10.0 + 0.5 * 19 - 0.75, 90.0])
+        np.testing.assert_allclose(velocity, [30.0, 0.0], atol=1e-9)
+        np.testing.assert_allclose(acceleration, [0.0, 0.0], atol=1e-6)
+
+    def test_timestamps_set_time_step(self):
+        kinematics = AngleKinematics(num_joints=1, window_size=1)
+        kinematics.update(np.array([0.0]), timestamp=1.0)
+        _, velocity, _ = kinematics.update(np.array([5.0]), timestamp=1.5)
+        np.testing.assert_allclose(velocity, [10.0])
+
+    def test_non_increasing_timestamps_raise(self):
+        kinematics = AngleKinematics(num_joints=1, window_size=1)
+        kinematics.update(np.array([0.0]), timestamp=1.0)
+        for timestamp in [1.0, 0.5]:
+            with self.assertRaises(ValueError):
+                kinematics.update(np.array([5.0]), timestamp=timestamp)
+        # The rejected frames left no trace
+        _, velocity, _ = kinematics.update(np.array([5.0]), timestamp=1.5)
+        np.testing.assert_allclose(velocity, [10.0])
+
+    def test_hidden_joints(self):
+        """NaN angles are skipped by the average; joints never seen stay NaN."""
+        kinematics = AngleKinematics(num_joints=2, window_size=3)
+        kinematics.update(np.array([10.0, np.nan]))
+        smoothed, _, _ = kinematics.update(np.array([np.nan, np.nan]))
+        self.assertEqual(smoothed[0], 10.0)
+        self.assertTrue(np.isnan(smoothed[1]))
+
+    def test_outputs_are_reused(self):
+        engine = JointAngleEngine()
+        kinematics = AngleKinematics(num_joints=len(engine.joint_names))
+        landmarks = np.random.default_rng(0).uniform(0, 1, size=(3, 33, 2))
+        first = kinematics.update(engine.compute(landmarks[0]))
+        for frame in landmarks[1:]:
+            result = kinematics.update(engine.compute(frame))
+        for before, after in zip(first, result):
+            self.assertIs(before.base, after.base)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+import threading
+import unittest
+import cv2
+import numpy as np
+from package.contour_analysis import analyze_contours
+from package.motion_detector import detect_motion
+from package.pipeline import DataSource, OutputStage, Pipeline, Processor
+from package.result_cache import CachedProcessor, ResultCache, frame_key
+
+
+def shapes_frame(offset=0):
+    frame = np.zeros((120, 160), dtype=np.uint8)
+    cv2.rectangle(frame, (20 + offset, 20), (70 + offset, 80), 255, -1)
+    cv2.circle(frame, (120, 60), 20, 255, -1)
+    return frame
+
+
+class CountingProcessor(Processor):
+    """Processor that counts how often it actually processes a frame."""
+
+    def __init__(self, method="edges"):
+        super().__init__(method)
+        self.calls = 0
+
+    def process(self, frame):
+        self.calls += 1
+        return super().process(frame)
+
+
+class TestFrameKey(unittest.TestCase):
+    """Unit tests for the frame content hash."""
+
+    def test_exact_mode(self):
+        frame = shapes_frame()
+        self.assertEqual(frame_key(frame), frame_key(frame.copy()))
+        self.assertNotEqual(frame_key(frame), frame_key(shapes_frame(offset=1)))
+        # Same bytes with another shape must not collide
+        self.assertNotEqual(frame_key(frame), frame_key(frame.reshape(160, 120)))
+
+    def test_perceptual_mode_ignores_noise(self):
+        frame = shapes_frame()
+        noisy = frame.copy()
+        noisy[::17, ::13] ^= 1  # Flip the lowest bit of a few pixels
+        self.assertNotEqual(frame_key(frame), frame_key(noisy))
+        self.assertEqual(frame_key(frame, "perceptual"), frame_key(noisy, "perceptual"))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            frame_key(shapes_frame(), "md5")
+
+
+class TestResultCache(unittest.TestCase):
+    """Unit tests for the LRU result cache."""
+
+    def test_wrap_analyze_contours(self):
+        cache = ResultCache()
+        cached_analyze = cache.wrap(analyze_contours)
+        frame = shapes_frame()
+        first = cached_analyze(frame, area_threshold=100)
+        second = cached_analyze(frame.copy(), area_threshold=100)
+        self.assertIs(first, second)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # Other parameters are other entries
+        cached_analyze(frame, area_threshold=5000)
+        cached_analyze(frame, 100, "components")
+        self.assertEqual(cache.misses, 3)
+        self.assertEqual(
+            [c["bbox"] for c in first],
+            [c["bbox"] for c in analyze_contours(frame, 100)],
+        )
+
+    def test_wrap_detect_motion(self):
+        # Both frames are arrays and are hashed by content
+        cache = ResultCache()
+        cached_detect = cache.wrap(detect_motion)
+        prev, current, moved = shapes_frame(), shapes_frame(5), shapes_frame(10)
+        first = cached_detect(prev, current)
+        self.assertEqual(first, detect_motion(prev, current))
+        self.assertIs(cached_detect(prev.copy(), current.copy()), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # Another second frame, or another keyword, is another entry
+        cached_detect(prev, moved)
+        cached_detect(prev, current_frame=moved)
+        cached_detect(prev, current, min_area=10)
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+        cached_detect(prev, current_frame=moved.copy())
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_cached_arrays_are_read_only(self):
+        cached_analyze = ResultCache().wrap(analyze_contours)
+        result = cached_analyze(shapes_frame())
+        with self.assertRaises(ValueError):
+            result[0]["approx"][0, 0, 0] = 1
+
+    def test_miss_result_is_read_only(self):
+        # The miss returns the cached object itself, so in-place drawing fails
+        # right away instead of only once the cache starts hitting
+        cache = ResultCache()
+        frame = cv2.cvtColor(shapes_frame(), cv2.COLOR_GRAY2BGR)
+        result = cache.get_or_compute("frame", lambda: frame)
+        self.assertIs(result, frame)
+        with self.assertRaises(cv2.error):
+            cv2.rectangle(result, (0, 0), (10, 10), (0, 255, 0), 2)
+        cv2.rectangle(result.copy(), (0, 0), (10, 10), (0, 255, 0), 2)
+
+    def test_lazy_records_are_counted_and_frozen(self):
+        cache = ResultCache()
+        cached_analyze = cache.wrap(analyze_contours)
+        records = cached_analyze(shapes_frame(), output_format="lazy")
+        self.assertEqual(cache.current_bytes, sum(r.contour.nbytes for r in records))
+        self.assertGreater(cache.current_bytes, 0)
+        with self.assertRaises(ValueError):
+            records[0].contour[0, 0, 0] = 1
+
+    def test_lru_eviction(self):
+        cache = ResultCache(max_entries=2)
+        for key in ["a", "b", "a", "c"]:
+            cache.get_or_compute(key, lambda: key.upper())
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(len(cache), 2)
+        # "b" was the least recently used entry
+        cache.get_or_compute("a", lambda: None)
+        cache.get_or_compute("b", lambda: "recomputed")
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_byte_limit(self):
+        cache = ResultCache(max_entries=100, max_bytes=2500)
+        for i in range(5):
+            cache.get_or_compute(i, lambda: np.zeros(1000, dtype=np.uint8))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.current_bytes, 2000)
+        self.assertEqual(cache.evictions, 3)
+        cache.clear()
+        self.assertEqual((len(cache), cache.current_bytes), (0, 0))
+
+    def test_thread_safety(self):
+        cache = ResultCache(max_entries=8)
+        frames = [shapes_frame(offset=i) for i in range(16)]
+        cached_analyze = cache.wrap(analyze_contours)
+
+        def worker():
+            for frame in frames * 3:
+                cached_analyze(frame)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(cache.hits + cache.misses, 4 * 48)
+        self.assertLessEqual(len(cache), 8)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ResultCache(max_entries=0)
+        with self.assertRaises(ValueError):
+            ResultCache(mode="sha1")
+
+
+class TestCachedProcessor(unittest.TestCase):
+    """Unit tests for the memoizing pipeline processor."""
+
+    def test_repeated_frames_are_processed_once(self):
+        processor = CountingProcessor()
+        cached = CachedProcessor(processor)
+        output = OutputStage()
+        # DataSource frames repeat every 20 frames (the circle wraps around)
+        Pipeline(DataSource(num_frames=60, frame_size=(40, 100)), cached, output).run()
+        self.assertEqual(len(output.logged), 60)
+        self.assertEqual(processor.calls, 20)
+        self.assertEqual(cached.cache.hits, 40)
+
+    def test_results_match_processor(self):
+        frame = DataSource(num_frames=1).get_frame()
+        for method in ["edges", "blur", "invert"]:
+            cached = CachedProcessor(Processor(method))
+            np.testing.assert_array_equal(
+                cached.process(frame), Processor(method).process(frame)
+            )
+
+    def test_shared_cache_separates_methods(self):
+        cache = ResultCache()
+        frame = DataSource(num_frames=1).get_frame()
+        edges = CachedProcessor(Processor("edges"), cache).process(frame)
+        blur = CachedProcessor(Processor("blur"), cache).process(frame)
+        self.assertFalse(np.array_equal(edges, blur))
+        self.assertEqual(cache.misses, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
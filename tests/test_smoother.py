@@ -1,5 +1,16 @@
+import math
+import random
+import statistics
 import unittest
-from package.smoother import RealTimeSmoother
+import numpy as np
+from package.smoother import (
+    ExponentialSmoother,
+    MovingAverageReplay,
+    MovingMedianSmoother,
+    MultiChannelSmoother,
+    RealTimeSmoother,
+    replay_moving_average,
+)
 
 
 class TestRealTimeSmoother(unittest.TestCase):
@@ -21,6 +32,181 @@ class TestRealTimeSmoother(unittest.TestCase):
         avg = smoother.get_average()
         self.assertAlmostEqual(avg, 11.6666666667, delta=0.01)
 
+    def test_running_sum_matches_deque_sum(self):
+        """Running-sum mode agrees with the deque+sum path, including evictions."""
+        rng = random.Random(42)
+        plain = RealTimeSmoother(window_size=7)
+        running = RealTimeSmoother(window_size=7, running_sum=True)
+        self.assertEqual(running.get_average(), 0.0)
+
+        for _ in range(100):
+            value = rng.uniform(-50.0, 50.0)
+            plain.update(value)
+            running.update(value)
+            self.assertAlmostEqual(running.get_average(), plain.get_average(), places=9)
+
+    def test_zero_window(self):
+        """A zero-size window averages to 0.0 in both modes."""
+        for running_sum in (False, True):
+            smoother = RealTimeSmoother(window_size=0, running_sum=running_sum)
+            smoother.update(5.0)
+            smoother.update(7.0)
+            self.assertEqual(smoother.get_average(), 0.0)
+
+    def test_running_sum_drift_is_bounded(self):
+        """Large spikes passing through the window do not leave residual error."""
+        smoother = RealTimeSmoother(window_size=10, running_sum=True)
+        rng = random.Random(7)
+        for i in range(20000):
+            # Occasional huge outliers are the worst case for naive running sums
+            value = 1e15 if i % 997 == 0 else rng.uniform(0.0, 1.0)
+            smoother.update(value)
+
+        expected = math.fsum(smoother.values) / len(smoother.values)
+        self.assertAlmostEqual(smoother.get_average(), expected, places=12)
+
+
+class TestMultiChannelSmoother(unittest.TestCase):
+    """Unit tests for the MultiChannelSmoother class."""
+
+    def test_empty_channels_return_zero(self):
+        """Channels without data average to 0.0, as in RealTimeSmoother."""
+        smoother = MultiChannelSmoother(num_channels=3, window_size=4)
+        np.testing.assert_array_equal(smoother.get_averages(), np.zeros(3))
+
+        smoother.update_many([1.0, 2.0, 3.0], mask=np.array([True, False, True]))
+        np.testing.assert_allclose(smoother.get_averages(), [1.0, 0.0, 3.0])
+
+    def test_matches_per_channel_smoothers(self):
+        """Vectorized updates with partial fills match one RealTimeSmoother per channel."""
+        rng = np.random.default_rng(0)
+        num_channels, window_size = 16, 5
+        multi = MultiChannelSmoother(num_channels, window_size)
+        singles = [RealTimeSmoother(window_size) for _ in range(num_channels)]
+
+        for _ in range(50):
+            readings = rng.normal(size=num_channels)
+            mask = rng.random(num_channels) < 0.7
+            multi.update_many(readings, mask=mask)
+            for channel in np.flatnonzero(mask):
+                singles[channel].update(readings[channel])
+
+        expected = [s.get_average() for s in singles]
+        np.testing.assert_allclose(multi.get_averages(), expected, atol=1e-12)
+
+    def test_zero_window(self):
+        """A zero-size window averages to 0.0, like RealTimeSmoother."""
+        smoother = MultiChannelSmoother(num_channels=3, window_size=0)
+        smoother.update_many([1.0, 2.0, 3.0])
+        smoother.update_many([4.0, 5.0, 6.0], mask=np.array([True, False, True]))
+        np.testing.assert_array_equal(smoother.get_averages(), np.zeros(3))
+
+    def test_wrong_shape_raises(self):
+        smoother = MultiChannelSmoother(num_channels=3)
+        with self.assertRaises(ValueError):
+            smoother.update_many([1.0, 2.0])
+
+
+class TestMovingAverageReplay(unittest.TestCase):
+    """Unit tests for bulk replay of the moving average."""
+
+    def setUp(self):
+        self.values = np.random.default_rng(3).normal(10.0, 2.0, size=500)
+
+    def live_averages(self, values, window_size):
+        smoother = RealTimeSmoother(window_size)
+        averages = []
+        for value in values:
+            smoother.update(float(value))
+            averages.append(smoother.get_average())
+        return averages
+
+    def test_matches_live_smoother(self):
+        averages = replay_moving_average(self.values, window_size=8)
+        np.testing.assert_allclose(averages, self.live_averages(self.values, 8))
+
+    def test_zero_window(self):
+        """A zero-size window replays to 0.0, like RealTimeSmoother."""
+        replay = MovingAverageReplay(window_size=0)
+        averages = replay.process(self.values[:10])
+        np.testing.assert_array_equal(averages, self.live_averages(self.values[:10], 0))
+        self.assertEqual(replay.samples_seen, 10)
+        self.assertEqual(replay.to_smoother().get_average(), 0.0)
+
+    def test_chunked_replay_carries_state(self):
+        """Uneven chunks (including ones shorter than the window) give the same result."""
+        replay = MovingAverageReplay(window_size=8)
+        bounds = [0, 3, 4, 50, 51, 300, 500]
+        chunks = [replay.process(self.values[a:b]) for a, b in zip(bounds, bounds[1:])]
+        np.testing.assert_allclose(
+            np.concatenate(chunks), self.live_averages(self.values, 8)
+        )
+        self.assertEqual(replay.samples_seen, 500)
+
+    def test_seed_live_smoother(self):
+        """A smoother seeded from the replay continues exactly like the live one."""
+        replay = MovingAverageReplay(window_size=8)
+        replay.process(self.values[:400])
+        seeded = replay.to_smoother()
+        live = RealTimeSmoother(window_size=8)
+        for value in self.values[:400]:
+            live.update(float(value))
+        for value in self.values[400:]:
+            seeded.update(float(value))
+            live.update(float(value))
+            self.assertAlmostEqual(seeded.get_average(), live.get_average(), places=9)
+
+
+class TestMovingMedianSmoother(unittest.TestCase):
+    """Unit tests for the MovingMedianSmoother class."""
+
+    def test_empty_returns_zero(self):
+        self.assertEqual(MovingMedianSmoother(window_size=3).get_average(), 0.0)
+
+    def test_zero_window(self):
+        """A zero-size window medians to 0.0, like RealTimeSmoother."""
+        smoother = MovingMedianSmoother(window_size=0)
+        smoother.update(5.0)
+        smoother.update(7.0)
+        self.assertEqual(smoother.get_median(), 0.0)
+
+    def test_rejects_outlier_spike(self):
+        smoother = MovingMedianSmoother(window_size=5)
+        for value in [10.0, 11.0, 1000.0, 10.5, 11.5]:
+            smoother.update(value)
+        self.assertEqual(smoother.get_median(), 11.0)
+
+    def test_matches_sorted_window_median(self):
+        """Heap-based median equals statistics.median of the window, with duplicates."""
+        rng = random.Random(1)
+        for window_size in (1, 2, 5, 8):
+            smoother = MovingMedianSmoother(window_size)
+            history = []
+            for i in range(500):
+                # Small integer range forces duplicates; i-based values form trends
+                value = float(rng.randint(0, 5)) if i % 4 else float(i)
+                smoother.update(value)
+                history.append(value)
+                self.assertEqual(
+                    smoother.get_median(), statistics.median(history[-window_size:])
+                )
+
+
+class TestExponentialSmoother(unittest.TestCase):
+    """Unit tests for the ExponentialSmoother class."""
+
+    def test_average(self):
+        smoother = ExponentialSmoother(alpha=0.5)
+        self.assertEqual(smoother.get_average(), 0.0)
+        smoother.update(10.0)
+        self.assertEqual(smoother.get_average(), 10.0)
+        smoother.update(20.0)
+        self.assertEqual(smoother.get_average(), 15.0)
+
+    def test_invalid_alpha_raises(self):
+        with self.assertRaises(ValueError):
+            ExponentialSmoother(alpha=0.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import cv2
+import numpy as np
+from package.motion_detector import detect_motion
+from package.tiled_motion_detector import TiledMotionDetector
+
+
+def ring_frames(rng, shape=(240, 320), num_shapes=10):
+    """Creates a frame pair with filled discs, rings and discs nested inside rings."""
+    prev_frame = np.zeros(shape, dtype=np.uint8)
+    current_frame = prev_frame.copy()
+    for _ in range(num_shapes):
+        center = (int(rng.integers(0, shape[1])), int(rng.integers(0, shape[0])))
+        radius = int(rng.integers(3, 80))
+        thickness = -1 if rng.random() < 0.5 else int(rng.integers(1, 6))
+        cv2.circle(current_frame, center, radius, 255, thickness)
+        if thickness > 0 and radius > 20:
+            cv2.circle(current_frame, center, radius // 3, 255, -1)
+    current_frame[rng.random(shape) < 0.005] = 255
+    return prev_frame, current_frame
+
+
+class TestTiledMotionDetector(unittest.TestCase):
+    """Unit tests for the tiled, thread-pooled motion detector."""
+
+    def assertSameRegions(self, detector, prev_frame, current_frame):
+        self.assertEqual(
+            sorted(detector.detect(prev_frame, current_frame)),
+            sorted(
+                detect_motion(
+                    prev_frame,
+                    current_frame,
+                    detector.threshold,
+                    detector.min_area,
+                )
+            ),
+        )
+
+    def test_matches_detect_motion(self):
+        rng = np.random.default_rng(0)
+        for tiles in [(1, 1), (2, 2), (3, 5), (4, 4)]:
+            with TiledMotionDetector(tiles=tiles, workers=2) as detector:
+                for _ in range(10):
+                    self.assertSameRegions(detector, *ring_frames(rng))
+
+    def test_blob_crossing_tile_corner(self):
+        prev_frame = np.zeros((100, 100), dtype=np.uint8)
+        current_frame = prev_frame.copy()
+        cv2.rectangle(current_frame, (30, 30), (70, 70), 255, -1)
+        with TiledMotionDetector(tiles=(2, 2)) as detector:
+            self.assertEqual(
+                detector.detect(prev_frame, current_frame), [(28, 28, 45, 45)]
+            )
+
+    def test_blob_nested_in_crossing_ring(self):
+        # The small disc lies inside one tile, but in the hole of a ring that
+        # spans all four tiles, so the untiled detector does not report it
+        prev_frame = np.zeros((200, 200), dtype=np.uint8)
+        current_frame = prev_frame.copy()
+        cv2.circle(current_frame, (100, 100), 80, 255, 3)
+        cv2.circle(current_frame, (60, 60), 10, 255, -1)
+        with TiledMotionDetector(tiles=(2, 2)) as detector:
+            self.assertEqual(len(detector.detect(prev_frame, current_frame)), 1)
+            self.assertSameRegions(detector, prev_frame, current_frame)
+
+    def test_frame_size_change(self):
+        rng = np.random.default_rng(1)
+        with TiledMotionDetector(tiles=(3, 3)) as detector:
+            for shape in [(120, 160), (240, 320), (120, 160)]:
+                self.assertSameRegions(detector, *ring_frames(rng, shape))
+
+    def test_invalid_tiles(self):
+        with self.assertRaises(ValueError):
+            TiledMotionDetector(tiles=(0, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()